@@ -0,0 +1,189 @@
+import json
+import os
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
+PAGE_PARAMS = ("page", "pageNo", "pageNumber", "offset")
+SIZE_PARAMS = ("size", "pageSize", "limit", "perPage")
+TOTAL_KEYS = ("totalElements", "totalCount", "total", "count")
+# 재전송하면 안 되는 요청 헤더 (httpx가 직접 채우는 값)
+SKIPPED_HEADERS = {"host", "content-length", "accept-encoding", "connection", "cookie"}
+# 세션의 네트워크 이벤트(성능 로그) 기록 여부. 드라이버를 띄울 때 정해지므로 작업마다 바꿀 수 없다.
+NETWORK_CAPTURE = os.getenv(
+    "LMS_API_CAPTURE", "true" if os.getenv("CRAWL_MODE", "selenium") == "api" else "false"
+).lower() == "true"
+
+
+def _env_keys(name, default):
+    return [key.strip() for key in os.getenv(name, default).split(",") if key.strip()]
+
+
+def _dig(obj, dotted_key):
+    for part in dotted_key.split("."):
+        if isinstance(obj, list) and part.isdigit() and int(part) < len(obj):
+            obj = obj[int(part)]
+        elif isinstance(obj, dict) and part in obj:
+            obj = obj[part]
+        else:
+            return None
+    return obj
+
+
+def _first_value(record, keys):
+    for key in keys:
+        value = _dig(record, key)
+        if value not in (None, ""):
+            return value
+    return None
+
+
+def find_records(payload):
+    """응답 JSON에서 제출 목록으로 보이는 첫 번째 dict 리스트를 찾는다."""
+    if isinstance(payload, list):
+        return payload if payload and all(isinstance(item, dict) for item in payload) else []
+    if isinstance(payload, dict):
+        for value in payload.values():
+            records = find_records(value)
+            if records:
+                return records
+    return []
+
+
+def find_total(payload):
+    if isinstance(payload, dict):
+        for key in TOTAL_KEYS:
+            if isinstance(payload.get(key), int):
+                return payload[key]
+        for value in payload.values():
+            total = find_total(value)
+            if total is not None:
+                return total
+    return None
+
+
+def api_mode_available():
+    """api 모드로 제출 목록 API를 찾을 수 있는지: 주소 템플릿이 있거나 세션이 네트워크 이벤트를 기록해야 한다."""
+    return NETWORK_CAPTURE or bool(os.getenv("LMS_API_SUBMISSIONS_URL"))
+
+
+def discover_submissions_request(driver, exam_id):
+    """성능 로그(CDP Network 이벤트)에서 상세 페이지가 호출한 제출 목록 API 요청을 찾는다.
+
+    드라이버가 `goog:loggingPrefs={"performance": "ALL"}` 로 생성되어 있어야 한다.
+    반환값은 (url, headers) 이며, 찾지 못하면 None.
+    """
+    requests = {}
+    candidates = []
+    for entry in driver.get_log("performance"):
+        message = json.loads(entry["message"])["message"]
+        params = message.get("params", {})
+        if message.get("method") == "Network.requestWillBeSent":
+            request = params.get("request", {})
+            if request.get("method") == "GET":
+                requests[params["requestId"]] = request
+        elif message.get("method") == "Network.responseReceived":
+            response = params.get("response", {})
+            if response.get("status") == 200 and "json" in response.get("mimeType", ""):
+                if str(exam_id) in response.get("url", "") and params["requestId"] in requests:
+                    candidates.append(params["requestId"])
+
+    # 제출/답안 관련 URL을 우선 확인
+    candidates.sort(key=lambda rid: 0 if any(k in requests[rid]["url"] for k in ("submi", "answer")) else 1)
+    for request_id in candidates:
+        try:
+            body = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+            if find_records(json.loads(body.get("body", ""))):
+                request = requests[request_id]
+                headers = {k: v for k, v in request.get("headers", {}).items() if k.lower() not in SKIPPED_HEADERS}
+                return request["url"], headers
+        except Exception:
+            continue
+    return None
+
+
+class ApiExtractor:
+    """로그인된 세션의 쿠키로 관리자 SPA의 제출 목록 API를 직접 호출해 페이지 단위로 가져온다."""
+
+    def __init__(self, url, cookies=None, headers=None, page_size=None, timeout=20.0, fields=None):
+        self.url = url
+        self.cookies = cookies or {}
+        self.headers = headers or {}
+        self.page_size = page_size or int(os.getenv("LMS_API_PAGE_SIZE", "100"))
+        self.timeout = timeout
+        # [(열 이름, 키 경로 목록)] — 추출 스키마에 api_keys가 없으면 이름/답안 두 열을 기본으로 읽는다.
+        self.fields = fields or [
+            ("수강자 이름", _env_keys("LMS_API_NAME_KEYS", "userName,name,user.name,studentName,memberName")),
+            ("블로그 링크", _env_keys("LMS_API_ANSWER_KEYS", "answers.1.content,answers.1.answer,answer,content")),
+        ]
+
+    @classmethod
+    def from_driver(cls, driver, exam_id, fields=None):
+        cookies = {cookie["name"]: cookie["value"] for cookie in driver.get_cookies()}
+        template = os.getenv("LMS_API_SUBMISSIONS_URL")
+        if template:
+            return cls(template.format(exam_id=exam_id), cookies=cookies, fields=fields)
+        discovered = discover_submissions_request(driver, exam_id)
+        if not discovered:
+            return None
+        url, headers = discovered
+        return cls(url, cookies=cookies, headers=headers, fields=fields)
+
+    def _page_url(self, page_index, page_size):
+        parts = urlsplit(self.url)
+        query = dict(parse_qsl(parts.query))
+        page_param = next((p for p in PAGE_PARAMS if p in query), None)
+        size_param = next((p for p in SIZE_PARAMS if p in query), None)
+        if size_param:
+            query[size_param] = str(self.page_size)
+        if page_param is None or (page_param == "offset" and not page_size):
+            # 페이지 파라미터가 없으면 한 번의 응답이 전체 목록이다.
+            return None if page_index else urlunsplit(parts._replace(query=urlencode(query)))
+        if page_param == "offset":
+            query[page_param] = str(page_index * page_size)
+        else:
+            # 첫 페이지 번호(0 또는 1)는 캡처한 원래 요청을 기준으로 삼는다.
+            first_page = 1 if query[page_param] == "1" else 0
+            query[page_param] = str(first_page + page_index)
+        return urlunsplit(parts._replace(query=urlencode(query)))
+
+    def _requested_page_size(self):
+        query = dict(parse_qsl(urlsplit(self.url).query))
+        return self.page_size if any(p in query for p in SIZE_PARAMS) else None
+
+    def to_item(self, record):
+        item = {}
+        for column, keys in self.fields:
+            value = _first_value(record, keys)
+            item[column] = str(value).strip() if value is not None else ""
+        return item
+
+    async def fetch_all(self, on_page=None):
+        # api 모드에서만 쓰이므로 필요할 때 불러온다.
+        import httpx
+
+        items = []
+        async with httpx.AsyncClient(
+            cookies=self.cookies, headers=self.headers, timeout=self.timeout, follow_redirects=True
+        ) as client:
+            page_index = 0
+            page_size = self._requested_page_size()
+            total = None
+            while True:
+                url = self._page_url(page_index, page_size)
+                if url is None:
+                    break
+                response = await client.get(url)
+                response.raise_for_status()
+                payload = response.json()
+                records = find_records(payload)
+                if total is None:
+                    total = find_total(payload)
+                items.extend(self.to_item(record) for record in records)
+                if page_size is None:
+                    page_size = len(records)
+                if on_page:
+                    await on_page(len(items), total)
+                if not records or (total is not None and len(items) >= total) or len(records) < page_size:
+                    break
+                page_index += 1
+        return items
@@ -0,0 +1,85 @@
+import hashlib
+import os
+import re
+import time
+import uuid
+
+
+# 내보낸 결과 파일을 두는 디렉터리. 다운로드는 이 디렉터리 안의 파일만 허용한다.
+ARTIFACT_DIR = os.getenv("ARTIFACT_DIR", "artifacts")
+# 결과 저장소가 참조하지 않는 파일은 이 시간(초)이 지나면 정리한다 (실패한 작업의 기록 중 파일 등).
+ARTIFACT_MAX_AGE = float(os.getenv("ARTIFACT_MAX_AGE", "3600"))
+
+DIGEST_LENGTH = 16
+# 다운로드 가능한 이름: 경로 구분자 없음, 점으로 시작하지 않음 (기록 중인 파일은 '.'으로 시작)
+SAFE_NAME = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]*$")
+ADDRESSED_NAME = re.compile(rf"_([0-9a-f]{{{DIGEST_LENGTH}}})\.")
+
+
+def staging_base(prefix):
+    """기록 중에 쓸 숨김 파일 경로(확장자 제외). 완료 후 finalize로 내용 기반 이름이 붙는다."""
+    os.makedirs(ARTIFACT_DIR, exist_ok=True)
+    return os.path.join(ARTIFACT_DIR, f".{prefix}_{uuid.uuid4().hex[:8]}")
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def finalize(path, prefix):
+    """기록을 마친 파일을 {prefix}_{내용 해시}{확장자}로 옮긴다. 같은 내용의 파일이 이미 있으면 그것을 쓴다."""
+    extension = os.path.splitext(os.path.basename(path).lstrip("."))[1]
+    final_path = os.path.join(os.path.dirname(path), f"{prefix}_{file_digest(path)[:DIGEST_LENGTH]}{extension}")
+    if os.path.exists(final_path):
+        os.remove(path)
+        # 보관 기간 판단은 수정 시각 기준이므로 재사용한 파일도 새로 만든 것처럼 갱신
+        os.utime(final_path)
+    else:
+        os.replace(path, final_path)
+    return final_path
+
+
+def resolve(filename):
+    """다운로드 요청 이름을 ARTIFACT_DIR 안의 실제 경로로 바꾼다. 허용되지 않는 이름이면 None."""
+    if not SAFE_NAME.match(filename) or ".." in filename:
+        return None
+    root = os.path.realpath(ARTIFACT_DIR)
+    path = os.path.realpath(os.path.join(root, filename))
+    if os.path.dirname(path) != root:
+        return None
+    return path
+
+
+def etag(path, encoding=None):
+    """내용 기반 이름이면 해시를, 아니면 크기와 수정 시각을 태그로 쓴다. 압축본은 인코딩을 덧붙인다."""
+    match = ADDRESSED_NAME.search(os.path.basename(path))
+    if match:
+        tag = match.group(1)
+    else:
+        stat = os.stat(path)
+        tag = f"{stat.st_size:x}-{stat.st_mtime_ns:x}"
+    return f'"{tag}-{encoding}"' if encoding else f'"{tag}"'
+
+
+def remove_stale(keep=(), max_age=None):
+    """keep에 없고 max_age보다 오래된 파일을 지운다. 지운 파일 수를 반환."""
+    if not os.path.isdir(ARTIFACT_DIR):
+        return 0
+    max_age = ARTIFACT_MAX_AGE if max_age is None else max_age
+    keep = {os.path.realpath(path) for path in keep}
+    now = time.time()
+    removed = 0
+    for entry in os.scandir(ARTIFACT_DIR):
+        if not entry.is_file() or os.path.realpath(entry.path) in keep:
+            continue
+        try:
+            if now - entry.stat().st_mtime > max_age:
+                os.remove(entry.path)
+                removed += 1
+        except OSError as e:
+            print(f"⚠️ 오래된 결과 파일 삭제 실패 ({entry.path}): {e}")
+    return removed
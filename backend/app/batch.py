@@ -0,0 +1,232 @@
+"""웹 서버 없이 여러 시험을 한 번에 수집하는 배치 실행기 (cron 등에서 사용).
+
+    cd backend
+    python -m app.batch 101 102 103 --concurrency 2 --formats csv xlsx --output-dir out
+    python -m app.batch --file exams.txt --combined all_exams --formats jsonl
+
+시험 ID 파일은 한 줄에 하나(공백/쉼표 구분도 가능, '#' 뒤는 주석)이며, 세션은 --concurrency 개를 미리 로그인해 두고 재사용한다.
+시험별 결과는 --output-dir에 저장되고, --combined를 주면 모든 시험의 행을 '시험 ID' 열과 함께 한 파일로도 모은다.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import time
+
+
+EXAM_ID_COLUMN = "시험 ID"
+
+
+def read_exam_ids(args_ids, path=None):
+    """인자와 파일에서 시험 ID를 순서대로 모으고 중복은 제거한다."""
+    tokens = list(args_ids)
+    if path:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                tokens.extend(re.split(r"[\s,]+", line.split("#", 1)[0]))
+    exam_ids = [token.strip() for token in tokens if token.strip()]
+    invalid = [exam_id for exam_id in exam_ids if not exam_id.isdigit()]
+    if invalid:
+        raise ValueError(f"올바르지 않은 시험 ID: {', '.join(invalid)}")
+    return list(dict.fromkeys(exam_ids))
+
+
+class CombinedOutput:
+    """모든 시험의 행을 형식별 파일 하나에 이어 쓴다. 시험 하나가 끝날 때마다 그 시험의 행을 순서대로 기록한다."""
+
+    def __init__(self, base_filename, file_formats, schema):
+        from .exporters import open_writer
+
+        columns = [EXAM_ID_COLUMN, *schema.columns]
+        tags = {EXAM_ID_COLUMN: "exam_id", **schema.xml_tags}
+        self.writers = [open_writer(file_format, base_filename, columns, tags) for file_format in file_formats]
+        self.rows = 0
+
+    @property
+    def paths(self):
+        return [writer.path for writer in self.writers]
+
+    def write_exam(self, exam_id, rows):
+        for row in rows:
+            record = {EXAM_ID_COLUMN: exam_id, **row}
+            for writer in self.writers:
+                writer.write(record)
+        self.rows += len(rows)
+
+    def close(self):
+        for writer in self.writers:
+            writer.close()
+
+
+async def crawl_one(pool, exam_id, args, schema, combined, verbose):
+    result = {"exam_id": exam_id, "status": "failed", "rows": 0, "seconds": 0.0, "artifacts": [], "error": None}
+    started = time.monotonic()
+
+    async def log_callback(message, level="info", step=None, index=None):
+        if verbose or level in ("warning", "error"):
+            print(f"[{exam_id}] {message}", file=sys.stderr if level == "error" else sys.stdout, flush=True)
+
+    async def progress_callback(progress, description):
+        pass
+
+    try:
+        async with pool.lease() as crawler:
+            count = await crawler.crawl_exam_data_async(
+                exam_id,
+                progress_callback,
+                log_callback,
+                mode=args.mode,
+                resume=args.resume,
+                file_formats=args.formats,
+                schema=schema,
+                fast_path=args.fast_path,
+            )
+            result["rows"] = count
+            if count:
+                artifacts = await crawler.run_blocking(
+                    crawler.export_artifacts, exam_id, args.formats, args.compression, False
+                )
+                result["artifacts"] = [artifact["path"] for artifact in artifacts]
+                if combined is not None:
+                    combined.write_exam(exam_id, crawler.collected_data)
+                result["status"] = "completed" if artifacts else "failed"
+                if not artifacts:
+                    result["error"] = "파일 생성 실패"
+            else:
+                result["error"] = "수집된 데이터 없음"
+    except Exception as e:
+        result["error"] = str(e) or type(e).__name__
+    result["seconds"] = round(time.monotonic() - started, 3)
+    mark = "✅" if result["status"] == "completed" else "❌"
+    print(f"{mark} {exam_id}: {result['rows']}행, {result['seconds']:.1f}s" + (f" ({result['error']})" if result["error"] else ""), flush=True)
+    return result
+
+
+async def run(args):
+    from .crawler import DEFAULT_FIELDS
+    from .pool import DriverPool
+    from .schema import ExtractionSchema
+
+    schema_spec = None
+    if args.schema:
+        with open(args.schema, encoding="utf-8") as f:
+            schema_spec = json.load(f)
+    schema = ExtractionSchema.load(schema_spec, default=DEFAULT_FIELDS)
+
+    combined = None
+    if args.combined:
+        combined = CombinedOutput(os.path.join(args.output_dir, args.combined), args.formats, schema)
+
+    # 세션 수는 시험 수보다 많을 필요가 없다.
+    pool = DriverPool(size=min(args.concurrency, len(args.exam_ids)))
+    started = time.monotonic()
+    login_started = time.monotonic()
+    await pool.start()
+    login_seconds = time.monotonic() - login_started
+    print(f"세션 {pool.size}개 준비 ({login_seconds:.1f}s). 시험 {len(args.exam_ids)}개 수집 시작...", flush=True)
+    try:
+        results = await asyncio.gather(
+            *(crawl_one(pool, exam_id, args, schema, combined, args.verbose) for exam_id in args.exam_ids)
+        )
+    finally:
+        await pool.stop()
+        if combined is not None:
+            combined.close()
+    elapsed = time.monotonic() - started
+
+    rows = sum(result["rows"] for result in results)
+    completed = [result for result in results if result["status"] == "completed"]
+    crawl_seconds = max(elapsed - login_seconds, 1e-9)
+    return {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "exams": len(results),
+        "completed": len(completed),
+        "failed": len(results) - len(completed),
+        "rows": rows,
+        "concurrency": pool.size,
+        "login_seconds": round(login_seconds, 3),
+        "elapsed_seconds": round(elapsed, 3),
+        # 세션 준비 시간을 뺀 수집 구간 기준 처리량
+        "rows_per_sec": round(rows / crawl_seconds, 3),
+        "exams_per_min": round(len(completed) / crawl_seconds * 60, 3),
+        "combined": combined.paths if combined is not None else [],
+        "results": results,
+    }
+
+
+def print_summary(summary):
+    print("\n시험 ID      상태         행 수     시간(s)   rows/s")
+    for result in summary["results"]:
+        rate = result["rows"] / result["seconds"] if result["seconds"] else 0.0
+        print(f"{result['exam_id']:<12} {result['status']:<10} {result['rows']:>7} {result['seconds']:>10.1f} {rate:>8.2f}")
+    print(
+        f"\n완료 {summary['completed']}/{summary['exams']}개, 총 {summary['rows']}행, "
+        f"{summary['elapsed_seconds']:.1f}s (로그인 {summary['login_seconds']:.1f}s 포함), "
+        f"{summary['rows_per_sec']:.2f} rows/s, {summary['exams_per_min']:.2f} 시험/분 (세션 {summary['concurrency']}개)"
+    )
+    for path in summary["combined"]:
+        print(f"통합 파일: {path}")
+
+
+def main():
+    try:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+    except ImportError:
+        pass
+
+    parser = argparse.ArgumentParser(description="여러 시험을 웹 서버 없이 수집하는 배치 실행기")
+    parser.add_argument("exam_ids", nargs="*", help="시험 ID 목록")
+    parser.add_argument("--file", help="시험 ID 목록 파일 (줄/공백/쉼표 구분, '#' 주석)")
+    parser.add_argument("--concurrency", type=int, default=int(os.getenv("DRIVER_POOL_SIZE", "1")), help="동시에 쓸 세션 수")
+    parser.add_argument("--formats", nargs="+", default=["csv"], help="결과 파일 형식 (csv, xlsx, json, jsonl, xml)")
+    parser.add_argument("--compression", nargs="*", default=[], help="함께 만들 압축본 (gzip, zstd)")
+    parser.add_argument("--output-dir", default="batch_output", help="시험별 결과 파일 디렉터리 (ARTIFACT_DIR)")
+    parser.add_argument("--combined", help="모든 시험을 합친 파일 이름 (확장자 제외, --output-dir 안에 생성)")
+    parser.add_argument("--mode", choices=["selenium", "api"], help="수집 방식 (기본 CRAWL_MODE)")
+    parser.add_argument("--resume", action="store_true", help="체크포인트에서 이어서 수집")
+    parser.add_argument("--fast-path", dest="fast_path", action=argparse.BooleanOptionalAction, default=None)
+    parser.add_argument("--schema", help="추출 스키마 JSON 파일 (기본 EXTRACTION_SCHEMA)")
+    parser.add_argument("--summary-json", help="처리량 요약을 저장할 JSON 경로")
+    parser.add_argument("--verbose", action="store_true", help="모든 진행 로그 출력 (기본은 경고/오류만)")
+    args = parser.parse_args()
+
+    try:
+        args.exam_ids = read_exam_ids(args.exam_ids, args.file)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    if not args.exam_ids:
+        parser.error("시험 ID를 인자나 --file로 지정하세요.")
+    if args.concurrency < 1:
+        parser.error("--concurrency는 1 이상이어야 합니다.")
+
+    # 결과 디렉터리는 모듈 import 시점에 읽히므로 먼저 설정한다.
+    args.output_dir = os.path.abspath(args.output_dir)
+    os.makedirs(args.output_dir, exist_ok=True)
+    os.environ["ARTIFACT_DIR"] = args.output_dir
+
+    from .api_extractor import api_mode_available
+    from .exporters import COMPRESSED_EXTENSIONS, WRITERS
+
+    if args.mode == "api" and not api_mode_available():
+        parser.error("api 모드를 쓰려면 LMS_API_CAPTURE=true 또는 LMS_API_SUBMISSIONS_URL을 설정하세요.")
+
+    unsupported = [f for f in args.formats if f not in WRITERS] + [e for e in args.compression if e not in COMPRESSED_EXTENSIONS]
+    if unsupported:
+        parser.error(f"지원하지 않는 형식: {', '.join(unsupported)}")
+    args.formats = list(dict.fromkeys(args.formats))
+
+    summary = asyncio.run(run(args))
+    print_summary(summary)
+    if args.summary_json:
+        with open(args.summary_json, "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+    sys.exit(0 if summary["failed"] == 0 else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+import json
+import os
+import time
+
+
+CHECKPOINT_DIR = os.getenv("CHECKPOINT_DIR", "checkpoints")
+
+
+class CheckpointStore:
+    """시험 ID별 수집 결과를 한 줄씩 덧붙이는 JSONL 체크포인트.
+
+    줄 형식:
+      {"type": "meta", "total": 120, "started_at": ...}
+      {"type": "row", "index": 3, "item": {...}}
+    """
+
+    def __init__(self, exam_id, directory=None):
+        self.exam_id = exam_id
+        self.directory = directory or CHECKPOINT_DIR
+        self.path = os.path.join(self.directory, f"exam_{exam_id}.jsonl")
+        self._file = None
+
+    def load(self):
+        rows = {}
+        total = None
+        if not os.path.exists(self.path):
+            return rows, total
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # 비정상 종료로 잘린 마지막 줄은 무시
+                    continue
+                if record.get("type") == "meta":
+                    total = record.get("total")
+                elif record.get("type") == "row":
+                    rows[record["index"]] = record["item"]
+        return rows, total
+
+    def open(self, fresh=False):
+        os.makedirs(self.directory, exist_ok=True)
+        self._file = open(self.path, "w" if fresh else "a", encoding="utf-8")
+
+    def _write(self, record):
+        if self._file is None:
+            self.open()
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def write_meta(self, total):
+        self._write({"type": "meta", "total": total, "started_at": time.time()})
+
+    def append(self, index, item):
+        self._write({"type": "row", "index": index, "item": item})
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+
+def first_missing_index(rows, total):
+    for index in range(total):
+        if index not in rows:
+            return index
+    return total
+
+
+class SnapshotStore:
+    """시험 ID별로 마지막으로 완료된 수집 결과를 보관한다 (증분 수집의 기준)."""
+
+    def __init__(self, exam_id, directory=None):
+        self.exam_id = exam_id
+        self.directory = directory or CHECKPOINT_DIR
+        self.path = os.path.join(self.directory, f"exam_{exam_id}.snapshot.json")
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def save(self, rows):
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"total": len(rows), "saved_at": time.time(), "rows": rows}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+
+def _keyed_rows(rows, key_field):
+    # 동명이인을 구분하기 위해 (이름, 등장 순번)을 키로 사용
+    keyed = {}
+    seen = {}
+    for row in rows:
+        name = row.get(key_field, "")
+        seen[name] = seen.get(name, 0) + 1
+        keyed[(name, seen[name])] = row
+    return keyed
+
+
+def diff_rows(old_rows, new_rows, key_field="수강자 이름"):
+    old = _keyed_rows(old_rows, key_field)
+    new = _keyed_rows(new_rows, key_field)
+    return {
+        "added": [row for key, row in new.items() if key not in old],
+        "removed": [row for key, row in old.items() if key not in new],
+        "changed": [
+            {"before": old[key], "after": row} for key, row in new.items() if key in old and old[key] != row
+        ],
+    }
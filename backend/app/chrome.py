@@ -0,0 +1,127 @@
+import itertools
+import os
+import shutil
+import threading
+
+from selenium.webdriver.chrome.options import Options
+
+
+# 크롤러가 쓰지 않는 리소스(이미지/미디어/폰트)를 막고 작은 창, eager 로딩으로 띄우는 가벼운 실행 설정
+LEAN_DRIVER = os.getenv("LEAN_DRIVER", "true").lower() == "true"
+# 설정하면 세션마다 {CHROME_PROFILE_DIR}/session-{n} 프로필을 유지해 드라이버를 재시작해도 로그인 쿠키를 재사용한다.
+# 같은 디렉터리를 여러 프로세스가 함께 쓰면 프로필이 잠기므로 프로세스마다 다른 경로를 지정한다.
+CHROME_PROFILE_DIR = os.getenv("CHROME_PROFILE_DIR", "")
+
+FULL_WINDOW_SIZE = "1920,1080"
+LEAN_WINDOW_SIZE = "1280,800"
+
+# CDP Network.setBlockedURLs 패턴. CSS는 요소 표시 여부 판단에 필요하므로 막지 않는다.
+BLOCKED_URL_PATTERNS = [
+    f"*.{extension}"
+    for extension in (
+        "png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico", "bmp",
+        "woff", "woff2", "ttf", "otf", "eot",
+        "mp4", "webm", "ogg", "mp3", "wav", "m4a",
+    )
+]
+
+_profile_slots = itertools.count(1)
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+
+def next_profile_dir():
+    """세션 하나가 계속 쓸 프로필 경로. CHROME_PROFILE_DIR이 없으면 None (매번 임시 프로필)."""
+    if not CHROME_PROFILE_DIR:
+        return None
+    return os.path.join(os.path.abspath(CHROME_PROFILE_DIR), f"session-{next(_profile_slots)}")
+
+
+def build_options(lean=None, profile_dir=None, network_capture=False):
+    lean = LEAN_DRIVER if lean is None else lean
+    options = Options()
+    # Render/서버 환경 호환을 위해 headless 기본값 사용
+    options.add_argument("--headless=new")
+    options.add_argument(f"--window-size={LEAN_WINDOW_SIZE if lean else FULL_WINDOW_SIZE}")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-popup-blocking")
+    options.add_argument("--disable-notifications")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_argument("--remote-allow-origins=*")
+    options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36")
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option("useAutomationExtension", False)
+    prefs = {
+        "credentials_enable_service": False,
+        "profile.password_manager_enabled": False,
+        "autofill.profile_enabled": False,
+    }
+    if lean:
+        # DOMContentLoaded에서 바로 반환. 이후 화면 변화는 단계별 DOM 대기가 확인한다.
+        options.page_load_strategy = "eager"
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_argument("--mute-audio")
+        options.add_argument("--no-first-run")
+        options.add_argument("--no-default-browser-check")
+        options.add_argument("--disable-background-networking")
+        options.add_argument("--disable-component-update")
+        options.add_argument("--disable-default-apps")
+        options.add_argument("--disable-sync")
+        options.add_argument("--disable-features=Translate,MediaRouter,OptimizationHints,AutofillServerCommunication")
+        prefs["profile.managed_default_content_settings.images"] = 2
+        prefs["profile.default_content_setting_values.notifications"] = 2
+    else:
+        options.add_argument("--start-maximized")
+    options.add_experimental_option("prefs", prefs)
+    if profile_dir:
+        options.add_argument(f"--user-data-dir={profile_dir}")
+    if network_capture:
+        # api 모드에서 상세 페이지가 호출하는 제출 목록 API를 찾기 위해 네트워크 이벤트를 기록
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+    # 컨테이너/서버에서 chromium 바이너리 경로 지정 (Dockerfile에서 CHROME_BINARY 설정)
+    chrome_binary = os.getenv("CHROME_BINARY")
+    if chrome_binary and os.path.exists(chrome_binary):
+        options.binary_location = chrome_binary
+    return options
+
+
+def block_resources(driver):
+    """이미지/미디어/폰트 요청을 네트워크 단계에서 막는다 (prefs로 막히지 않는 CSS 배경/폰트 포함)."""
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+
+
+def _webdriver_manager_path():
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    return ChromeDriverManager(cache_valid_range=7, path="/tmp/chromedriver").install()
+
+
+def driver_path_sources():
+    """시도할 chromedriver 경로: 이전에 성공한 경로 → CHROMEDRIVER_PATH/PATH의 chromedriver → webdriver_manager 설치."""
+    sources = []
+    if _driver_path:
+        sources.append(("캐시된", lambda: _driver_path))
+    system_path = os.getenv("CHROMEDRIVER_PATH") or shutil.which("chromedriver")
+    if system_path and system_path != _driver_path:
+        sources.append(("시스템", lambda: system_path))
+    sources.append(("webdriver_manager", _webdriver_manager_path))
+    return sources
+
+
+def remember_driver_path(path):
+    """드라이버 기동에 성공한 경로를 프로세스 안에서 재사용한다 (재시작/새 세션마다 탐색/네트워크 조회 생략)."""
+    global _driver_path
+    with _driver_path_lock:
+        _driver_path = path
+
+
+def forget_driver_path(path):
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path == path:
+            _driver_path = None
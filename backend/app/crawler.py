@@ -4,15 +4,67 @@ from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-import pandas as pd
 import time
 import os
 import json
-import xml.etree.ElementTree as ET
-from xml.dom.minidom import parseString
 import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from .api_extractor import NETWORK_CAPTURE, ApiExtractor
+from .artifacts import finalize, staging_base
+from .chrome import (
+    LEAN_DRIVER,
+    block_resources,
+    build_options,
+    driver_path_sources,
+    forget_driver_path,
+    next_profile_dir,
+    remember_driver_path,
+)
+from .checkpoint import CheckpointStore, SnapshotStore, diff_rows, first_missing_index
+from .logbuffer import LogBuffer
+from .fastpath import build_config, run_student
+from .metrics import (
+    CRAWL_SECONDS,
+    DRIVER_RESTARTS,
+    FAST_PATH_FALLBACKS,
+    LOGIN_PHASE_SECONDS,
+    RECOVERIES,
+    ROWS_COLLECTED,
+    JobMetrics,
+    timed,
+)
+from .exporters import OrderedRowWriter, bundle_files, compress_file, open_writer
+from .retry import RetryPolicy, classify_failure, describe
+from .schema import ExtractionSchema
+from .waits import AdaptiveWait, StepBudget, wait_for_dom
+
+
+LMS_BASE_URL = os.getenv("LMS_BASE_URL", "https://lmsadmin-kdt.fastcampus.co.kr").rstrip("/")
+SIGN_IN_URL = f"{LMS_BASE_URL}/sign-in"
+# selenium: 학생별 모달 순회 / api: 제출 목록 API 직접 호출 (실패 시 selenium으로 대체)
+CRAWL_MODE = os.getenv("CRAWL_MODE", "selenium")
+# 학생 한 명을 스크립트 한 번으로 처리 (선택자를 못 찾으면 단계별 처리로 자동 전환)
+FAST_PATH = os.getenv("FAST_PATH", "true").lower() == "true"
+# 빠른 경로가 연속으로 이만큼 실패하면 해당 구간은 단계별로만 처리
+FAST_PATH_MAX_MISSES = 3
+
+# 시험 상세 페이지 요소
+XPATH_PAGINATION = '//*[@id="app"]/main/section/div/div[2]/div/div[2]/div[2]/span[2]'
+XPATH_STUDENT_NAME = '//*[@id="app"]/main/section/div/div[2]/div/div[2]/div[1]/strong'
+XPATH_ANSWER_BUTTON = '//*[@id="app"]/main/section/div/div[2]/div/div[4]/div/div/table/tbody/tr/td[6]/button'
+XPATH_NEXT_BUTTON = '//*[@id="app"]/main/section/div/div[2]/div/div[2]/div[2]/button[2]'
+XPATH_BLOG_LINK = '//*[@id="modals"]/section/div/div/div/div[2]/ul/li[2]/div/p'
+XPATH_CLOSE_MODAL_1 = '//*[@id="modals"]/section/div/div/div/div[1]/button'
+XPATH_CLOSE_MODAL_2 = '//*[@id="modals"]/section[2]/div/div/section/div/button[2]'
+
+# 기본 추출 스키마. EXTRACTION_SCHEMA 환경변수나 요청의 schema로 필드를 바꿀 수 있다.
+DEFAULT_FIELDS = [
+    {"name": "수강자 이름", "selector": XPATH_STUDENT_NAME, "scope": "page", "tag": "name"},
+    {"name": "블로그 링크", "selector": XPATH_BLOG_LINK, "scope": "modal", "tag": "blog_link"},
+]
 
 
 class FastCampusLMSCrawler:
@@ -22,108 +74,119 @@ class FastCampusLMSCrawler:
         self.driver = None
         self.wait = None
         self.is_running = False
+        # 중지 요청 여부. 재로그인이 is_running을 초기화해도 중지 요청은 남아 있어야 한다.
+        self._stop_requested = False
         self.current_exam_id = None
         self.collected_data = []
-        self.log_messages = []
+        self.log_messages = LogBuffer()
+        self.checkpoint = None
+        self._rows_by_index = {}
+        self._position = 0
+        self._total_count = 0
+        self.last_diff = None
+        self._helpers = []
+        self._stream_writer = None
+        self._stream_formats = []
+        self._stream_prefix = None
+        self.export_paths = {}
+        self._stream_seconds = {}
+        # 샤드 수집 시 여러 세션 스레드가 같은 체크포인트/결과 파일에 행을 기록한다.
+        self._collect_lock = threading.Lock()
+        self.home_url = None
+        self.budget = StepBudget()
+        self.retry = RetryPolicy()
+        self.lean = LEAN_DRIVER
+        self.profile_dir = next_profile_dir()
+        self.metrics = JobMetrics()
+        self.schema = ExtractionSchema(DEFAULT_FIELDS)
+        self.fast_path = FAST_PATH
+        # WebDriver는 스레드 안전하지 않으므로 세션마다 전용 스레드 하나에서만 호출한다.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="crawler")
 
         if not self.email or not self.password:
-            self._add_log("⚠️ 경고: 로그인 정보가 설정되지 않았습니다. 환경변수 FASTCAMPUS_EMAIL, FASTCAMPUS_PASSWORD를 설정하세요.")
+            self._add_log("⚠️ 경고: 로그인 정보가 설정되지 않았습니다. 환경변수 FASTCAMPUS_EMAIL, FASTCAMPUS_PASSWORD를 설정하세요.", level="warning")
 
-    def _add_log(self, message):
-        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = f"[{timestamp}] {message}"
-        self.log_messages.append(log_entry)
+    def _add_log(self, message, *args, level="info", step=None, index=None):
+        self.log_messages.add(message, *args, level=level, step=step, index=index)
 
-    def setup_driver(self):
-        self._add_log("Selenium 드라이버 설정 시작...")
-        chrome_options = Options()
-        # Render/서버 환경 호환을 위해 headless 기본값 사용
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--start-maximized")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-popup-blocking")
-        chrome_options.add_argument("--disable-notifications")
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_argument("--remote-allow-origins=*")
-        chrome_options.add_argument(
-            "--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        )
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option("useAutomationExtension", False)
-        chrome_options.add_experimental_option(
-            "prefs",
-            {
-                "credentials_enable_service": False,
-                "profile.password_manager_enabled": False,
-                "autofill.profile_enabled": False,
-            },
-        )
-
-        # 컨테이너/서버에서 chromium 바이너리 경로 지정 (Dockerfile에서 CHROME_BINARY 설정)
-        chrome_binary = os.getenv("CHROME_BINARY")
-        if chrome_binary and os.path.exists(chrome_binary):
-            chrome_options.binary_location = chrome_binary
-            self._add_log(f"Chrome binary 사용: {chrome_binary}")
+    async def run_blocking(self, func, *args, **kwargs):
+        # Selenium 호출을 전용 스레드에서 실행해 이벤트 루프가 막히지 않도록 한다.
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
 
-        # Railway의 Docker 환경에서 chromium이 설치되어 있을 수 있으므로 우선 시스템 chromedriver 시도
-        try:
-            self._add_log("시스템 chromedriver 사용 시도...")
-            service = Service()  # PATH 에서 chromedriver 검색
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            self.wait = WebDriverWait(self.driver, 20)
-            self._add_log("시스템 chromedriver로 드라이버 설정 완료.")
-            return
-        except Exception as e2:
-            self._add_log(f"시스템 chromedriver 실패: {e2}")
-
-        # 실패 시 webdriver_manager로 드라이버 설치 시도
-        try:
-            chrome_driver_manager = ChromeDriverManager(cache_valid_range=7, path="/tmp/chromedriver")
-            driver_path = chrome_driver_manager.install()
-            self._add_log(f"ChromeDriver 경로: {driver_path}")
+    def setup_driver(self):
+        self._add_log("Selenium 드라이버 설정 시작... (%s 프로필)", "lean" if self.lean else "기본")
+        chrome_options = build_options(self.lean, self.profile_dir, NETWORK_CAPTURE)
+        if chrome_options.binary_location:
+            self._add_log(f"Chrome binary 사용: {chrome_options.binary_location}")
 
-            if not os.path.isfile(driver_path) or not os.access(driver_path, os.X_OK):
-                raise Exception(f"ChromeDriver 파일이 없거나 실행 권한이 없습니다: {driver_path}")
+        # 이전에 성공한 경로 → 시스템 chromedriver → webdriver_manager 순으로 시도
+        last_error = None
+        for source, resolve in driver_path_sources():
+            driver_path = None
+            try:
+                driver_path = resolve()
+                if not os.path.isfile(driver_path) or not os.access(driver_path, os.X_OK):
+                    raise Exception(f"ChromeDriver 파일이 없거나 실행 권한이 없습니다: {driver_path}")
+                self.driver = webdriver.Chrome(service=Service(driver_path), options=chrome_options)
+            except Exception as e:
+                last_error = e
+                if driver_path:
+                    forget_driver_path(driver_path)
+                self._add_log(f"{source} chromedriver 실패: {e}", level="warning")
+                continue
+            remember_driver_path(driver_path)
+            self._add_log(f"{source} chromedriver로 드라이버 설정 완료: {driver_path}")
+            break
+        else:
+            error_msg = str(last_error) if str(last_error) else f"타입: {type(last_error).__name__}"
+            self._add_log(f"ChromeDriver 설정 실패: {error_msg}", level="error")
+            self._add_log(f"예외 세부정보: {repr(last_error)}")
+            raise last_error
 
-            service = Service(driver_path)
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            self.wait = WebDriverWait(self.driver, 20)
-            self._add_log("Selenium 드라이버 설정 완료.")
-        except Exception as e:
-            error_msg = str(e) if str(e) else f"타입: {type(e).__name__}"
-            self._add_log(f"ChromeDriver 설정 실패: {error_msg}")
-            self._add_log(f"예외 세부정보: {repr(e)}")
-            raise
+        self.wait = WebDriverWait(self.driver, 20)
+        # 빠른 경로 스크립트는 학생 한 명의 모든 단계를 기다릴 수 있어야 한다.
+        self.driver.set_script_timeout(sum(self.budget.timeouts.values()) + 5)
+        if self.lean:
+            try:
+                block_resources(self.driver)
+            except Exception as e:
+                self._add_log(f"리소스 차단 설정 실패 (무시): {e}", level="warning")
 
-    def login_process(self):
+    def login_process(self, reuse_cookies=True):
+        """드라이버를 (재)시작하고 로그인한다. 프로필을 유지하는 세션은 reuse_cookies면 저장된 로그인부터 확인한다."""
         self._add_log("로그인 프로세스 시작...")
 
         if not self.email or not self.password:
             error_msg = "로그인 정보가 없습니다. 환경변수 FASTCAMPUS_EMAIL, FASTCAMPUS_PASSWORD를 설정하세요."
-            self._add_log(f"❌ {error_msg}")
+            self._add_log(f"❌ {error_msg}", level="error")
             raise Exception(error_msg)
 
+        if self.driver or self.home_url:
+            # 한 번이라도 로그인했던 세션을 다시 띄우는 경우
+            DRIVER_RESTARTS.inc()
         if self.driver:
             try:
                 self.driver.quit()
                 self._add_log("기존 드라이버 종료.")
             except Exception as e:
-                self._add_log(f"기존 드라이버 종료 중 오류 (무시): {e}")
+                self._add_log(f"기존 드라이버 종료 중 오류 (무시): {e}", level="warning")
 
-        self.setup_driver()
+        with timed(LOGIN_PHASE_SECONDS, phase="setup_driver"):
+            self.setup_driver()
 
         try:
+            if self.profile_dir and reuse_cookies and self._restore_session():
+                return True
+
             self._add_log("로그인 페이지로 이동...")
-            self.driver.get("https://lmsadmin-kdt.fastcampus.co.kr/sign-in")
+            with timed(LOGIN_PHASE_SECONDS, phase="sign_in_page"):
+                self.driver.get(SIGN_IN_URL)
 
+            phase_started = time.monotonic()
             # 사이트 선택
             site_select = self.wait.until(EC.presence_of_element_located((By.XPATH, '//*[@id="site"]')))
             Select(site_select).select_by_index(0)
-            time.sleep(0.2)
 
             # 이메일 입력
             email_input = self.wait.until(EC.presence_of_element_located((By.XPATH, '//*[@id="userName"]')))
@@ -140,25 +203,22 @@ class FastCampusLMSCrawler:
                 EC.element_to_be_clickable((By.XPATH, '//*[@id="app"]/main/section/div/form/button'))
             )
             self.driver.execute_script("arguments[0].click();", login_button)
+            LOGIN_PHASE_SECONDS.observe(time.monotonic() - phase_started, phase="fill_form")
 
             # 로그인 완료 대기
-            self.wait.until(
-                lambda drv: drv.current_url != "https://lmsadmin-kdt.fastcampus.co.kr/sign-in"
-            )
+            with timed(LOGIN_PHASE_SECONDS, phase="submit"):
+                self.wait.until(
+                    lambda drv: drv.current_url != SIGN_IN_URL
+                )
             self._add_log("로그인 성공!")
 
-            current_url = self.driver.current_url
-            self.driver.execute_script("window.open('', '_blank');")
-            time.sleep(0.2)
-            if len(self.driver.window_handles) > 1:
-                self.driver.close()
-                self.driver.switch_to.window(self.driver.window_handles[-1])
-            self.driver.get(current_url)
-            time.sleep(1)
+            self.home_url = self.driver.current_url
+            with timed(LOGIN_PHASE_SECONDS, phase="reset_session"):
+                self.reset_session()
             return True
         except Exception as e:
             error_msg = str(e) if str(e) else f"알 수 없는 오류 (타입: {type(e).__name__})"
-            self._add_log(f"❌ 로그인 실패: {error_msg}")
+            self._add_log(f"❌ 로그인 실패: {error_msg}", level="error")
             self._add_log(f"예외 세부정보: {repr(e)}")
             if self.driver:
                 try:
@@ -168,72 +228,378 @@ class FastCampusLMSCrawler:
             self.driver = None
             raise
 
-    def _collect_data_item(self, student_name, blog_link):
-        self.collected_data.append({"수강자 이름": student_name, "블로그 링크": blog_link})
+    async def login_process_async(self, reuse_cookies=True):
+        return await self.run_blocking(self.login_process, reuse_cookies)
+
+    def _restore_session(self):
+        with timed(LOGIN_PHASE_SECONDS, phase="restore_session"):
+            self.driver.get(self.home_url or f"{LMS_BASE_URL}/")
+            try:
+                # 만료된 쿠키면 SPA가 곧바로 로그인 페이지로 보낸다. 잠깐 지켜보고 그대로면 유효한 세션이다.
+                WebDriverWait(self.driver, 2, poll_frequency=0.2).until(lambda drv: "/sign-in" in drv.current_url)
+                self._add_log("저장된 로그인 세션 만료. 로그인 폼으로 진행합니다.")
+                return False
+            except TimeoutException:
+                pass
+        self._add_log("저장된 프로필의 로그인 세션 재사용.")
+        self.home_url = self.driver.current_url
+        with timed(LOGIN_PHASE_SECONDS, phase="reset_session"):
+            self.reset_session()
+        return True
+
+    def reset_session(self):
+        # 새 탭을 열고 기존 탭을 닫아 이전 작업의 페이지 상태(모달 등)를 버린다. 로그인 쿠키는 유지된다.
+        old_handle = self.driver.current_window_handle
+        self.driver.switch_to.new_window("tab")
+        new_handle = self.driver.current_window_handle
+        self.driver.switch_to.window(old_handle)
+        self.driver.close()
+        self.driver.switch_to.window(new_handle)
+        if NETWORK_CAPTURE:
+            # 이전 작업에서 쌓인 네트워크 이벤트 버리기
+            self.driver.get_log("performance")
+        self.is_running = False
+        self.current_exam_id = None
+
+    def is_session_alive(self):
+        if not self.driver:
+            return False
+        try:
+            self.driver.get(self.home_url or f"{LMS_BASE_URL}/")
+            return "/sign-in" not in self.driver.current_url
+        except Exception as e:
+            self._add_log(f"세션 상태 확인 실패: {e}", level="warning")
+            return False
+
+    def stop(self):
+        # 드라이버는 풀에 반환되어 재사용되므로 종료하지 않고 수집 루프만 멈춘다.
+        self._stop_requested = True
+        self.is_running = False
+        for helper in self._helpers:
+            helper.stop()
+
+    def _wait(self, step):
+        return AdaptiveWait(self.driver, self.budget.timeout(step), step=step)
+
+    def _wait_text(self, xpath, condition=EC.visibility_of_element_located, wait=None):
+        element = (wait or self.wait).until(condition((By.XPATH, xpath)))
+        return element.text.strip()
+
+    def _click_when_clickable(self, xpath, wait=None):
+        button = (wait or self.wait).until(EC.element_to_be_clickable((By.XPATH, xpath)))
+        self.driver.execute_script("arguments[0].click();", button)
+
+    def _close_answer_modal(self):
+        # 닫기 클릭 후 모달이 사라지거나 두 번째(확인) 모달이 뜰 때까지 DOM 변화를 기다린다.
+        self._click_when_clickable(XPATH_CLOSE_MODAL_1, self._wait("modal_close"))
+        index, _ = wait_for_dom(
+            self.driver,
+            [["present", XPATH_CLOSE_MODAL_2], ["absent", XPATH_BLOG_LINK]],
+            self.budget.timeout("modal_close"),
+            "modal_close",
+        )
+        return index == 0
+
+    def _close_second_modal(self, timeout=None):
+        wait_for_dom(
+            self.driver, [["present", XPATH_CLOSE_MODAL_2]], timeout or self.budget.timeout("second_modal"), "second_modal"
+        )
+        self._click_when_clickable(XPATH_CLOSE_MODAL_2, self._wait("second_modal"))
+        wait_for_dom(self.driver, [["absent", XPATH_CLOSE_MODAL_2]], self.budget.timeout("modal_close"), "modal_close")
+
+    def _click_next_and_wait(self):
+        # 다음 버튼 클릭 후 현재 위치(페이지네이션) 또는 이름 텍스트가 바뀌면 바로 진행한다.
+        before = self.driver.execute_script(
+            "return Array.from(arguments).map(x => { const n = document.evaluate(x, document, null, "
+            "XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue; return n ? n.textContent.trim() : null; });",
+            XPATH_PAGINATION,
+            XPATH_STUDENT_NAME,
+        )
+        self._click_when_clickable(XPATH_NEXT_BUTTON, self._wait("next"))
+        checks = [["text_not", xpath, text] for xpath, text in zip((XPATH_PAGINATION, XPATH_STUDENT_NAME), before) if text]
+        if checks:
+            wait_for_dom(self.driver, checks, self.budget.timeout("next"), "next")
+        self._position += 1
+
+    def _read_fields(self, scope, step):
+        # 준비 기준 필드(page: 키 필드, modal: 첫 필드)가 나타날 때까지 scope 필드 전체를 한 번의 호출로 읽으며 폴링한다.
+        ready = self.schema.key_field if scope == "page" else self.schema.modal_ready
+
+        def attempt(driver):
+            values, missing = self.schema.read(driver, scope)
+            return None if ready.name in missing else (values, missing)
+
+        return self._wait(step).until(attempt)
+
+    def _seek_to(self, index):
+        # 상세 페이지는 첫 항목부터 열리므로 '다음'을 반복 클릭해 index 위치로 빠르게 이동한다.
+        while self._position < index:
+            if not self.is_running:
+                return False
+            self._click_next_and_wait()
+        return True
+
+    def _collect_data_item(self, item, index=None):
+        # 체크포인트와 결과 파일에 기록하므로 run_blocking으로 세션 스레드에서 호출한다.
+        with self._collect_lock:
+            self.metrics.rows += 1
+            self.collected_data.append(item)
+            if index is not None:
+                self._rows_by_index[index] = item
+                if self.checkpoint:
+                    self.checkpoint.append(index, item)
+                if self._stream_writer:
+                    self._stream_writer.add(index, item)
+
+    def _export_base_filename(self, exam_id):
+        # 기록하는 동안은 숨김 파일이고, 끝나면 finalize가 내용 해시로 이름을 붙인다.
+        return staging_base(f"exam_data_{exam_id}")
 
     def export_data(self, exam_id, file_format="csv"):
+        if file_format in self.export_paths:
+            # 수집과 동시에 스트리밍으로 기록된 파일이 있으면 그대로 사용
+            return self.export_paths[file_format]
+
         if not self.collected_data:
             self._add_log("내보낼 데이터가 없습니다.")
             return None
 
-        df = pd.DataFrame(self.collected_data)
-        timestamp_str = time.strftime("%Y%m%d_%H%M%S")
-        base_filename = f"exam_data_{exam_id}_{timestamp_str}"
         output_path = None
-
         try:
-            if file_format == "csv":
-                output_path = f"{base_filename}.csv"
-                df.to_csv(output_path, index=False, encoding="utf-8-sig")
-            elif file_format == "xlsx":
-                output_path = f"{base_filename}.xlsx"
-                df.to_excel(output_path, index=False, engine="openpyxl")
-            elif file_format == "json":
-                output_path = f"{base_filename}.json"
-                df.to_json(output_path, orient="records", lines=False, indent=4, force_ascii=False)
-            elif file_format == "xml":
-                output_path = f"{base_filename}.xml"
-                root = ET.Element("students")
-                for _, row in df.iterrows():
-                    student_elem = ET.SubElement(root, "student")
-                    ET.SubElement(student_elem, "name").text = str(row["수강자 이름"])
-                    ET.SubElement(student_elem, "blog_link").text = str(row["블로그 링크"]) 
-                xml_str = ET.tostring(root, encoding="utf-8")
-                pretty_xml_str = parseString(xml_str).toprettyxml(indent="  ")
-                with open(output_path, "w", encoding="utf-8") as f:
-                    f.write(pretty_xml_str)
-            else:
-                self._add_log(f"지원하지 않는 파일 형식: {file_format}")
+            writer = open_writer(
+                file_format, self._export_base_filename(exam_id), self.schema.columns, self.schema.xml_tags
+            )
+            if writer is None:
+                self._add_log(f"지원하지 않는 파일 형식: {file_format}", level="warning")
                 return None
+            output_path = writer.path
+            for row in self.collected_data:
+                writer.write(row)
+            writer.close()
+            output_path = finalize(output_path, f"exam_data_{exam_id}")
             self._add_log(f"{output_path} 파일로 데이터 내보내기 완료.")
             return output_path
         except Exception as e:
-            self._add_log(f"데이터 내보내기 중 오류 ({output_path}): {e}")
+            self._add_log(f"데이터 내보내기 중 오류 ({output_path}): {e}", level="error")
             return None
 
-    async def crawl_exam_data_async(self, exam_id, progress_callback, log_callback):
+    def export_artifacts(self, exam_id, file_formats, compression=(), bundle=False):
+        """요청한 모든 형식과 압축본/ZIP 묶음을 한 번에 만든다. [{format, path, encodings}] 를 반환."""
+        artifacts = []
+        for file_format in file_formats:
+            started = time.monotonic()
+            output_path = self.export_data(exam_id, file_format)
+            if not output_path:
+                continue
+            encodings = []
+            # xlsx는 이미 zip 압축된 형식이라 다시 압축하지 않는다.
+            for encoding in compression if file_format != "xlsx" else ():
+                try:
+                    if compress_file(output_path, encoding):
+                        encodings.append(encoding)
+                    else:
+                        self._add_log(f"지원하지 않는 압축 형식 또는 모듈 없음: {encoding}", level="warning")
+                except Exception as e:
+                    self._add_log(f"{output_path} 압축 중 오류 ({encoding}): {e}", level="error")
+            artifacts.append({"format": file_format, "path": output_path, "encodings": encodings})
+            # 스트리밍으로 기록된 형식은 수집 중 기록 시간도 합산
+            self.metrics.export(file_format, self._stream_seconds.get(file_format, 0.0) + time.monotonic() - started)
+
+        if bundle and artifacts:
+            zip_path = f"{self._export_base_filename(exam_id)}.zip"
+            try:
+                started = time.monotonic()
+                bundle_files([artifact["path"] for artifact in artifacts], zip_path)
+                zip_path = finalize(zip_path, f"exam_data_{exam_id}")
+                self.metrics.export("zip", time.monotonic() - started)
+                artifacts.append({"format": "zip", "path": zip_path, "encodings": []})
+                self._add_log(f"{zip_path} 묶음 파일 생성 완료.")
+            except Exception as e:
+                self._add_log(f"묶음 파일 생성 중 오류 ({zip_path}): {e}", level="error")
+        return artifacts
+
+    def _open_stream_export(self, exam_id, file_formats):
+        base_filename = self._export_base_filename(exam_id)
+        self._stream_prefix = f"exam_data_{exam_id}"
+        writers = []
+        for file_format in dict.fromkeys(file_formats):
+            try:
+                writer = open_writer(file_format, base_filename, self.schema.columns, self.schema.xml_tags)
+            except Exception as e:
+                self._add_log(f"스트리밍 내보내기 파일 생성 실패 ({file_format}): {e}", level="error")
+                continue
+            if writer is None:
+                self._add_log(f"지원하지 않는 파일 형식: {file_format}", level="warning")
+                continue
+            writers.append((file_format, writer))
+        if writers:
+            self._stream_formats = [file_format for file_format, _ in writers]
+            self._stream_writer = OrderedRowWriter(writer for _, writer in writers)
+
+    def _close_stream_export(self):
+        stream_writer, self._stream_writer = self._stream_writer, None
+        if stream_writer is None:
+            return
+        try:
+            stream_writer.close()
+        except Exception as e:
+            self._add_log(f"데이터 내보내기 중 오류 ({', '.join(stream_writer.paths)}): {e}", level="error")
+            return
+        for file_format, path, seconds in zip(self._stream_formats, stream_writer.paths, stream_writer.seconds):
+            if stream_writer.count:
+                self._stream_seconds[file_format] = seconds
+                path = finalize(path, self._stream_prefix)
+                self.export_paths[file_format] = path
+                self._add_log(f"{path} 파일로 데이터 내보내기 완료.")
+            else:
+                os.remove(path)
+
+    async def _crawl_via_api(self, exam_id, update_log_and_progress):
+        try:
+            extractor = await self.run_blocking(
+                ApiExtractor.from_driver, self.driver, exam_id, self.schema.api_fields()
+            )
+            if not extractor:
+                await update_log_and_progress(0.4, "제출 목록 API를 찾지 못했습니다. Selenium 방식으로 진행합니다.")
+                return 0
+
+            async def on_page(fetched, total):
+                progress = 0.4 + (fetched / total) * 0.5 if total else 0.4
+                await update_log_and_progress(min(progress, 0.9), f"API로 {fetched}/{total or '?'}개 항목 수신.")
+
+            await update_log_and_progress(0.4, f"API 직접 수집 시작: {extractor.url}")
+            items = await extractor.fetch_all(on_page)
+        except Exception as e_api:
+            await update_log_and_progress(0.4, f"API 수집 실패 ({e_api}). Selenium 방식으로 진행합니다.", "warning")
+            return 0
+
+        await self.run_blocking(self._store_api_items, items)
+        return len(items)
+
+    def _store_api_items(self, items):
+        self.collected_data = []
+        self._rows_by_index = {}
+        self._total_count = len(items)
+        self.checkpoint.open(fresh=True)
+        self.checkpoint.write_meta(len(items))
+        for index, item in enumerate(items):
+            self._collect_data_item(self.schema.process_api_item(item), index)
+
+    async def _incremental_base(self, previous_rows, total_count, target_url, update_log_and_progress):
+        # 새 제출은 목록 끝에 추가된다고 보고, 기존 마지막 항목이 같은 자리에 있으면 그 뒤만 수집한다.
+        old_total = len(previous_rows)
+        if not old_total or old_total > total_count:
+            await update_log_and_progress(0.4, f"증분 기준 불일치 (이전 {old_total}개, 현재 {total_count}개). 전체 수집합니다.")
+            return {}
+
+        await update_log_and_progress(0.4, f"증분 수집: 이전 {old_total}개 중 마지막 항목 확인 중...")
+        try:
+            await self.run_blocking(self._seek_to, old_total - 1)
+            values, _ = await self.run_blocking(self._read_fields, "page", "name")
+            name = values[self.schema.key]
+        except Exception as e_seek:
+            name = None
+            await update_log_and_progress(0.4, f"증분 기준 확인 중 오류: {e_seek}", "warning")
+
+        if name == previous_rows[-1].get(self.schema.key):
+            await update_log_and_progress(0.4, f"이전 {old_total}개 재사용, 신규 {total_count - old_total}개만 수집합니다.")
+            return dict(enumerate(previous_rows))
+
+        await update_log_and_progress(0.4, "이전 결과와 순서가 달라 전체 수집합니다.")
+        await self.run_blocking(self.driver.get, target_url)
+        self._position = 0
+        return {}
+
+    async def crawl_exam_data_async(
+        self,
+        exam_id,
+        progress_callback,
+        log_callback,
+        mode=None,
+        resume=False,
+        incremental=False,
+        helpers=(),
+        file_formats=(),
+        schema=None,
+        fast_path=None,
+    ):
+        mode = mode or CRAWL_MODE
+        # 선택자/후처리기는 작업마다 한 번만 컴파일한다.
+        self.schema = schema or ExtractionSchema.load(default=DEFAULT_FIELDS)
+        self.fast_path = FAST_PATH if fast_path is None else fast_path
         self.current_exam_id = exam_id
         self.collected_data = []
-        self.log_messages = []
-        self.is_running = True
+        self._rows_by_index = {}
+        self.log_messages = LogBuffer()
+        self.last_diff = None
+        # 중지 요청은 세션을 대여할 때 초기화된다. 대여 후 시작 전에 들어온 중지 요청은 그대로 따른다.
+        self.is_running = not self._stop_requested
+        self.checkpoint = CheckpointStore(exam_id)
+        self.export_paths = {}
+        self._stream_seconds = {}
+        self.metrics = JobMetrics()
+        if file_formats:
+            # 행이 수집되는 즉시 결과 파일에 기록해 수집 종료와 동시에 파일이 완성되도록 한다.
+            await self.run_blocking(self._open_stream_export, exam_id, file_formats)
+        snapshot_store = SnapshotStore(exam_id)
+        previous = await self.run_blocking(snapshot_store.load)
+        previous_rows = previous["rows"] if previous else []
+        try:
+            count = await self._crawl_exam_data(
+                exam_id, progress_callback, log_callback, mode, resume, previous_rows if incremental else None, helpers
+            )
+        finally:
+            ROWS_COLLECTED.inc(self.metrics.rows, mode=mode)
+            CRAWL_SECONDS.observe(time.monotonic() - self.metrics.started, mode=mode)
+            # 통합 문서 저장과 내용 해시 계산은 오래 걸릴 수 있으므로 세션 스레드에서 처리한다.
+            await self.run_blocking(self.checkpoint.close)
+            await self.run_blocking(self._close_stream_export)
+            if self._rows_by_index:
+                # 재개/건너뛰기로 수집 순서가 섞였을 수 있으므로 원래 순서로 정렬
+                self.collected_data = [self._rows_by_index[i] for i in sorted(self._rows_by_index)]
+
+        if self.is_running:
+            if incremental:
+                self.last_diff = diff_rows(previous_rows, self.collected_data, self.schema.key)
+            if len(self._rows_by_index) >= self._total_count:
+                await self.run_blocking(snapshot_store.save, self.collected_data)
+        return count
+
+    def export_diff(self, exam_id):
+        if self.last_diff is None:
+            return None
+        output_path = f"{staging_base(f'exam_diff_{exam_id}')}.json"
+        try:
+            with open(output_path, "w", encoding="utf-8") as f:
+                json.dump(self.last_diff, f, ensure_ascii=False, indent=4)
+            output_path = finalize(output_path, f"exam_diff_{exam_id}")
+            self._add_log(f"{output_path} 파일로 변경 내역 내보내기 완료.")
+            return output_path
+        except Exception as e:
+            self._add_log(f"변경 내역 내보내기 중 오류 ({output_path}): {e}", level="error")
+            return None
 
-        async def update_log_and_progress(progress_value, desc_message):
-            self._add_log(desc_message)
-            await log_callback(desc_message)
+    async def _crawl_exam_data(
+        self, exam_id, progress_callback, log_callback, mode, resume, previous_rows=None, helpers=()
+    ):
+        async def update_log_and_progress(progress_value, desc_message, level="info", step=None, index=None):
+            self._add_log(desc_message, level=level, step=step, index=index)
+            await log_callback(desc_message, level=level, step=step, index=index)
             await progress_callback(progress_value, desc_message)
 
-        base_url = "https://lmsadmin-kdt.fastcampus.co.kr/exams/"
+        base_url = f"{LMS_BASE_URL}/exams/"
         target_url = f"{base_url}{exam_id}/detail"
 
         await update_log_and_progress(0.3, f"시험 ID {exam_id} 페이지로 이동 중: {target_url}")
-        self.driver.get(target_url)
-        await asyncio.sleep(1)
+        with self.metrics.step("page"):
+            await self.run_blocking(self.driver.get, target_url)
+        self._position = 0
 
         total_count = 0
         try:
-            pagination_element_xpath = '//*[@id="app"]/main/section/div/div[2]/div/div[2]/div[2]/span[2]'
-            pagination_element = self.wait.until(EC.presence_of_element_located((By.XPATH, pagination_element_xpath)))
-            pagination_text = pagination_element.text.strip()
+            pagination_text = await self.run_blocking(
+                self._wait_text, XPATH_PAGINATION, EC.presence_of_element_located, self._wait("page")
+            )
             if "/" in pagination_text:
                 total_count = int(pagination_text.split("/")[1].strip())
             else:
@@ -243,104 +609,408 @@ class FastCampusLMSCrawler:
             await update_log_and_progress(0.35, f"총 {total_count}개 항목 확인.")
         except Exception as e_page:
             total_count = 1
-            await update_log_and_progress(0.35, f"페이지네이션 분석 실패 ({e_page}), 단일 항목 처리 시도.")
+            await update_log_and_progress(0.35, f"페이지네이션 분석 실패 ({e_page}), 단일 항목 처리 시도.", "warning")
+        self._total_count = total_count
+
+        if mode == "api":
+            api_count = await self._crawl_via_api(exam_id, update_log_and_progress)
+            if api_count:
+                await update_log_and_progress(0.9, f"크롤링 완료. 총 {api_count}개 데이터 수집.")
+                return api_count
+
+        stored_rows, stored_total = await self.run_blocking(self.checkpoint.load) if resume else ({}, None)
+        reused_rows = {}
+        if previous_rows is not None and not resume:
+            reused_rows = await self._incremental_base(previous_rows, total_count, target_url, update_log_and_progress)
+        if stored_total is not None and stored_total != total_count:
+            await update_log_and_progress(
+                0.35, f"체크포인트 총 항목 수({stored_total})가 현재({total_count})와 다릅니다. 저장된 행은 위치 기준으로 재사용합니다."
+            )
+        start_index = await self.run_blocking(
+            self._restore_rows, resume, stored_rows, stored_total, reused_rows, total_count
+        )
+
+        if start_index >= total_count:
+            # 저장된 행으로 모든 항목이 채워졌으면 마지막 항목 너머로 이동하지 않고 바로 끝낸다.
+            await update_log_and_progress(0.4, f"{total_count}개 항목이 모두 저장되어 있어 새로 수집할 항목이 없습니다.")
+        elif helpers:
+            await self._collect_sharded(helpers, target_url, start_index, total_count, update_log_and_progress)
+        else:
+            if start_index > 0:
+                await update_log_and_progress(0.4, f"체크포인트에서 재개: {start_index + 1}번째 항목으로 이동 중...")
+                await self.run_blocking(self._seek_to, start_index)
 
-        collected_data_count_local = 0
-        for i in range(total_count):
+            async def report(i, message, level="info", step=None):
+                await update_log_and_progress(0.4 + (i / total_count) * 0.5, message, level, step, i)
+
+            await self._collect_range(start_index, total_count, total_count, report, self._collect_data_item, self._rows_by_index)
+
+        collected_data_count_local = len(self._rows_by_index)
+        await update_log_and_progress(0.9, f"크롤링 완료. 총 {collected_data_count_local}개 데이터 수집.")
+        return collected_data_count_local
+
+    def _restore_rows(self, resume, stored_rows, stored_total, reused_rows, total_count):
+        """체크포인트를 열고 재사용할 행을 다시 기록한다. 처음으로 수집할 인덱스를 반환."""
+        self.checkpoint.open(fresh=not resume)
+        if not resume or stored_total is None:
+            self.checkpoint.write_meta(total_count)
+        for index, item in reused_rows.items():
+            self.checkpoint.append(index, item)
+            stored_rows[index] = item
+        for index, item in sorted(stored_rows.items()):
+            if index < total_count:
+                self.collected_data.append(item)
+                self._rows_by_index[index] = item
+                if self._stream_writer:
+                    self._stream_writer.add(index, item)
+        return first_missing_index(stored_rows, total_count)
+
+    async def _collect_sharded(self, helpers, target_url, start_index, total_count, update_log_and_progress):
+        # [start_index, total_count)를 세션 수만큼 연속 구간으로 나눠 각 세션이 자기 구간 시작점으로 이동 후 동시에 수집한다.
+        sessions = [self, *helpers]
+        shard_size = -(-(total_count - start_index) // len(sessions))
+        ranges = [
+            (start_index + k * shard_size, min(total_count, start_index + (k + 1) * shard_size))
+            for k in range(len(sessions))
+        ]
+        shards = [(number, session, start, end) for number, (session, (start, end)) in enumerate(zip(sessions, ranges), 1) if start < end]
+        await update_log_and_progress(
+            0.4, "샤드 분할 수집: " + ", ".join(f"#{number} {start + 1}~{end}" for number, _, start, end in shards)
+        )
+
+        async def run_shard(number, session, start, end):
+            async def report(i, message, level="info", step=None):
+                # 진행률은 모든 샤드가 수집한 행 수를 합산해 0.4~0.9 구간에 반영
+                done = len(self._rows_by_index)
+                await update_log_and_progress(0.4 + (done / total_count) * 0.5, f"[샤드 {number}] {message}", level, step, i)
+
+            if session is not self:
+                session.metrics = self.metrics
+                session.schema = self.schema
+                session.fast_path = self.fast_path
+                session._stop_requested = self._stop_requested
+                session.is_running = not self._stop_requested
+                session.current_exam_id = self.current_exam_id
+                await session.run_blocking(session.driver.get, target_url)
+                session._position = 0
+            await session.run_blocking(session._seek_to, start)
+            return await session._collect_range(start, end, total_count, report, self._collect_data_item, self._rows_by_index)
+
+        self._helpers = list(helpers)
+        try:
+            results = await asyncio.gather(*(run_shard(*shard) for shard in shards), return_exceptions=True)
+        finally:
+            self._helpers = []
+        for (number, _, start, end), result in zip(shards, results):
+            if isinstance(result, Exception):
+                await update_log_and_progress(
+                    0.9, f"[샤드 {number}] {start + 1}~{end} 구간 수집 중 오류: {result}", "error"
+                )
+
+    async def _collect_range(self, start_index, end_index, total_count, report, collect, skip):
+        """[start_index, end_index) 구간을 순회하며 수집한다. 현재 위치가 start_index여야 한다.
+
+        실패한 학생은 종류별로 복구하며 재시도하고, 그래도 실패하면 건너뛰었다가 순회가 끝난 뒤 한 번 더 모아서 수집한다.
+        """
+        collected = 0
+        failed = []
+        fast = {
+            "config": build_config(self.schema, self.budget, self._fast_path_xpaths()) if self.fast_path else None,
+            "misses": 0,
+        }
+        for i in range(start_index, end_index):
             if not self.is_running:
                 break
 
-            current_progress_val = 0.4 + (i / total_count) * 0.5
-            await update_log_and_progress(current_progress_val, f"{i + 1}/{total_count} 번째 항목 처리 시작...")
+            if i in skip:
+                # 체크포인트에 이미 저장된 항목은 건너뛴다.
+                if i < end_index - 1:
+                    try:
+                        await self.run_blocking(self._click_next_and_wait)
+                    except Exception as e_skip:
+                        await report(i, f"저장된 항목 건너뛰기 중 오류({describe(e_skip)}). 위치 복구 시도.", "warning", "next")
+                        if not await self._recover(await self.run_blocking(self._classify_failure, e_skip), i + 1, report):
+                            await report(i, "위치 복구 실패. 중단.", "error", "retry")
+                            break
+                continue
+
+            await report(i, f"{i + 1}/{total_count} 번째 항목 처리 시작...", step="start")
+            done, alive = await self._collect_with_retry(i, end_index, total_count, report, collect, skip, fast)
+            if done:
+                collected += 1
+            else:
+                failed.append(i)
+            if not alive:
+                remaining = [index for index in range(i + 1, end_index) if index not in skip]
+                await report(i, f"세션을 복구하지 못해 남은 {len(remaining)}개 항목 수집을 중단합니다.", "error", "retry")
+                return collected
+
+        if failed and self.retry.sweep and self.is_running:
+            collected += await self._sweep_failed(failed, total_count, report, collect, skip, fast)
+        return collected
+
+    async def _sweep_failed(self, failed, total_count, report, collect, skip, fast):
+        """본 순회에서 실패한 학생만 다시 찾아가 수집한다."""
+        await report(failed[0], f"실패한 항목 {len(failed)}개 재수집 시작: {', '.join(str(i + 1) for i in failed[:20])}", "warning", "sweep")
+        collected = 0
+        # 일시적인 오류였다면 재시도에서 막혔던 화면 상태가 풀렸을 것이므로 새로고침으로 시작한다.
+        reload = True
+        for i in failed:
+            if not self.is_running:
+                break
+            if i in skip:
+                continue
+            try:
+                if not await self.run_blocking(self._reposition, i, reload):
+                    break
+            except Exception as e_seek:
+                if not await self._recover(await self.run_blocking(self._classify_failure, e_seek), i, report):
+                    await report(i, "재수집 위치로 이동하지 못해 중단합니다.", "error", "sweep")
+                    break
+            reload = False
+            await report(i, f"{i + 1}/{total_count} 번째 항목 재수집...", step="start")
+            done, alive = await self._collect_with_retry(i, i + 1, total_count, report, collect, skip, fast)
+            if done:
+                collected += 1
+            if not alive:
+                break
+        missing = [i for i in failed if i not in skip]
+        if missing:
+            await report(missing[0], f"재수집 후에도 실패한 항목 {len(missing)}개: {', '.join(str(i + 1) for i in missing[:20])}", "error", "sweep")
+        else:
+            await report(failed[-1], f"실패했던 항목 {len(failed)}개를 모두 재수집했습니다.", step="sweep")
+        return collected
 
+    async def _collect_with_retry(self, i, end_index, total_count, report, collect, skip, fast):
+        """학생 i를 수집한다. (수집 여부, 세션 사용 가능 여부)를 반환하며, 반환 시 위치는 다음 학생이다."""
+        for attempt in range(1, self.retry.max_attempts + 1):
             try:
-                student_name_element_xpath = '//*[@id="app"]/main/section/div/div[2]/div/div[2]/div[1]/strong'
-                student_name_element = self.wait.until(
-                    EC.visibility_of_element_located((By.XPATH, student_name_element_xpath))
+                await self._collect_item(i, end_index, total_count, report, collect, fast)
+                return True, True
+            except Exception as e_item:
+                kind = await self.run_blocking(self._classify_failure, e_item)
+                self.metrics.failure(kind)
+                # 행은 이미 저장되고 이동 단계에서 실패했다면 다시 수집하지 않고 다음 위치로만 복구한다.
+                done = i in skip
+                give_up = done or attempt == self.retry.max_attempts
+                await report(
+                    i,
+                    f"{i + 1}번째 항목 처리 중 오류 [{kind}] (시도 {attempt}/{self.retry.max_attempts}): {describe(e_item)}",
+                    "error" if give_up and not done else "warning",
+                    "retry",
                 )
-                student_name = student_name_element.text.strip()
-                await update_log_and_progress(current_progress_val, f"이름: {student_name}")
+                target = i + 1 if give_up else i
+                if target >= end_index or not self.is_running:
+                    return done, True
+                await asyncio.sleep(self.retry.delay(attempt))
+                if not await self._recover(kind, target, report):
+                    return done, False
+                if give_up:
+                    return done, True
+        return False, True
 
-                blog_link = ""
-                try:
-                    answer_view_button_xpath = '//*[@id="app"]/main/section/div/div[2]/div/div[4]/div/div/table/tbody/tr/td[6]/button'
-                    answer_view_button = self.wait.until(
-                        EC.element_to_be_clickable((By.XPATH, answer_view_button_xpath))
-                    )
-                    self.driver.execute_script("arguments[0].click();", answer_view_button)
-                    await update_log_and_progress(current_progress_val, "과제 내용 보기 버튼 클릭.")
-                    await asyncio.sleep(0.5)
-
-                    blog_link_element_xpath = '//*[@id=\"modals\"]/section/div/div/div/div[2]/ul/li[2]/div/p'
-                    blog_link_element = self.wait.until(
-                        EC.visibility_of_element_located((By.XPATH, blog_link_element_xpath))
-                    )
-                    blog_link = blog_link_element.text.strip()
-                    await update_log_and_progress(
-                        current_progress_val, f"블로그 링크/내용 수집: {blog_link[:50] if blog_link else ''}..."
-                    )
-
-                    close_modal_xpath_1 = '//*[@id="modals"]/section/div/div/div/div[1]/button'
-                    close_modal_button_1 = self.wait.until(
-                        EC.element_to_be_clickable((By.XPATH, close_modal_xpath_1))
-                    )
-                    self.driver.execute_script("arguments[0].click();", close_modal_button_1)
-                    await update_log_and_progress(current_progress_val, "첫 번째 모달 닫기.")
-                    await asyncio.sleep(0.5)
-                except TimeoutException:
-                    await update_log_and_progress(
-                        current_progress_val, f"{student_name}: 블로그 링크 수집 중 Timeout (항목 없음 가능성)"
-                    )
-                except Exception as e_blog:
-                    await update_log_and_progress(
-                        current_progress_val, f"{student_name}: 블로그 링크 수집 중 오류 - {e_blog}"
-                    )
-
-                self._collect_data_item(student_name, blog_link)
-                collected_data_count_local += 1
+    async def _recover(self, kind, index, report):
+        """실패 종류에 맞게 세션을 되살리고 index 위치로 돌아간다. 모든 방법이 실패하면 False."""
+        # 가벼운 방법부터: 모달만 닫고 제자리 → 상세 페이지 새로고침 → 재로그인(드라이버 재시작)
+        if kind in ("session_expired", "driver_crash"):
+            actions = ["relogin", "relogin"]
+        else:
+            actions = ["in_place", "reload", "relogin"]
+        for attempt, action in enumerate(actions, 1):
+            if not self.is_running:
+                return False
+            try:
+                if action == "relogin":
+                    await report(index, f"세션 복구({kind}): 재로그인 후 {index + 1}번째 항목으로 이동합니다.", "warning", "retry")
+                    # login_process가 작업 상태를 초기화하므로 진행 중인 작업 정보를 되돌려 놓는다.
+                    exam_id = self.current_exam_id
+                    # 로그인 만료가 원인이면 저장된 쿠키도 무효이므로 로그인 폼부터 진행한다.
+                    await self.run_blocking(self.login_process, kind == "driver_crash")
+                    self.current_exam_id = exam_id
+                    # 재로그인 중에 들어온 중지 요청은 되살리지 않는다.
+                    self.is_running = not self._stop_requested
+                    if not self.is_running:
+                        return False
+                if await self.run_blocking(self._reposition, index, action != "in_place"):
+                    RECOVERIES.inc(action=action)
+                    return True
+                return False
+            except Exception as e_recover:
+                await report(index, f"복구({action}) 실패: {describe(e_recover)}", "warning", "retry")
+                if attempt < len(actions):
+                    await asyncio.sleep(self.retry.delay(attempt))
+        return False
 
-                try:
-                    close_modal_xpath_2 = '//*[@id="modals"]/section[2]/div/div/section/div/button[2]'
-                    close_modal_button_2 = WebDriverWait(self.driver, 2).until(
-                        EC.element_to_be_clickable((By.XPATH, close_modal_xpath_2))
-                    )
-                    self.driver.execute_script("arguments[0].click();", close_modal_button_2)
-                    await update_log_and_progress(current_progress_val, "두 번째 모달 닫기.")
-                    await asyncio.sleep(0.5)
-                except TimeoutException:
-                    pass
-                except Exception as e_modal2:
-                    await update_log_and_progress(
-                        current_progress_val, f"{student_name}: 두 번째 모달 닫기 중 오류 - {e_modal2}"
-                    )
-
-                if i < total_count - 1:
-                    next_button_xpath = '//*[@id="app"]/main/section/div/div[2]/div/div[2]/div[2]/button[2]'
-                    next_button = self.wait.until(
-                        EC.element_to_be_clickable((By.XPATH, next_button_xpath))
-                    )
-                    self.driver.execute_script("arguments[0].click();", next_button)
-                    await update_log_and_progress(current_progress_val, "다음 항목으로 이동.")
-                    await asyncio.sleep(1)
+    def _classify_failure(self, exc):
+        kind = classify_failure(exc)
+        if kind == "driver_crash":
+            return kind
+        try:
+            current_url = self.driver.current_url
+        except Exception:
+            return "driver_crash"
+        # 로그인이 만료되면 LMS가 로그인 페이지로 돌려보내 요소 대기가 시간 초과로 끝난다.
+        return "session_expired" if "/sign-in" in current_url else kind
 
-            except Exception as e_item:
-                await update_log_and_progress(current_progress_val, f"{i + 1}번째 항목 처리 중 주 오류: {e_item}")
-                if i < total_count - 1:
-                    try:
-                        next_button_xpath_err = '//*[@id="app"]/main/section/div/div[2]/div/div[2]/div[2]/button[2]'
-                        next_button_err = self.wait.until(
-                            EC.element_to_be_clickable((By.XPATH, next_button_xpath_err))
-                        )
-                        self.driver.execute_script("arguments[0].click();", next_button_err)
-                        await update_log_and_progress(current_progress_val, "오류 후 다음 항목 강제 이동 시도.")
-                        await asyncio.sleep(1)
-                    except Exception as e_next_err:
-                        await update_log_and_progress(current_progress_val, f"강제 이동 중 추가 오류({e_next_err}). 중단.")
-                        break
-                continue
+    def _current_index(self):
+        text = self.driver.execute_script(
+            "const n = document.evaluate(arguments[0], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null)"
+            ".singleNodeValue; return n ? n.textContent : null;",
+            XPATH_PAGINATION,
+        )
+        try:
+            return int(text.split("/")[0].strip()) - 1
+        except (AttributeError, ValueError):
+            return None
 
-        await update_log_and_progress(0.9, f"크롤링 완료. 총 {collected_data_count_local}개 데이터 수집.")
-        return collected_data_count_local
+    def _reposition(self, index, reload=False):
+        """index번째 학생 화면으로 돌아간다. 열린 모달은 닫고, 이미 지나쳤거나 위치를 모르면 페이지를 새로 연다."""
+        if not reload:
+            self.driver.execute_script(
+                "for (const xpath of arguments) { const n = document.evaluate(xpath, document, null, "
+                "XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue; if (n) n.click(); }",
+                XPATH_CLOSE_MODAL_2,
+                XPATH_CLOSE_MODAL_1,
+            )
+            current = self._current_index()
+            if current is None or current > index:
+                reload = True
+            else:
+                self._position = current
+        if reload:
+            self.driver.get(f"{LMS_BASE_URL}/exams/{self.current_exam_id}/detail")
+            self._wait_text(XPATH_PAGINATION, EC.presence_of_element_located, self._wait("page"))
+            self._position = 0
+        return self._seek_to(index)
+
+    async def _collect_item(self, i, end_index, total_count, report, collect, fast):
+        """학생 i 한 명을 수집하고 다음 학생으로 이동한다. 복구가 필요한 오류는 그대로 올려 보낸다."""
+        if fast["config"] is not None:
+            if await self._collect_fast(i, end_index, fast["config"], report, collect):
+                fast["misses"] = 0
+                return
+            fast["misses"] += 1
+            if fast["misses"] >= FAST_PATH_MAX_MISSES:
+                fast["config"] = None
+                await report(i, "빠른 경로가 연속으로 실패해 남은 항목은 단계별로 처리합니다.", "warning")
+
+        with self.metrics.step("name"):
+            page_values, _ = await self.run_blocking(self._read_fields, "page", "name")
+        student_name = page_values[self.schema.key]
+        await report(i, f"이름: {student_name}", step="name")
+
+        modal_values = self.schema.empty("modal")
+        # 모달 필드가 없는 스키마는 답안 모달을 열지 않는다.
+        second_modal_open = None if self.schema.has_modal else False
+        if self.schema.has_modal:
+            try:
+                with self.metrics.step("answer_button"):
+                    await self.run_blocking(self._click_when_clickable, XPATH_ANSWER_BUTTON, self._wait("answer_button"))
+                await report(i, "과제 내용 보기 버튼 클릭.", step="answer_button")
+
+                with self.metrics.step("modal"):
+                    modal_values, missing = await self.run_blocking(self._read_fields, "modal", "modal")
+                preview = str(modal_values[self.schema.modal_ready.name])
+                await report(i, f"답안 내용 수집: {preview[:50]}...", step="modal")
+                if missing:
+                    await report(i, f"{student_name}: 찾지 못한 필드 - {', '.join(missing)}", "warning", "modal")
+
+                with self.metrics.step("modal_close"):
+                    second_modal_open = await self.run_blocking(self._close_answer_modal)
+                await report(i, "첫 번째 모달 닫기.", step="modal_close")
+            except TimeoutException:
+                await report(i, f"{student_name}: 답안 수집 중 Timeout (항목 없음 가능성)", "warning", "modal")
+            except Exception as e_blog:
+                # 세션/요소 문제는 빈 답안으로 저장하지 않고 재시도한다.
+                if classify_failure(e_blog) != "other":
+                    raise
+                await report(i, f"{student_name}: 답안 수집 중 오류 - {e_blog}", "warning", "modal")
+
+        await self.run_blocking(collect, {**page_values, **modal_values}, i)
+
+        # 첫 번째 모달을 정상적으로 닫았다면 두 번째 모달 여부는 이미 알고 있으므로 추가 대기가 없다.
+        if second_modal_open is not False:
+            try:
+                with self.metrics.step("second_modal"):
+                    await self.run_blocking(self._close_second_modal)
+                await report(i, "두 번째 모달 닫기.", step="second_modal")
+            except TimeoutException:
+                pass
+            except Exception as e_modal2:
+                await report(i, f"{student_name}: 두 번째 모달 닫기 중 오류 - {e_modal2}", "warning", "second_modal")
+
+        if i < end_index - 1:
+            with self.metrics.step("next"):
+                await self.run_blocking(self._click_next_and_wait)
+            await report(i, "다음 항목으로 이동.", step="next")
+
+    def _fast_path_xpaths(self):
+        return {
+            "name": XPATH_STUDENT_NAME,
+            "pagination": XPATH_PAGINATION,
+            "answer": XPATH_ANSWER_BUTTON,
+            "blog": XPATH_BLOG_LINK,
+            "close1": XPATH_CLOSE_MODAL_1,
+            "close2": XPATH_CLOSE_MODAL_2,
+            "next": XPATH_NEXT_BUTTON,
+        }
+
+    async def _collect_fast(self, i, end_index, config, report, collect):
+        """스크립트 한 번으로 학생 한 명을 처리한다. 페이지 상태를 바꾸기 전에 실패하면 False (단계별로 다시 처리)."""
+        advance = i < end_index - 1
+        try:
+            with self.metrics.step("student"):
+                result = await self.run_blocking(run_student, self.driver, config, advance)
+        except Exception as e_script:
+            result = {"page": None, "miss": "script", "error": str(e_script)}
+        miss = result.get("miss")
+        if result.get("page") is None or miss in ("answer_button", "script"):
+            FAST_PATH_FALLBACKS.inc(step=miss)
+            detail = f": {result['error']}" if result.get("error") else ""
+            await report(i, f"빠른 경로 실패 ({miss}{detail}), 단계별 처리로 전환.", "warning", miss)
+            return False
+
+        page_values, _ = self.schema.process("page", result["page"])
+        if result.get("modal"):
+            modal_values, missing = self.schema.process("modal", result["modal"])
+        else:
+            modal_values, missing = self.schema.empty("modal"), []
+        student_name = page_values[self.schema.key]
+        await self.run_blocking(collect, {**page_values, **modal_values}, i)
+        await report(i, f"이름: {student_name}", step="name")
+        if result.get("modalTimeout"):
+            self.metrics.timeout("modal")
+            await report(i, f"{student_name}: 답안 수집 중 Timeout (항목 없음 가능성)", "warning", "modal")
+        elif self.schema.has_modal:
+            preview = str(modal_values[self.schema.modal_ready.name])
+            await report(i, f"답안 내용 수집: {preview[:50]}...", step="modal")
+            if missing:
+                await report(i, f"{student_name}: 찾지 못한 필드 - {', '.join(missing)}", "warning", "modal")
+
+        if miss:
+            # 행은 이미 읽었으므로 남은 단계(모달 닫기/다음)만 단계별로 마무리한다.
+            FAST_PATH_FALLBACKS.inc(step=miss)
+            self.metrics.timeout(miss)
+            await report(i, f"{student_name}: 빠른 경로 '{miss}' 단계 실패, 단계별로 마무리합니다.", "warning", miss)
+            try:
+                if miss == "modal_close" and await self.run_blocking(self._close_answer_modal):
+                    await self.run_blocking(self._close_second_modal)
+                elif miss == "second_modal":
+                    await self.run_blocking(self._close_second_modal)
+            except Exception as e_modal:
+                await report(i, f"{student_name}: 모달 닫기 중 오류 - {e_modal}", "warning", miss)
+            if advance:
+                with self.metrics.step("next"):
+                    if miss == "next_wait":
+                        # 다음 버튼은 이미 눌렸으므로 다시 누르면 한 명을 건너뛴다. 페이지네이션으로 실제 위치를 보고 맞춘다.
+                        await self.run_blocking(self._reposition, i + 1)
+                    else:
+                        await self.run_blocking(self._click_next_and_wait)
+        elif advance:
+            self._position += 1
+        if advance:
+            await report(i, "다음 항목으로 이동.", step="next")
+        return True
 
     def cleanup(self):
         self._add_log("클린업 프로세스 시작...")
@@ -349,9 +1019,13 @@ class FastCampusLMSCrawler:
                 self.driver.quit()
                 self._add_log("드라이버 종료 완료.")
             except Exception as e:
-                self._add_log(f"드라이버 종료 중 오류: {e}")
+                self._add_log(f"드라이버 종료 중 오류: {e}", level="warning")
         self.driver = None
         self.is_running = False
         self.current_exam_id = None
 
+    def close(self):
+        self.cleanup()
+        self._executor.shutdown(wait=False)
+
 
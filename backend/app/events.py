@@ -0,0 +1,89 @@
+import asyncio
+import json
+import os
+from collections import OrderedDict, deque
+
+
+class Subscriber:
+    """구독자별 대기열. 로그 등은 최대 max_pending개까지 보관하고, 진행률은 작업별 최신 값만 남긴다."""
+
+    def __init__(self, channel=None, max_pending=1000):
+        self.channel = channel
+        self.max_pending = max_pending
+        self.dropped = 0
+        self._events = deque()
+        self._progress = {}
+        self._ready = asyncio.Event()
+
+    def push(self, event):
+        if event.get("type") == "progress":
+            # 오래된 진행률은 보낼 필요가 없으므로 덮어쓴다.
+            self._progress[event.get("job_id")] = event
+        else:
+            if len(self._events) >= self.max_pending:
+                self._events.popleft()
+                self.dropped += 1
+            self._events.append(event)
+        self._ready.set()
+
+    def drain(self):
+        events = list(self._events) + list(self._progress.values())
+        self._events.clear()
+        self._progress.clear()
+        self._ready.clear()
+        return events
+
+    async def next_batch(self, interval):
+        await self._ready.wait()
+        # 첫 이벤트 이후 interval 동안 쌓인 이벤트를 한 프레임으로 묶는다.
+        await asyncio.sleep(interval)
+        return self.drain()
+
+
+class EventBus:
+    """작업 이벤트를 구독자별 대기열로 나눠 주는 버스. 발행은 절대 기다리지 않는다."""
+
+    def __init__(self, replay_size=None, max_pending=None, batch_interval=None, max_channels=None):
+        self.replay_size = replay_size or int(os.getenv("EVENT_REPLAY_SIZE", "200"))
+        self.max_pending = max_pending or int(os.getenv("EVENT_QUEUE_SIZE", "1000"))
+        self.batch_interval = batch_interval or float(os.getenv("EVENT_BATCH_INTERVAL", "0.1"))
+        self.max_channels = max_channels or int(os.getenv("EVENT_MAX_CHANNELS", "200"))
+        self._subscribers = set()
+        self._recent = deque(maxlen=self.replay_size)
+        self._channels = OrderedDict()
+
+    def publish(self, event):
+        channel = event.get("job_id")
+        self._recent.append(event)
+        if channel is not None:
+            history = self._channels.get(channel)
+            if history is None:
+                history = self._channels[channel] = deque(maxlen=self.replay_size)
+                while len(self._channels) > self.max_channels:
+                    self._channels.popitem(last=False)
+            history.append(event)
+        for subscriber in self._subscribers:
+            if subscriber.channel is None or subscriber.channel == channel:
+                subscriber.push(event)
+
+    def subscribe(self, channel=None, replay=False):
+        subscriber = Subscriber(channel, self.max_pending)
+        if replay:
+            history = self._recent if channel is None else self._channels.get(channel, ())
+            for event in history:
+                subscriber.push(event)
+        self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        self._subscribers.discard(subscriber)
+
+    async def stream(self, websocket, subscriber):
+        while True:
+            events = await subscriber.next_batch(self.batch_interval)
+            if not events:
+                continue
+            if len(events) == 1:
+                await websocket.send_text(json.dumps(events[0]))
+            else:
+                await websocket.send_text(json.dumps({"type": "batch", "events": events}))
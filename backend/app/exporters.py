@@ -0,0 +1,202 @@
+import csv
+import json
+import os
+import shutil
+import time
+from xml.sax.saxutils import escape
+
+
+COLUMNS = ["수강자 이름", "블로그 링크"]
+XML_TAGS = {"수강자 이름": "name", "블로그 링크": "blog_link"}
+
+
+class CsvWriter:
+    extension = "csv"
+
+    def __init__(self, path, columns=None):
+        self.path = path
+        self.columns = columns or COLUMNS
+        self._file = open(path, "w", newline="", encoding="utf-8-sig")
+        self._writer = csv.DictWriter(self._file, fieldnames=self.columns, extrasaction="ignore")
+        self._writer.writeheader()
+
+    def write(self, row):
+        self._writer.writerow(row)
+
+    def close(self):
+        self._file.close()
+
+
+class JsonWriter:
+    """JSON 배열을 행 단위로 이어 쓴다. close() 시점에 배열을 닫는다."""
+
+    extension = "json"
+
+    def __init__(self, path, columns=None):
+        self.path = path
+        self.columns = columns or COLUMNS
+        self._file = open(path, "w", encoding="utf-8")
+        self._file.write("[")
+        self._count = 0
+
+    def write(self, row):
+        record = {column: row.get(column, "") for column in self.columns}
+        body = json.dumps(record, ensure_ascii=False, indent=4).replace("\n", "\n    ")
+        self._file.write(("," if self._count else "") + "\n    " + body)
+        self._count += 1
+
+    def close(self):
+        self._file.write("\n]\n" if self._count else "]\n")
+        self._file.close()
+
+
+class JsonLinesWriter:
+    extension = "jsonl"
+
+    def __init__(self, path, columns=None):
+        self.path = path
+        self.columns = columns or COLUMNS
+        self._file = open(path, "w", encoding="utf-8")
+
+    def write(self, row):
+        record = {column: row.get(column, "") for column in self.columns}
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def close(self):
+        self._file.close()
+
+
+class XmlWriter:
+    extension = "xml"
+
+    def __init__(self, path, columns=None, tags=None):
+        self.path = path
+        self.columns = columns or COLUMNS
+        self.tags = tags or XML_TAGS
+        self._file = open(path, "w", encoding="utf-8")
+        self._file.write('<?xml version="1.0" ?>\n<students>\n')
+
+    def write(self, row):
+        self._file.write("  <student>\n")
+        for column in self.columns:
+            tag = self.tags.get(column, column)
+            self._file.write(f"    <{tag}>{escape(str(row.get(column, '')))}</{tag}>\n")
+        self._file.write("  </student>\n")
+
+    def close(self):
+        self._file.write("</students>\n")
+        self._file.close()
+
+
+class XlsxWriter:
+    """openpyxl write-only 모드로 행을 바로 시트에 추가한다 (전체 시트를 메모리에 들고 있지 않음)."""
+
+    extension = "xlsx"
+
+    def __init__(self, path, columns=None):
+        from openpyxl import Workbook
+
+        self.path = path
+        self.columns = columns or COLUMNS
+        self._workbook = Workbook(write_only=True)
+        self._sheet = self._workbook.create_sheet()
+        self._sheet.append(self.columns)
+
+    def write(self, row):
+        self._sheet.append([row.get(column, "") for column in self.columns])
+
+    def close(self):
+        self._workbook.save(self.path)
+        self._workbook.close()
+
+
+WRITERS = {
+    "csv": CsvWriter,
+    "json": JsonWriter,
+    "jsonl": JsonLinesWriter,
+    "xml": XmlWriter,
+    "xlsx": XlsxWriter,
+}
+
+
+def open_writer(file_format, base_filename, columns=None, tags=None):
+    """tags는 XML 요소 이름 매핑 {열 이름: 태그} (추출 스키마의 tag)."""
+    writer_class = WRITERS.get(file_format)
+    if writer_class is None:
+        return None
+    path = f"{base_filename}.{writer_class.extension}"
+    if writer_class is XmlWriter:
+        return writer_class(path, columns, tags)
+    return writer_class(path, columns)
+
+
+class OrderedRowWriter:
+    """인덱스 순서대로 writer들에 전달한다. 샤드/재개로 행이 순서 없이 도착해도 파일은 원래 순서를 유지한다."""
+
+    def __init__(self, writers):
+        self.writers = list(writers)
+        self.paths = [writer.path for writer in self.writers]
+        # writer별 누적 기록 시간(초). 형식별 내보내기 소요 시간 측정용
+        self.seconds = [0.0] * len(self.writers)
+        self.count = 0
+        self._next_index = 0
+        self._pending = {}
+
+    def _write(self, row):
+        for i, writer in enumerate(self.writers):
+            start = time.perf_counter()
+            writer.write(row)
+            self.seconds[i] += time.perf_counter() - start
+        self.count += 1
+
+    def add(self, index, row):
+        if index < self._next_index:
+            return
+        self._pending[index] = row
+        while self._next_index in self._pending:
+            self._write(self._pending.pop(self._next_index))
+            self._next_index += 1
+
+    def close(self):
+        # 끝내 도착하지 않은 인덱스(수집 실패)는 건너뛰고 나머지를 순서대로 기록
+        for index in sorted(self._pending):
+            self._write(self._pending[index])
+        self._pending = {}
+        for i, writer in enumerate(self.writers):
+            start = time.perf_counter()
+            writer.close()
+            self.seconds[i] += time.perf_counter() - start
+
+
+# 다운로드 시 Content-Encoding 협상에 쓰는 사전 압축 파일 확장자
+COMPRESSED_EXTENSIONS = {"gzip": "gz", "zstd": "zst"}
+
+
+def compress_file(path, encoding):
+    """path 옆에 압축본(path.gz / path.zst)을 만든다. 지원하지 않으면 None."""
+    extension = COMPRESSED_EXTENSIONS.get(encoding)
+    if extension is None:
+        return None
+    output_path = f"{path}.{extension}"
+    if encoding == "gzip":
+        import gzip
+
+        with open(path, "rb") as src, gzip.open(output_path, "wb", compresslevel=6) as dst:
+            shutil.copyfileobj(src, dst)
+    else:
+        try:
+            import zstandard
+        except ImportError:
+            return None
+        with open(path, "rb") as src, open(output_path, "wb") as dst:
+            zstandard.ZstdCompressor(level=10).copy_stream(src, dst)
+    return output_path
+
+
+def bundle_files(paths, zip_path):
+    import zipfile
+
+    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as bundle:
+        for path in paths:
+            bundle.write(path, arcname=os.path.basename(path))
+    return zip_path
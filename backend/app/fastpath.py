@@ -0,0 +1,84 @@
+from .schema import READ_FIELDS_JS
+
+
+# 학생 한 명을 브라우저 안에서 끝까지 처리한다: 필드 읽기 → 답안 버튼 → 모달 읽기 → 모달 닫기(확인 모달 포함) → 다음.
+# 결과: {page, modal, modalTimeout, secondModal, advanced, miss, error}
+# miss는 처음으로 실패한 단계 이름이며, name/answer_button에서 실패하면 아무 상태도 바뀌지 않은 것이다.
+# 다음 이동은 next_button(버튼을 누르지 못함)과 next_wait(눌렀지만 화면 변화가 시간 안에 안 보임)으로 나눈다.
+STUDENT_SCRIPT = READ_FIELDS_JS + """
+const [cfg, done] = arguments;
+const x = cfg.xpaths;
+const t = cfg.timeouts;
+const find = (xpath) => document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+const visible = (node) => !!node && !!(node.offsetWidth || node.offsetHeight || node.getClientRects().length);
+const clickable = (xpath) => { const node = find(xpath); return visible(node) && !node.disabled ? node : null; };
+const text = (xpath) => { const node = find(xpath); return node ? node.textContent.trim() : null; };
+const waitFor = (predicate, timeoutMs) => new Promise((resolve) => {
+  const first = predicate();
+  if (first) { resolve(first); return; }
+  let timer = null;
+  const observer = new MutationObserver(() => {
+    const value = predicate();
+    if (value) { observer.disconnect(); clearTimeout(timer); resolve(value); }
+  });
+  observer.observe(document.documentElement, {subtree: true, childList: true, characterData: true, attributes: true});
+  timer = setTimeout(() => { observer.disconnect(); resolve(null); }, timeoutMs);
+});
+const result = {page: null, modal: null, modalTimeout: false, secondModal: false, advanced: false, miss: null, error: null};
+(async () => {
+  result.page = await waitFor(() => { const values = readFields(cfg.page); return values[cfg.key] != null ? values : null; }, t.name);
+  if (!result.page) { result.miss = "name"; return; }
+
+  if (cfg.modal.length) {
+    const button = await waitFor(() => clickable(x.answer), t.answer_button);
+    if (!button) { result.miss = "answer_button"; return; }
+    button.click();
+    result.modal = await waitFor(() => { const values = readFields(cfg.modal); return values[cfg.modalReady] != null ? values : null; }, t.modal);
+    if (result.modal) {
+      const close = await waitFor(() => clickable(x.close1), t.modal_close);
+      if (!close) { result.miss = "modal_close"; return; }
+      close.click();
+      const state = await waitFor(() => visible(find(x.close2)) ? "second" : (!visible(find(x.blog)) ? "closed" : null), t.modal_close);
+      if (!state) { result.miss = "modal_close"; return; }
+      result.secondModal = state === "second";
+    } else {
+      // 제출이 없는 학생: 확인 모달이 뜨는 경우만 짧게 확인
+      result.modalTimeout = true;
+      result.secondModal = !!(await waitFor(() => visible(find(x.close2)), t.second_modal));
+    }
+    if (result.secondModal) {
+      const confirm = await waitFor(() => clickable(x.close2), t.second_modal);
+      if (!confirm) { result.miss = "second_modal"; return; }
+      confirm.click();
+      if (!(await waitFor(() => !visible(find(x.close2)), t.modal_close))) { result.miss = "second_modal"; return; }
+    }
+  }
+
+  if (cfg.advance) {
+    const before = [text(x.pagination), text(x.name)];
+    const next = await waitFor(() => clickable(x.next), t.next);
+    if (!next) { result.miss = "next_button"; return; }
+    next.click();
+    const changed = await waitFor(() => text(x.pagination) !== before[0] || text(x.name) !== before[1], t.next);
+    if (!changed) { result.miss = "next_wait"; return; }
+    result.advanced = true;
+  }
+})().catch((e) => { result.miss = result.miss || "script"; result.error = String(e); }).then(() => done(result));
+"""
+
+
+def build_config(schema, budget, xpaths):
+    """작업마다 한 번 만드는 스크립트 설정. advance는 호출할 때 채운다."""
+    return {
+        "page": schema.script_args["page"],
+        "modal": schema.script_args["modal"],
+        "key": schema.key,
+        "modalReady": schema.modal_ready.name if schema.has_modal else None,
+        "xpaths": xpaths,
+        "timeouts": {step: int(seconds * 1000) for step, seconds in budget.timeouts.items()},
+        "advance": True,
+    }
+
+
+def run_student(driver, config, advance):
+    return driver.execute_async_script(STUDENT_SCRIPT, {**config, "advance": advance})
@@ -0,0 +1,199 @@
+import asyncio
+import os
+import time
+import uuid
+
+from .logbuffer import LogBuffer
+from .metrics import JOBS_FINISHED
+
+
+# 설정하면 작업별 로그를 {LOG_SINK_DIR}/job_{job_id}.jsonl 파일에도 남긴다.
+LOG_SINK_DIR = os.getenv("LOG_SINK_DIR", "")
+
+
+class CrawlJob:
+    def __init__(
+        self,
+        exam_id,
+        file_formats=("csv",),
+        compression=(),
+        bundle=False,
+        mode=None,
+        resume=False,
+        incremental=False,
+        shards=1,
+        schema=None,
+        fast_path=None,
+    ):
+        self.job_id = uuid.uuid4().hex[:12]
+        self.exam_id = exam_id
+        self.file_formats = list(file_formats)
+        self.compression = list(compression)
+        self.bundle = bundle
+        self.mode = mode
+        self.resume = resume
+        self.incremental = incremental
+        self.shards = shards
+        self.schema = schema
+        self.fast_path = fast_path
+        self.status = "queued"
+        self.progress = 0.0
+        self.description = ""
+        self.logs = LogBuffer(
+            sink_path=os.path.join(LOG_SINK_DIR, f"job_{self.job_id}.jsonl") if LOG_SINK_DIR else None
+        )
+        self.file_path = None
+        self.artifacts = []
+        self.diff_path = None
+        self.count = 0
+        self.metrics = None
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.crawler = None
+        self.task = None
+        self.cancel_requested = False
+        # 저장된 결과를 돌려준 작업이면 원래 작업 ID
+        self.cached_from = None
+
+    @property
+    def is_active(self):
+        return self.status in ("queued", "running")
+
+    def to_dict(self):
+        return {
+            "job_id": self.job_id,
+            "exam_id": self.exam_id,
+            "file_format": self.file_formats[0],
+            "file_formats": self.file_formats,
+            "compression": self.compression,
+            "bundle": self.bundle,
+            "mode": self.mode,
+            "resume": self.resume,
+            "incremental": self.incremental,
+            "shards": self.shards,
+            "columns": self.schema.columns if self.schema else None,
+            "fast_path": self.fast_path,
+            "status": self.status,
+            "progress": self.progress,
+            "description": self.description,
+            "file_path": self.file_path,
+            "artifacts": self.artifacts,
+            "diff_path": self.diff_path,
+            "count": self.count,
+            "metrics": self.metrics,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "cached_from": self.cached_from,
+        }
+
+
+class JobScheduler:
+    """작업 큐. 최대 `concurrency`개의 크롤링을 각자의 브라우저 세션에서 동시에 실행한다."""
+
+    def __init__(self, runner, concurrency=None, max_finished=None, on_finish=None):
+        self.runner = runner
+        # 작업이 끝나면(성공/실패/중지 모두) 호출된다. 결과 저장소 기록용.
+        self.on_finish = on_finish
+        self.concurrency = concurrency or int(os.getenv("CRAWL_CONCURRENCY", os.getenv("DRIVER_POOL_SIZE", "1")))
+        self.max_finished = max_finished or int(os.getenv("JOB_HISTORY_LIMIT", "100"))
+        self.jobs: dict[str, CrawlJob] = {}
+        self._semaphore = None
+        # 시험 ID -> [잠금, 대기/실행 중인 작업 수]. 체크포인트와 스냅샷이 시험 ID별 파일이므로 같은 시험은 하나씩 실행한다.
+        self._exam_locks = {}
+
+    def submit(self, exam_id, **options):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        job = CrawlJob(exam_id, **options)
+        self.jobs[job.job_id] = job
+        job.task = asyncio.create_task(self._run(job))
+        self._prune()
+        return job
+
+    def complete_from_cache(self, exam_id, entry, **options):
+        """수집 없이 저장된 결과로 바로 완료된 작업을 만든다."""
+        job = CrawlJob(exam_id, **options)
+        job.status = "completed"
+        job.progress = 1.0
+        job.description = "저장된 결과 사용"
+        job.cached_from = entry.job_id
+        job.count = entry.count
+        job.artifacts = entry.artifacts
+        job.file_path = entry.artifacts[0]["path"]
+        job.diff_path = entry.diff_path
+        job.metrics = entry.metrics
+        job.started_at = job.finished_at = time.time()
+        job.logs.add("시험 ID %s: %s에 완료된 작업 %s의 결과를 재사용합니다.", exam_id,
+                     time.strftime("%H:%M:%S", time.localtime(entry.created_at)), entry.job_id)
+        job.logs.close()
+        self.jobs[job.job_id] = job
+        self._finished(job)
+        self._prune()
+        return job
+
+    def get(self, job_id):
+        return self.jobs.get(job_id)
+
+    def active_jobs(self):
+        return [job for job in self.jobs.values() if job.is_active]
+
+    def cancel(self, job_id):
+        job = self.jobs.get(job_id)
+        if not job or not job.is_active:
+            return False
+        job.cancel_requested = True
+        if job.status == "queued":
+            job.task.cancel()
+        elif job.crawler:
+            job.crawler.stop()
+        return True
+
+    async def _run(self, job):
+        exam_lock = self._exam_locks.setdefault(job.exam_id, [asyncio.Lock(), 0])
+        exam_lock[1] += 1
+        try:
+            if exam_lock[0].locked():
+                job.description = "같은 시험의 다른 작업이 끝나기를 기다리는 중"
+            # 시험 잠금을 먼저 잡아, 기다리는 작업이 동시 실행 슬롯을 차지하지 않게 한다.
+            async with exam_lock[0], self._semaphore:
+                if job.cancel_requested:
+                    job.status = "cancelled"
+                    return
+                job.status = "running"
+                job.started_at = time.time()
+                await self.runner(job)
+                if job.cancel_requested:
+                    job.status = "cancelled"
+                elif job.status == "running":
+                    job.status = "completed" if job.file_path else "failed"
+        except asyncio.CancelledError:
+            job.status = "cancelled"
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e) if str(e) else type(e).__name__
+        finally:
+            exam_lock[1] -= 1
+            if not exam_lock[1]:
+                del self._exam_locks[job.exam_id]
+            job.crawler = None
+            job.finished_at = time.time()
+            job.logs.close()
+            JOBS_FINISHED.inc(status=job.status)
+            self._finished(job)
+
+    def _finished(self, job):
+        if self.on_finish is None:
+            return
+        try:
+            self.on_finish(job)
+        except Exception as e:
+            print(f"⚠️ 작업 종료 처리 실패 ({job.job_id}): {e}")
+
+    def _prune(self):
+        finished = [job for job in self.jobs.values() if not job.is_active]
+        for job in sorted(finished, key=lambda j: j.created_at)[: max(0, len(finished) - self.max_finished)]:
+            del self.jobs[job.job_id]
@@ -0,0 +1,89 @@
+import json
+import os
+import time
+from collections import deque
+
+
+LEVELS = {"debug": 10, "info": 20, "warning": 30, "error": 40}
+
+
+class LogRecord:
+    __slots__ = ("seq", "ts", "level", "step", "index", "_message", "_args")
+
+    def __init__(self, seq, level, message, args=(), step=None, index=None):
+        self.seq = seq
+        self.ts = time.monotonic()
+        self.level = level
+        self.step = step
+        self.index = index
+        self._message = message
+        self._args = args
+
+    @property
+    def message(self):
+        # 포맷팅은 실제로 조회될 때 한 번만 수행한다.
+        if self._args:
+            self._message = self._message % self._args
+            self._args = ()
+        return self._message
+
+    def to_dict(self, clock_offset):
+        return {
+            "seq": self.seq,
+            "time": round(self.ts + clock_offset, 3),
+            "level": self.level,
+            "step": self.step,
+            "index": self.index,
+            "message": self.message,
+        }
+
+
+class LogBuffer:
+    """최근 capacity개의 구조화된 로그만 보관하는 링 버퍼. 필요하면 JSON Lines 파일에도 기록한다."""
+
+    def __init__(self, capacity=None, sink_path=None):
+        self.capacity = capacity or int(os.getenv("LOG_BUFFER_SIZE", "1000"))
+        self._records = deque(maxlen=self.capacity)
+        self._next_seq = 0
+        # monotonic 시각을 벽시계 시각으로 바꾸기 위한 보정값
+        self._clock_offset = time.time() - time.monotonic()
+        self._sink = None
+        if sink_path:
+            os.makedirs(os.path.dirname(sink_path) or ".", exist_ok=True)
+            self._sink = open(sink_path, "a", encoding="utf-8", buffering=1)
+
+    def add(self, message, *args, level="info", step=None, index=None):
+        record = LogRecord(self._next_seq, level, message, args, step, index)
+        self._next_seq += 1
+        self._records.append(record)
+        if self._sink:
+            self._sink.write(json.dumps(record.to_dict(self._clock_offset), ensure_ascii=False) + "\n")
+        return record
+
+    @property
+    def dropped(self):
+        return self._next_seq - len(self._records)
+
+    def query(self, cursor=0, level=None, limit=100):
+        """cursor(seq) 이후의 로그를 level 이상만 최대 limit개 반환. (records, next_cursor)"""
+        min_level = LEVELS.get(level, 0)
+        records = []
+        next_cursor = max(cursor, self.dropped)
+        for record in self._records:
+            if record.seq < cursor:
+                continue
+            next_cursor = record.seq + 1
+            if LEVELS.get(record.level, 0) < min_level:
+                continue
+            records.append(record.to_dict(self._clock_offset))
+            if len(records) >= limit:
+                break
+        return records, next_cursor
+
+    def tail(self, count=20):
+        return [record.message for record in list(self._records)[-count:]]
+
+    def close(self):
+        if self._sink:
+            self._sink.close()
+            self._sink = None
@@ -1,12 +1,10 @@
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, BackgroundTasks
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Request
+from fastapi.responses import FileResponse, PlainTextResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 import asyncio
-import json
 import os
-from typing import Optional
+from typing import Optional, Union
 import time
 
 try:
@@ -16,7 +14,16 @@ try:
 except Exception:
     print("⚠️ python-dotenv가 설치되지 않았거나 로드 실패. 시스템 환경변수만 사용됩니다.")
 
-from .crawler import FastCampusLMSCrawler
+from .api_extractor import api_mode_available
+from .artifacts import etag as artifact_etag, resolve as resolve_artifact
+from .exporters import COMPRESSED_EXTENSIONS, WRITERS
+from .events import EventBus
+from .jobs import JobScheduler
+from .logbuffer import LEVELS
+from .metrics import REGISTRY
+from .pool import DriverPool
+from .results import ResultStore
+from .schema import ExtractionSchema
 
 
 app = FastAPI(title="FastCampus LMS Crawler API", version="2.0.0")
@@ -34,36 +41,45 @@ app.add_middleware(
 
 
 class CrawlRequest(BaseModel):
-    exam_id: str
+    exam_id: Optional[str] = None
+    exam_ids: list[str] = []
     file_format: str = "csv"
+    file_formats: list[str] = []
+    compression: Optional[list[str]] = None
+    bundle: bool = False
+    mode: Optional[str] = None
+    resume: bool = False
+    incremental: bool = False
+    shards: int = 1
+    # 추출 스키마: [{name, selector, by?, attribute?, scope?, multiple?, post?, tag?, api_keys?, key?}, ...]
+    # 요청 JSON의 키는 schema. BaseModel.schema와 겹치지 않도록 필드 이름만 바꾼다.
+    extraction_schema: Optional[Union[list[dict], dict]] = Field(None, alias="schema")
+    fast_path: Optional[bool] = None
+    # true면 저장된 결과가 있어도 새로 수집한다.
+    force: bool = False
+
+
+event_bus = EventBus()
 
+# 정적 파일은 프론트에서 처리하므로 서버에서는 제공하지 않음
 
-class ConnectionManager:
-    def __init__(self):
-        self.active_connections: list[WebSocket] = []
-
-    async def connect(self, websocket: WebSocket):
-        await websocket.accept()
-        self.active_connections.append(websocket)
-
-    def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-
-    async def send_message(self, message: str):
-        for connection in list(self.active_connections):
-            try:
-                await connection.send_text(message)
-            except Exception:
-                if connection in self.active_connections:
-                    self.active_connections.remove(connection)
+driver_pool = DriverPool()
+result_store = ResultStore()
+# 작업에서 압축 형식을 지정하지 않았을 때 만들 사전 압축본 (다운로드 시 Content-Encoding으로 전송)
+DEFAULT_COMPRESSION = [e.strip() for e in os.getenv("EXPORT_COMPRESSION", "gzip").split(",") if e.strip()]
 
 
-manager = ConnectionManager()
+@app.on_event("startup")
+async def start_driver_pool():
+    # 앱 기동과 동시에 로그인된 세션을 준비해 첫 수집의 드라이버 기동/로그인 비용을 없앤다.
+    asyncio.create_task(driver_pool.start())
+    result_store.start()
 
-# 정적 파일은 프론트에서 처리하므로 서버에서는 제공하지 않음
 
-crawler_instance: Optional[FastCampusLMSCrawler] = None
+@app.on_event("shutdown")
+async def stop_driver_pool():
+    await result_store.stop()
+    await driver_pool.stop()
 
 
 @app.get("/api/health")
@@ -71,111 +87,393 @@ async def health_check():
     return {"status": "ok"}
 
 
-@app.websocket("/ws")
-async def websocket_endpoint(websocket: WebSocket):
-    await manager.connect(websocket)
+async def _serve_events(websocket: WebSocket, channel: Optional[str], replay: bool):
+    # 전송은 구독자별 태스크가 맡으므로 느린 클라이언트가 크롤링 루프를 막지 않는다.
+    await websocket.accept()
+    subscriber = event_bus.subscribe(channel, replay=replay)
+    sender = asyncio.create_task(event_bus.stream(websocket, subscriber))
     try:
         while True:
             await websocket.receive_text()
     except WebSocketDisconnect:
-        manager.disconnect(websocket)
+        pass
+    finally:
+        sender.cancel()
+        event_bus.unsubscribe(subscriber)
+
+
+@app.websocket("/ws")
+async def websocket_endpoint(websocket: WebSocket, replay: bool = False):
+    await _serve_events(websocket, None, replay)
+
+
+@app.websocket("/ws/{job_id}")
+async def job_websocket_endpoint(websocket: WebSocket, job_id: str, replay: bool = True):
+    await _serve_events(websocket, job_id, replay)
 
 
 @app.post("/api/crawl")
-async def start_crawl(request: CrawlRequest, background_tasks: BackgroundTasks):
-    global crawler_instance
+async def start_crawl(request: CrawlRequest):
+    exam_ids = list(request.exam_ids)
+    if request.exam_id:
+        exam_ids.insert(0, request.exam_id)
+    exam_ids = [exam_id.strip() for exam_id in exam_ids]
 
-    if not request.exam_id.isdigit():
+    if not exam_ids or not all(exam_id.isdigit() for exam_id in exam_ids):
         raise HTTPException(status_code=400, detail="올바른 시험 ID(숫자)를 입력하세요.")
 
-    if crawler_instance and crawler_instance.is_running:
-        raise HTTPException(status_code=409, detail="이미 다른 크롤링 작업이 실행 중입니다.")
+    if request.shards < 1:
+        raise HTTPException(status_code=400, detail="shards는 1 이상이어야 합니다.")
+
+    if request.mode not in (None, "selenium", "api"):
+        raise HTTPException(status_code=400, detail="mode는 selenium 또는 api 중 하나여야 합니다.")
 
-    background_tasks.add_task(run_crawling_task, request.exam_id, request.file_format)
-    return {"message": "크롤링이 시작되었습니다.", "exam_id": request.exam_id}
+    if request.mode == "api" and not api_mode_available():
+        # 세션이 네트워크 이벤트를 기록하지 않으면 API를 찾지 못하고 매번 selenium으로 대체된다.
+        raise HTTPException(
+            status_code=400, detail="api 모드를 쓰려면 LMS_API_CAPTURE=true 또는 LMS_API_SUBMISSIONS_URL을 설정하세요."
+        )
+
+    file_formats = list(dict.fromkeys(request.file_formats or [request.file_format]))
+    unsupported = [file_format for file_format in file_formats if file_format not in WRITERS]
+    if unsupported:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 파일 형식: {', '.join(unsupported)}")
+
+    compression = request.compression if request.compression is not None else DEFAULT_COMPRESSION
+    if any(encoding not in COMPRESSED_EXTENSIONS for encoding in compression):
+        raise HTTPException(status_code=400, detail="compression은 gzip, zstd 중에서 선택하세요.")
+
+    schema = None
+    if request.extraction_schema is not None:
+        try:
+            schema = ExtractionSchema.load(request.extraction_schema)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"잘못된 추출 스키마: {e}")
+
+    options = dict(
+        file_formats=file_formats,
+        compression=compression,
+        bundle=request.bundle,
+        mode=request.mode,
+        resume=request.resume,
+        incremental=request.incremental,
+        shards=request.shards,
+        schema=schema,
+        fast_path=request.fast_path,
+    )
+    # 이어받기/증분 수집은 새로 수집하라는 뜻이므로 저장된 결과를 쓰지 않는다.
+    use_cache = not (request.force or request.resume or request.incremental)
+    signature = ResultStore.signature(file_formats, compression, request.bundle, schema)
+    jobs = []
+    for exam_id in exam_ids:
+        entry = result_store.lookup(exam_id, signature) if use_cache else None
+        if entry is None:
+            jobs.append(scheduler.submit(exam_id, **options))
+            continue
+        job = scheduler.complete_from_cache(exam_id, entry, **options)
+        jobs.append(job)
+        event_bus.publish({
+            "type": "complete",
+            "job_id": job.job_id,
+            "exam_id": exam_id,
+            "message": f"저장된 결과 사용! {job.count}개 데이터 (작업 {entry.job_id})",
+            "file_path": job.file_path,
+            "artifacts": job.artifacts,
+            "count": job.count,
+            "metrics": job.metrics,
+            "cached_from": entry.job_id,
+        })
+
+    cached = sum(1 for job in jobs if job.cached_from)
+    return {
+        "message": f"크롤링 작업 {len(jobs)}개가 등록되었습니다." + (f" (저장된 결과 {cached}개 재사용)" if cached else ""),
+        "exam_id": jobs[0].exam_id,
+        "job_id": jobs[0].job_id,
+        "jobs": [job.to_dict() for job in jobs],
+    }
 
 
 @app.post("/api/stop")
 async def stop_crawl():
-    global crawler_instance
-
-    if not crawler_instance or not crawler_instance.is_running:
+    active_jobs = scheduler.active_jobs()
+    if not active_jobs:
         return {"message": "현재 실행 중인 크롤링 작업이 없습니다."}
 
-    crawler_instance.cleanup()
-    await manager.send_message(
-        json.dumps({"type": "info", "message": "크롤링 중지 요청됨. 드라이버가 종료되었습니다."})
+    for job in active_jobs:
+        scheduler.cancel(job.job_id)
+        event_bus.publish(
+            {"type": "info", "job_id": job.job_id, "message": "크롤링 중지 요청됨. 현재 항목 처리 후 종료됩니다."}
+        )
+    return {"message": f"크롤링 작업 {len(active_jobs)}개가 중지되었습니다."}
+
+
+@app.post("/api/stop/{job_id}")
+async def stop_job(job_id: str):
+    job = scheduler.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    if not scheduler.cancel(job_id):
+        return {"message": "이미 종료된 작업입니다.", "job": job.to_dict()}
+
+    event_bus.publish(
+        {"type": "info", "job_id": job_id, "message": "크롤링 중지 요청됨. 현재 항목 처리 후 종료됩니다."}
     )
-    return {"message": "크롤링이 중지되었습니다."}
+    return {"message": "크롤링이 중지되었습니다.", "job": job.to_dict()}
+
+
+@app.get("/api/metrics")
+async def get_metrics():
+    # Prometheus 텍스트 형식
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
 
 
 @app.get("/api/status")
 async def get_status():
-    global crawler_instance
-    if not crawler_instance:
-        return {"is_running": False, "current_exam_id": None}
-    return {"is_running": crawler_instance.is_running, "current_exam_id": crawler_instance.current_exam_id}
+    running = [job for job in scheduler.jobs.values() if job.status == "running"]
+    return {
+        "is_running": bool(running),
+        "current_exam_id": running[0].exam_id if running else None,
+        "jobs": [job.to_dict() for job in scheduler.jobs.values()],
+    }
+
+
+@app.get("/api/history")
+async def get_history(exam_id: Optional[str] = None, limit: int = 50):
+    records = result_store.list_history(exam_id=exam_id, limit=max(1, min(limit, 500)))
+    for record in records:
+        for artifact in record["artifacts"]:
+            artifact["url"] = f"/api/download/{os.path.basename(artifact['path'])}"
+        if record["diff_path"]:
+            record["diff_url"] = f"/api/download/{os.path.basename(record['diff_path'])}"
+    return {
+        "history": records,
+        "stored_results": len(result_store.entries),
+        "stored_bytes": result_store.total_bytes,
+    }
+
+
+@app.get("/api/status/{job_id}")
+async def get_job_status(job_id: str):
+    job = scheduler.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return {**job.to_dict(), "logs": job.logs.tail()}
+
+
+@app.get("/api/logs/{job_id}")
+async def get_job_logs(job_id: str, cursor: int = 0, limit: int = 100, level: Optional[str] = None):
+    job = scheduler.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    if level is not None and level not in LEVELS:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 로그 레벨: {level}")
+    records, next_cursor = job.logs.query(cursor=max(cursor, 0), level=level, limit=max(1, min(limit, 1000)))
+    return {
+        "job_id": job_id,
+        "records": records,
+        "next_cursor": next_cursor,
+        # 버퍼 크기를 넘어 이미 버려진 오래된 로그 수
+        "dropped": job.logs.dropped,
+    }
+
+
+MEDIA_TYPES = {
+    ".csv": "text/csv; charset=utf-8",
+    ".json": "application/json",
+    ".jsonl": "application/x-ndjson",
+    ".xml": "application/xml",
+    ".xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ".zip": "application/zip",
+}
+
+
+def _etag_matches(header, tag):
+    if header.strip() == "*":
+        return True
+    # 약한 비교: W/ 접두사는 무시
+    return tag in {candidate.strip().removeprefix("W/") for candidate in header.split(",")}
+
+
+def _parse_range(header, size):
+    """단일 'bytes=' 범위를 (start, end) 로 바꾼다. 여러 범위나 형식 오류는 None(전체 전송), 만족할 수 없으면 ValueError."""
+    unit, _, spec = header.partition("=")
+    if unit.strip() != "bytes" or "," in spec:
+        return None
+    first, _, last = spec.strip().partition("-")
+    try:
+        if first:
+            start = int(first)
+            if last and int(last) < start:
+                # 끝이 시작보다 앞선 범위(bytes=5-3)는 형식 오류이므로 무시하고 전체를 보낸다 (RFC 9110 14.1.1).
+                return None
+            end = min(int(last), size - 1) if last else size - 1
+        else:
+            start, end = max(0, size - int(last)), size - 1
+    except ValueError:
+        return None
+    if start >= size:
+        raise ValueError(header)
+    return start, end
+
+
+def _file_chunks(path, start, length, chunk_size=256 * 1024):
+    with open(path, "rb") as f:
+        f.seek(start)
+        while length > 0:
+            chunk = f.read(min(chunk_size, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
 
 
 @app.get("/api/download/{filename}")
-async def download_file(filename: str):
-    file_path = filename
-    if not os.path.exists(file_path):
+async def download_file(filename: str, request: Request):
+    file_path = resolve_artifact(filename)
+    if file_path is None:
+        raise HTTPException(status_code=400, detail="잘못된 파일 이름입니다.")
+    if not os.path.isfile(file_path):
         raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
-    return FileResponse(path=file_path, filename=filename, media_type="application/octet-stream")
 
+    media_type = MEDIA_TYPES.get(os.path.splitext(filename)[1], "application/octet-stream")
+    headers = {"Vary": "Accept-Encoding", "Cache-Control": "no-cache"}
+    range_header = request.headers.get("range")
+
+    # 범위 요청은 원본 바이트 기준으로 처리하므로 압축본을 쓰지 않는다.
+    if not range_header:
+        accepted = {e.split(";")[0].strip() for e in request.headers.get("accept-encoding", "").split(",")}
+        for encoding in ("zstd", "gzip"):
+            compressed_path = f"{file_path}.{COMPRESSED_EXTENSIONS[encoding]}"
+            if encoding in accepted and os.path.exists(compressed_path):
+                # 미리 압축해 둔 파일을 그대로 전송 (브라우저가 풀어서 원래 파일로 저장)
+                tag = artifact_etag(file_path, encoding)
+                if _etag_matches(request.headers.get("if-none-match", ""), tag):
+                    return Response(status_code=304, headers={**headers, "ETag": tag})
+                return FileResponse(
+                    path=compressed_path,
+                    filename=filename,
+                    media_type=media_type,
+                    headers={**headers, "ETag": tag, "Content-Encoding": encoding},
+                )
 
-async def run_crawling_task(exam_id: str, file_format: str):
-    global crawler_instance
-    try:
-        crawler_instance = FastCampusLMSCrawler()
+    tag = artifact_etag(file_path)
+    headers.update({"ETag": tag, "Accept-Ranges": "bytes"})
+    if _etag_matches(request.headers.get("if-none-match", ""), tag):
+        return Response(status_code=304, headers=headers)
+
+    size = os.path.getsize(file_path)
+    # If-Range가 현재 태그와 다르면 파일이 바뀐 것이므로 전체를 보낸다.
+    if range_header and request.headers.get("if-range", tag) == tag:
+        try:
+            byte_range = _parse_range(range_header, size)
+        except ValueError:
+            return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{size}"})
+        if byte_range:
+            start, end = byte_range
+            return StreamingResponse(
+                _file_chunks(file_path, start, end - start + 1),
+                status_code=206,
+                media_type=media_type,
+                headers={
+                    **headers,
+                    "Content-Range": f"bytes {start}-{end}/{size}",
+                    "Content-Length": str(end - start + 1),
+                    "Content-Disposition": f'attachment; filename="{filename}"',
+                },
+            )
+    return FileResponse(path=file_path, filename=filename, media_type=media_type, headers=headers)
 
-        async def log_callback(message: str):
-            await manager.send_message(json.dumps({"type": "log", "message": message}))
 
-        async def progress_callback(progress: float, desc: str):
-            await manager.send_message(
-                json.dumps({"type": "progress", "progress": progress, "description": desc})
-            )
+async def run_crawling_task(job):
+    exam_id = job.exam_id
+    file_formats = job.file_formats
 
-        await log_callback("로그인 시도 중...")
-        await progress_callback(0.1, "로그인 시도 중...")
+    async def send_job_message(payload: dict):
+        event_bus.publish({**payload, "job_id": job.job_id, "exam_id": exam_id})
 
-        crawler_instance.login_process()
+    async def log_callback(message: str, level: str = "info", step: Optional[str] = None, index: Optional[int] = None):
+        job.logs.add(message, level=level, step=step, index=index)
+        payload = {"type": "log", "level": level, "message": message}
+        if index is not None:
+            payload["index"] = index
+        await send_job_message(payload)
 
-        await log_callback("로그인 성공. 데이터 수집 시작...")
-        await progress_callback(0.2, "로그인 성공. 데이터 수집 시작...")
+    async def progress_callback(progress: float, desc: str):
+        job.progress = progress
+        job.description = desc
+        await send_job_message({"type": "progress", "progress": progress, "description": desc})
 
-        collected_count = await crawler_instance.crawl_exam_data_async(exam_id, progress_callback, log_callback)
+    try:
+        await log_callback("세션 준비 중...")
+        await progress_callback(0.1, "세션 준비 중...")
+
+        async with driver_pool.lease() as crawler:
+            job.crawler = crawler
+            if job.cancel_requested:
+                return
+            await log_callback("세션 준비 완료. 데이터 수집 시작...")
+            await progress_callback(0.2, "세션 준비 완료. 데이터 수집 시작...")
+
+            async with driver_pool.lease_extra(job.shards - 1) as helpers:
+                # 보조 세션 준비(로그인)에 몇 초가 걸릴 수 있으므로 그 사이의 중지 요청을 다시 확인한다.
+                if job.cancel_requested:
+                    return
+                if job.shards > 1:
+                    await log_callback(f"샤드 수집: 세션 {len(helpers) + 1}개 사용 (요청 {job.shards}개)")
+                collected_count = await crawler.crawl_exam_data_async(
+                    exam_id,
+                    progress_callback,
+                    log_callback,
+                    mode=job.mode,
+                    resume=job.resume,
+                    incremental=job.incremental,
+                    helpers=helpers,
+                    file_formats=file_formats,
+                    schema=job.schema,
+                    fast_path=job.fast_path,
+                )
+            job.count = collected_count
 
-        await progress_callback(0.9, f"{collected_count}개 데이터 수집 완료. 파일 생성 중...")
+            await progress_callback(0.9, f"{collected_count}개 데이터 수집 완료. 파일 생성 중...")
 
-        if collected_count > 0:
-            file_path = crawler_instance.export_data(exam_id, file_format)
-            if file_path:
-                await log_callback(
-                    f"크롤링 완료! 총 {collected_count}개의 데이터가 수집되어 '{file_path}' 파일에 저장되었습니다."
+            if collected_count > 0:
+                artifacts = await crawler.run_blocking(
+                    crawler.export_artifacts, exam_id, file_formats, job.compression, job.bundle
                 )
-                await manager.send_message(
-                    json.dumps(
-                        {
-                            "type": "complete",
-                            "message": f"크롤링 완료! {collected_count}개 데이터 수집됨",
-                            "file_path": file_path,
-                            "count": collected_count,
-                        }
+                if artifacts:
+                    job.artifacts = artifacts
+                    job.file_path = artifacts[0]["path"]
+                    await log_callback(
+                        f"크롤링 완료! 총 {collected_count}개의 데이터가 수집되어 "
+                        f"{', '.join(repr(artifact['path']) for artifact in artifacts)} 파일에 저장되었습니다."
                     )
-                )
+                    job.metrics = crawler.metrics.summary()
+                    complete_message = {
+                        "type": "complete",
+                        "message": f"크롤링 완료! {collected_count}개 데이터 수집됨",
+                        "file_path": job.file_path,
+                        "artifacts": artifacts,
+                        "count": collected_count,
+                        "metrics": job.metrics,
+                    }
+                    if crawler.last_diff is not None:
+                        job.diff_path = await crawler.run_blocking(crawler.export_diff, exam_id)
+                        complete_message["diff_path"] = job.diff_path
+                        complete_message["diff"] = {key: len(rows) for key, rows in crawler.last_diff.items()}
+                        await log_callback(
+                            "변경 내역: 추가 {added}건, 변경 {changed}건, 삭제 {removed}건".format(**complete_message["diff"])
+                        )
+                    await send_job_message(complete_message)
+                else:
+                    job.error = f"파일 생성 실패 (형식: {', '.join(file_formats)})"
+                    await log_callback(
+                        f"데이터 수집은 완료되었으나 파일 생성에 실패했습니다 (형식: {', '.join(file_formats)}).", "error"
+                    )
+                    await send_job_message({"type": "error", "message": job.error})
             else:
-                await log_callback(f"데이터 수집은 완료되었으나 파일 생성에 실패했습니다 (형식: {file_format}).")
-                await manager.send_message(
-                    json.dumps({"type": "error", "message": f"파일 생성 실패 (형식: {file_format})"})
-                )
-        else:
-            await log_callback(f"데이터를 수집하지 못했습니다. (시험 ID: {exam_id})")
-            await manager.send_message(
-                json.dumps({"type": "error", "message": f"데이터 수집 실패 (시험 ID: {exam_id})"})
-            )
+                job.error = f"데이터 수집 실패 (시험 ID: {exam_id})"
+                await log_callback(f"데이터를 수집하지 못했습니다. (시험 ID: {exam_id})", "error")
+                await send_job_message({"type": "error", "message": job.error})
 
         await progress_callback(1.0, "작업 완료")
     except Exception as e:
@@ -184,13 +482,15 @@ async def run_crawling_task(exam_id: str, file_format: str):
         error_str = str(e) if str(e) else f"타입: {type(e).__name__}"
         error_message = f"오류 발생: {error_str}"
         detailed_error = f"{error_message}\n상세 정보: {repr(e)}\n스택 트레이스:\n{traceback.format_exc()}"
-        await manager.send_message(
-            json.dumps({"type": "error", "message": error_message, "details": detailed_error})
-        )
+        job.status = "failed"
+        job.error = error_message
+        job.logs.add(detailed_error, level="error")
+        await send_job_message({"type": "error", "message": error_message, "details": detailed_error})
     finally:
-        if crawler_instance:
-            crawler_instance.cleanup()
-        await manager.send_message(json.dumps({"type": "log", "message": "클린업 완료. 작업 종료."}))
+        await send_job_message({"type": "log", "message": "클린업 완료. 작업 종료."})
+
+
+scheduler = JobScheduler(run_crawling_task, on_finish=result_store.record)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,202 @@
+import threading
+import time
+from contextlib import contextmanager
+
+
+# 초 단위 구간. 빠른 DOM 대기(수십 ms)부터 느린 페이지 로드/로그인(수십 초)까지 구분한다.
+DEFAULT_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _label_text(names, values):
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name, help_text, labels=()):
+        self.name = name
+        self.help_text = help_text
+        self.labels = tuple(labels)
+        # 레이블 없는 카운터는 아직 한 번도 증가하지 않았어도 0으로 노출한다.
+        self._values = {} if self.labels else {(): 0}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(labels.get(name, "") for name in self.labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            values = dict(self._values)
+        for key, value in sorted(values.items()):
+            yield f"{self.name}{_label_text(self.labels, key)} {value}"
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name, help_text, labels=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(labels.get(name, "") for name in self.labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[0][i] += 1
+                    break
+            series[1] += value
+            series[2] += 1
+
+    def samples(self):
+        with self._lock:
+            snapshot = {key: (list(counts), total, count) for key, (counts, total, count) in self._series.items()}
+        for key, (counts, total, count) in sorted(snapshot.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = _label_text(self.labels + ("le",), key + (bound,))
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            yield f"{self.name}_bucket{_label_text(self.labels + ('le',), key + ('+Inf',))} {count}"
+            yield f"{self.name}_sum{_label_text(self.labels, key)} {total:.6f}"
+            yield f"{self.name}_count{_label_text(self.labels, key)} {count}"
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics = []
+
+    def counter(self, name, help_text, labels=()):
+        metric = Counter(name, help_text, labels)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name, help_text, labels=(), buckets=DEFAULT_BUCKETS):
+        metric = Histogram(name, help_text, labels, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def render(self):
+        """Prometheus 텍스트 노출 형식(0.0.4)으로 직렬화한다."""
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.help_text}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+LOGIN_PHASE_SECONDS = REGISTRY.histogram(
+    "lms_login_phase_seconds", "로그인 단계별 소요 시간(초)", labels=("phase",)
+)
+STEP_SECONDS = REGISTRY.histogram("lms_crawl_step_seconds", "학생별 수집 단계 소요 시간(초)", labels=("step",))
+STEP_TIMEOUTS = REGISTRY.counter("lms_crawl_step_timeouts_total", "단계별 대기 시간 초과 횟수", labels=("step",))
+ROWS_COLLECTED = REGISTRY.counter("lms_crawl_rows_total", "수집된 행 수", labels=("mode",))
+CRAWL_SECONDS = REGISTRY.histogram(
+    "lms_crawl_seconds", "시험 하나의 수집 소요 시간(초)", labels=("mode",), buckets=(1, 5, 10, 30, 60, 120, 300, 600, 1800, 3600)
+)
+DRIVER_RESTARTS = REGISTRY.counter("lms_driver_restarts_total", "드라이버 재시작(재로그인) 횟수")
+EXPORT_SECONDS = REGISTRY.histogram("lms_export_seconds", "형식별 파일 내보내기 소요 시간(초)", labels=("format",))
+FAST_PATH_FALLBACKS = REGISTRY.counter(
+    "lms_fast_path_fallbacks_total", "빠른 경로(학생당 스크립트 1회) 실패 후 단계별 처리로 넘어간 횟수", labels=("step",)
+)
+ITEM_FAILURES = REGISTRY.counter("lms_crawl_item_failures_total", "학생 처리 실패 횟수 (재시도 전 포함)", labels=("kind",))
+RECOVERIES = REGISTRY.counter("lms_crawl_recoveries_total", "실패 후 세션 복구 방법별 성공 횟수", labels=("action",))
+JOBS_FINISHED = REGISTRY.counter("lms_jobs_finished_total", "상태별 종료된 작업 수", labels=("status",))
+
+
+@contextmanager
+def timed(histogram, **labels):
+    start = time.monotonic()
+    try:
+        yield
+    finally:
+        histogram.observe(time.monotonic() - start, **labels)
+
+
+class JobMetrics:
+    """작업 하나의 단계별 소요 시간 요약. 전역 히스토그램에도 함께 기록한다 (complete 메시지용)."""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.rows = 0
+        self.steps = {}
+        self.timeouts = {}
+        self.exports = {}
+        self.failures = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def step(self, name):
+        # API 프로세스 기동 시 selenium을 불러오지 않도록 수집 중(이미 로드된 뒤)에만 가져온다.
+        from selenium.common.exceptions import TimeoutException
+
+        start = time.monotonic()
+        try:
+            yield
+        except TimeoutException:
+            self.timeout(name)
+            raise
+        finally:
+            elapsed = time.monotonic() - start
+            STEP_SECONDS.observe(elapsed, step=name)
+            with self._lock:
+                stats = self.steps.setdefault(name, {"count": 0, "total": 0.0, "max": 0.0})
+                stats["count"] += 1
+                stats["total"] += elapsed
+                stats["max"] = max(stats["max"], elapsed)
+
+    def timeout(self, name):
+        STEP_TIMEOUTS.inc(step=name)
+        with self._lock:
+            self.timeouts[name] = self.timeouts.get(name, 0) + 1
+
+    def failure(self, kind):
+        ITEM_FAILURES.inc(kind=kind)
+        with self._lock:
+            self.failures[kind] = self.failures.get(kind, 0) + 1
+
+    def export(self, file_format, seconds):
+        EXPORT_SECONDS.observe(seconds, format=file_format)
+        self.exports[file_format] = round(seconds, 3)
+
+    def summary(self):
+        elapsed = time.monotonic() - self.started
+        with self._lock:
+            steps = {
+                name: {
+                    "count": stats["count"],
+                    "avg": round(stats["total"] / stats["count"], 4),
+                    "max": round(stats["max"], 4),
+                }
+                for name, stats in self.steps.items()
+            }
+            timeouts = dict(self.timeouts)
+            failures = dict(self.failures)
+        return {
+            "elapsed": round(elapsed, 3),
+            "rows": self.rows,
+            "rows_per_sec": round(self.rows / elapsed, 3) if elapsed > 0 else 0.0,
+            "steps": steps,
+            "timeouts": timeouts,
+            "failures": failures,
+            "exports": dict(self.exports),
+        }
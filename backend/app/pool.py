@@ -0,0 +1,136 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
+
+
+def _crawler_class():
+    # selenium/webdriver 모듈은 첫 세션을 만들 때 불러온다. API 서버는 이를 기다리지 않고 바로 응답할 수 있다.
+    from .crawler import FastCampusLMSCrawler
+
+    return FastCampusLMSCrawler
+
+
+class DriverPool:
+    """로그인된 헤드리스 세션을 미리 띄워 두고 작업마다 대여해 주는 풀."""
+
+    def __init__(self, size=None, health_interval=None):
+        self.size = size or int(os.getenv("DRIVER_POOL_SIZE", "1"))
+        self.health_interval = health_interval or float(os.getenv("DRIVER_POOL_HEALTH_INTERVAL", "300"))
+        self._idle = None
+        self._sessions = []
+        self._health_task = None
+        self._lock = None
+
+    async def _spawn(self):
+        # import는 이벤트 루프를 막으므로 스레드에서 수행한다.
+        crawler = (await asyncio.to_thread(_crawler_class))()
+        try:
+            await crawler.login_process_async()
+        except Exception:
+            crawler.close()
+            raise
+        return crawler
+
+    def _ensure_started(self):
+        if self._idle is None:
+            self._idle = asyncio.Queue()
+            self._lock = asyncio.Lock()
+
+    async def start(self):
+        self._ensure_started()
+        # 예열이 끝날 때까지 잠금을 잡아 둔다. 그 사이 들어온 작업은 세션을 따로 만들지 않고 예열된 세션을 기다린다.
+        async with self._lock:
+            count = max(0, self.size - len(self._sessions))
+            results = await asyncio.gather(*(self._spawn() for _ in range(count)), return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    # 로그인 실패 시 대여 시점에 다시 시도한다.
+                    print(f"⚠️ 세션 풀 초기화 실패: {result}")
+                    continue
+                self._sessions.append(result)
+                self._idle.put_nowait(result)
+        self._health_task = asyncio.create_task(self._health_loop())
+
+    async def stop(self):
+        if self._health_task:
+            self._health_task.cancel()
+            self._health_task = None
+        for crawler in self._sessions:
+            await crawler.run_blocking(crawler.close)
+        self._sessions = []
+        self._idle = None
+
+    async def _acquire(self, wait=True):
+        # wait=False 이면 다른 작업을 기다리지 않고, 바로 쓸 수 있는 세션이 없을 때 None을 반환한다.
+        self._ensure_started()
+        async with self._lock:
+            if self._idle.empty() and len(self._sessions) < self.size:
+                crawler = await self._spawn()
+                self._sessions.append(crawler)
+                return crawler
+            if not wait:
+                if self._idle.empty():
+                    return None
+                crawler = self._idle.get_nowait()
+        if wait:
+            crawler = await self._idle.get()
+        if not crawler.driver:
+            try:
+                await crawler.login_process_async()
+            except Exception:
+                self._idle.put_nowait(crawler)
+                raise
+        # 이전 작업의 중지 요청을 새 작업에 넘기지 않는다.
+        crawler._stop_requested = False
+        return crawler
+
+    async def _release(self, crawler):
+        try:
+            await crawler.run_blocking(crawler.reset_session)
+        except Exception as e:
+            crawler._add_log(f"세션 초기화 실패, 재로그인 예정: {e}")
+            await crawler.run_blocking(crawler.cleanup)
+        self._idle.put_nowait(crawler)
+
+    @asynccontextmanager
+    async def lease(self):
+        crawler = await self._acquire()
+        try:
+            yield crawler
+        finally:
+            await self._release(crawler)
+
+    @asynccontextmanager
+    async def lease_extra(self, count):
+        """샤드 수집용 보조 세션을 최대 count개 빌린다. 기다리지 않으므로 count보다 적을 수 있다."""
+        crawlers = []
+        try:
+            for _ in range(count):
+                try:
+                    crawler = await self._acquire(wait=False)
+                except Exception as e:
+                    print(f"⚠️ 보조 세션 준비 실패: {e}")
+                    break
+                if crawler is None:
+                    break
+                crawlers.append(crawler)
+            yield crawlers
+        finally:
+            for crawler in crawlers:
+                await self._release(crawler)
+
+    async def _health_loop(self):
+        while True:
+            await asyncio.sleep(self.health_interval)
+            # 대여 중이 아닌 세션만 점검하고, 만료된 세션은 다시 로그인한다.
+            for _ in range(self._idle.qsize()):
+                crawler = self._idle.get_nowait()
+                try:
+                    alive = await crawler.run_blocking(crawler.is_session_alive)
+                    if not alive:
+                        await crawler.login_process_async(reuse_cookies=False)
+                except Exception as e:
+                    crawler._add_log(f"세션 재로그인 실패: {e}")
+                    await crawler.run_blocking(crawler.cleanup)
+                finally:
+                    self._idle.put_nowait(crawler)
@@ -0,0 +1,200 @@
+import asyncio
+import os
+import time
+from collections import OrderedDict, deque
+
+from .artifacts import remove_stale
+from .exporters import COMPRESSED_EXTENSIONS
+
+
+# 같은 시험을 같은 옵션으로 다시 요청하면 이 시간(초) 동안은 저장된 결과를 그대로 돌려준다.
+RESULT_TTL = float(os.getenv("RESULT_TTL", "3600"))
+# 보관 중인 결과 파일 총 용량 상한(MB). 넘으면 가장 오래 쓰이지 않은 결과부터 파일째 지운다.
+RESULT_STORE_MAX_MB = float(os.getenv("RESULT_STORE_MAX_MB", "512"))
+RESULT_HISTORY_SIZE = int(os.getenv("RESULT_HISTORY_SIZE", "500"))
+RESULT_SWEEP_INTERVAL = float(os.getenv("RESULT_SWEEP_INTERVAL", "60"))
+
+
+def artifact_files(artifacts, diff_path=None):
+    """결과에 딸린 모든 파일 경로 (사전 압축본 포함)."""
+    paths = []
+    for artifact in artifacts:
+        paths.append(artifact["path"])
+        paths.extend(f"{artifact['path']}.{COMPRESSED_EXTENSIONS[encoding]}" for encoding in artifact.get("encodings", ()))
+    if diff_path:
+        paths.append(diff_path)
+    return paths
+
+
+def _file_size(path):
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+class ResultEntry:
+    __slots__ = ("job_id", "exam_id", "signature", "reusable", "count", "artifacts", "diff_path", "metrics",
+                 "created_at", "duration", "last_access", "size")
+
+    def __init__(self, job, signature, reusable):
+        self.job_id = job.job_id
+        self.exam_id = job.exam_id
+        self.signature = signature
+        # 중지된 작업의 부분 결과는 파일만 보관하고 재사용하지 않는다.
+        self.reusable = reusable
+        self.count = job.count
+        self.artifacts = job.artifacts
+        self.diff_path = job.diff_path
+        self.metrics = job.metrics
+        self.created_at = job.finished_at or time.time()
+        self.duration = (job.finished_at - job.started_at) if job.finished_at and job.started_at else None
+        self.last_access = time.monotonic()
+        self.size = sum(_file_size(path) for path in self.files)
+
+    @property
+    def files(self):
+        return artifact_files(self.artifacts, self.diff_path)
+
+    def expired(self, ttl, now=None):
+        return (now or time.time()) - self.created_at > ttl
+
+
+class ResultStore:
+    """시험 ID별 완료 결과와 작업 이력. 결과 파일의 보관 기간(TTL)과 총 용량(LRU)도 여기서 관리한다.
+
+    `entries`는 접근 순서대로 정렬되어 있어 맨 앞이 가장 오래 쓰이지 않은 결과다.
+    """
+
+    def __init__(self, ttl=None, max_bytes=None, history_size=None):
+        self.ttl = RESULT_TTL if ttl is None else ttl
+        self.max_bytes = int(RESULT_STORE_MAX_MB * 1024 * 1024) if max_bytes is None else max_bytes
+        self.entries: OrderedDict[str, ResultEntry] = OrderedDict()
+        self.history = deque(maxlen=history_size or RESULT_HISTORY_SIZE)
+        self._sweeper = None
+
+    @staticmethod
+    def signature(file_formats, compression=(), bundle=False, schema=None):
+        """같은 결과 파일이 나오는 요청인지 판단하는 키. 수집 방식(mode)은 결과에 영향이 없으므로 뺀다."""
+        return (
+            tuple(file_formats),
+            tuple(sorted(compression)),
+            bool(bundle),
+            schema.signature if schema else None,
+        )
+
+    @classmethod
+    def job_signature(cls, job):
+        return cls.signature(job.file_formats, job.compression, job.bundle, job.schema)
+
+    @property
+    def live_files(self):
+        return {path for entry in self.entries.values() for path in entry.files}
+
+    @property
+    def total_bytes(self):
+        return sum(entry.size for entry in self.entries.values())
+
+    def lookup(self, exam_id, signature):
+        """재사용 가능한 최신 결과. 만료되었거나 파일이 사라진 결과는 이 자리에서 정리한다."""
+        now = time.time()
+        for entry in reversed(list(self.entries.values())):
+            if entry.exam_id != exam_id or entry.signature != signature or not entry.reusable:
+                continue
+            if entry.expired(self.ttl, now) or not all(os.path.exists(a["path"]) for a in entry.artifacts):
+                self._remove(entry.job_id)
+                continue
+            entry.last_access = time.monotonic()
+            self.entries.move_to_end(entry.job_id)
+            return entry
+        return None
+
+    def record(self, job):
+        """끝난 작업을 이력에 남기고, 결과 파일이 있으면 보관 대상으로 등록한다."""
+        cached_from = getattr(job, "cached_from", None)
+        self.history.append({
+            "job_id": job.job_id,
+            "exam_id": job.exam_id,
+            "status": job.status,
+            "count": job.count,
+            "duration": (job.finished_at - job.started_at) if job.finished_at and job.started_at else None,
+            "created_at": job.created_at,
+            "finished_at": job.finished_at,
+            "file_formats": job.file_formats,
+            "artifacts": job.artifacts,
+            "diff_path": job.diff_path,
+            "cached_from": cached_from,
+            "error": job.error,
+        })
+        if cached_from or not job.artifacts:
+            return None
+
+        signature = self.job_signature(job)
+        entry = ResultEntry(job, signature, reusable=job.status == "completed")
+        if entry.reusable:
+            # 같은 요청의 이전 결과는 새 결과로 대체된다 (force=true 재수집).
+            for old in [e for e in self.entries.values() if e.exam_id == job.exam_id and e.signature == signature]:
+                self._remove(old.job_id, keep=entry.files)
+        self.entries[entry.job_id] = entry
+        self.evict()
+        return entry
+
+    def evict(self):
+        """만료된 결과를 지우고, 용량 상한을 넘으면 가장 오래 쓰이지 않은 결과부터 지운다."""
+        now = time.time()
+        removed = []
+        for entry in list(self.entries.values()):
+            if entry.expired(self.ttl, now):
+                removed.append(self._remove(entry.job_id))
+        total = self.total_bytes
+        while total > self.max_bytes and len(self.entries) > 1:
+            entry = self._remove(next(iter(self.entries)))
+            total -= entry.size
+            removed.append(entry)
+        return removed
+
+    def _remove(self, job_id, keep=()):
+        entry = self.entries.pop(job_id)
+        # 다른 결과가 같은 파일을 가리키면(내용이 같은 결과 등) 남겨 둔다.
+        keep = set(keep) | self.live_files
+        for path in entry.files:
+            if path in keep:
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"⚠️ 결과 파일 삭제 실패 ({path}): {e}")
+        return entry
+
+    def list_history(self, exam_id=None, limit=50):
+        records = [record for record in reversed(self.history) if exam_id is None or record["exam_id"] == exam_id]
+        return [
+            {
+                **record,
+                "artifacts": [
+                    {**artifact, "available": os.path.exists(artifact["path"])} for artifact in record["artifacts"]
+                ],
+            }
+            for record in records[:limit]
+        ]
+
+    async def _sweep(self, interval):
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                self.evict()
+                # 저장소가 모르는 파일(실패/중단된 작업이 남긴 파일 등)도 오래되면 지운다.
+                remove_stale(self.live_files)
+            except Exception as e:
+                print(f"⚠️ 결과 정리 중 오류: {e}")
+
+    def start(self, interval=None):
+        if self._sweeper is None:
+            self._sweeper = asyncio.create_task(self._sweep(interval or RESULT_SWEEP_INTERVAL))
+
+    async def stop(self):
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            self._sweeper = None
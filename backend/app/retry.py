@@ -0,0 +1,67 @@
+import os
+import random
+
+from selenium.common.exceptions import (
+    InvalidSessionIdException,
+    NoSuchWindowException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+
+
+# 실패 종류: timeout(요소 대기 초과), stale(다시 그려진 요소), session_expired(로그인 만료), driver_crash(브라우저/드라이버 끊김)
+FAILURE_KINDS = ("timeout", "stale", "session_expired", "driver_crash", "other")
+
+# 드라이버나 브라우저가 더 이상 응답하지 않을 때 나오는 오류 문구
+CRASH_MARKERS = (
+    "chrome not reachable",
+    "disconnected",
+    "session deleted",
+    "invalid session id",
+    "no such window",
+    "target window already closed",
+    "tab crashed",
+    "connection refused",
+    "max retries exceeded",
+)
+
+
+def classify_failure(exc):
+    """예외만 보고 실패 종류를 고른다. 로그인 만료 여부는 현재 주소를 봐야 하므로 크롤러가 따로 판단한다."""
+    if isinstance(exc, StaleElementReferenceException):
+        return "stale"
+    if isinstance(exc, TimeoutException):
+        return "timeout"
+    if isinstance(exc, (InvalidSessionIdException, NoSuchWindowException, ConnectionError)):
+        return "driver_crash"
+    message = str(exc).lower()
+    if any(marker in message for marker in CRASH_MARKERS):
+        return "driver_crash"
+    if "stale element" in message:
+        return "stale"
+    return "other"
+
+
+def describe(exc):
+    """로그용 한 줄 요약. selenium 예외의 스택 트레이스와 안내 링크는 뺀다."""
+    message = getattr(exc, "msg", None) or str(exc).strip()
+    return message.splitlines()[0].split("; For documentation")[0] if message else type(exc).__name__
+
+
+class RetryPolicy:
+    """학생 한 명당 시도 횟수와 시도 사이 대기(지수 백오프 + 지터).
+
+    RETRY_MAX_ATTEMPTS=3, RETRY_BACKOFF=1(초), RETRY_BACKOFF_MAX=10(초), RETRY_SWEEP=true 로 조정한다.
+    """
+
+    def __init__(self, max_attempts=None, backoff=None, backoff_max=None, sweep=None):
+        self.max_attempts = max(1, max_attempts or int(os.getenv("RETRY_MAX_ATTEMPTS", "3")))
+        self.backoff = float(os.getenv("RETRY_BACKOFF", "1")) if backoff is None else backoff
+        self.backoff_max = float(os.getenv("RETRY_BACKOFF_MAX", "10")) if backoff_max is None else backoff_max
+        # 본 순회가 끝난 뒤 실패한 학생만 한 번 더 모아서 수집
+        self.sweep = os.getenv("RETRY_SWEEP", "true").lower() == "true" if sweep is None else sweep
+
+    def delay(self, attempt):
+        """attempt번째 실패 뒤 기다릴 시간(초). 동시에 실패한 세션들이 한꺼번에 다시 몰리지 않도록 절반까지 흔든다."""
+        base = min(self.backoff_max, self.backoff * 2 ** (attempt - 1))
+        return base * random.uniform(0.5, 1.0)
@@ -0,0 +1,239 @@
+import json
+import os
+import re
+
+
+# readFields(fields): 각 선택자 값을 한 번에 읽는다. 반환: {필드 이름: 문자열 | 문자열 목록 | null}
+READ_FIELDS_JS = """
+const byXPath = (selector, all) => {
+  if (!all) return [document.evaluate(selector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue].filter(Boolean);
+  const result = document.evaluate(selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+  return Array.from({length: result.snapshotLength}, (_, i) => result.snapshotItem(i));
+};
+const byCss = (selector, all) => all ? Array.from(document.querySelectorAll(selector)) : [document.querySelector(selector)].filter(Boolean);
+const readNode = (node, attribute) => attribute ? node.getAttribute(attribute) : (node.innerText ?? node.textContent ?? "").trim();
+const readFields = (fields) => {
+  const values = {};
+  for (const [name, kind, selector, attribute, all] of fields) {
+    const nodes = kind === "css" ? byCss(selector, all) : byXPath(selector, all);
+    values[name] = !nodes.length ? null : all ? nodes.map((node) => readNode(node, attribute)) : readNode(nodes[0], attribute);
+  }
+  return values;
+};
+"""
+
+EXTRACT_SCRIPT = READ_FIELDS_JS + "return readFields(arguments[0]);"
+
+SCOPES = ("page", "modal")
+# XML 요소 이름: 글자나 '_'로 시작하고 글자/숫자/'_'/'-'/'.'만 포함. 'xml'로 시작하는 이름은 예약되어 있다.
+XML_NAME = re.compile(r"^(?!xml)[^\W\d][\w.-]*$", re.IGNORECASE)
+
+
+def _first_match(pattern):
+    compiled = re.compile(pattern)
+
+    def process(value):
+        match = compiled.search(value)
+        if not match:
+            return ""
+        return match.group(1) if compiled.groups else match.group(0)
+
+    return process
+
+
+def _number(cast):
+    pattern = re.compile(r"-?\d+(?:\.\d+)?" if cast is float else r"-?\d+")
+
+    def process(value):
+        match = pattern.search(value.replace(",", ""))
+        return cast(match.group(0)) if match else ""
+
+    return process
+
+
+# 후처리기: 이름 또는 "regex:<패턴>" 으로 지정한다. 여러 개면 순서대로 적용.
+POST_PROCESSORS = {
+    "strip": str.strip,
+    "collapse": lambda value: " ".join(value.split()),
+    "lower": str.lower,
+    "int": _number(int),
+    "float": _number(float),
+    "url": _first_match(r"https?://[^\s\"'<>]+"),
+}
+
+
+def _post_processor(name):
+    if not isinstance(name, str):
+        raise ValueError(f"후처리기는 문자열이어야 합니다: {name!r}")
+    if name.startswith("regex:"):
+        try:
+            return _first_match(name[len("regex:"):])
+        except re.error as e:
+            raise ValueError(f"잘못된 정규식 후처리기 {name}: {e}") from None
+    if name not in POST_PROCESSORS:
+        raise ValueError(f"알 수 없는 후처리기: {name}")
+    return POST_PROCESSORS[name]
+
+
+def _strings(spec, key):
+    """문자열 하나 또는 문자열 목록으로 지정하는 항목(post, api_keys)을 목록으로 읽는다."""
+    value = spec.get(key, [])
+    values = [value] if isinstance(value, str) else value
+    if not isinstance(values, list) or not all(isinstance(item, str) for item in values):
+        raise ValueError(f"{key}는 문자열 또는 문자열 목록이어야 합니다: {spec['name']}")
+    return values
+
+
+def _xml_tag(spec):
+    tag = spec.get("tag")
+    if tag is None or tag == "":
+        # 필드 이름에서 만든 태그가 XML 이름 규칙에 맞지 않으면 접두사를 붙인다.
+        tag = re.sub(r"\W+", "_", spec["name"]).strip("_")
+        return tag if XML_NAME.match(tag) else f"field_{tag}".rstrip("_")
+    if not isinstance(tag, str) or not XML_NAME.match(tag):
+        raise ValueError(f"tag는 XML 요소 이름이어야 합니다 (글자나 _로 시작, xml로 시작 불가): {spec['name']}")
+    return tag
+
+
+class Field:
+    __slots__ = (
+        "name", "kind", "selector", "attribute", "scope", "multiple", "separator", "tag", "api_keys", "post_names", "post"
+    )
+
+    def __init__(self, spec):
+        if not isinstance(spec, dict) or not spec.get("name") or not spec.get("selector"):
+            raise ValueError(f"필드에는 name과 selector가 필요합니다: {spec}")
+        for key in ("name", "selector", "by", "attribute", "scope", "separator"):
+            if spec.get(key) is not None and not isinstance(spec[key], str):
+                raise ValueError(f"{key}는 문자열이어야 합니다: {spec['name']}")
+        self.name = spec["name"]
+        self.selector = spec["selector"]
+        # 명시하지 않으면 '/' 또는 '(' 로 시작하는 선택자를 XPath로 본다.
+        self.kind = spec.get("by") or ("xpath" if self.selector.startswith(("/", "(")) else "css")
+        if self.kind not in ("xpath", "css"):
+            raise ValueError(f"by는 xpath 또는 css여야 합니다: {self.name}")
+        self.attribute = spec.get("attribute")
+        self.scope = spec.get("scope", "modal")
+        if self.scope not in SCOPES:
+            raise ValueError(f"scope는 page 또는 modal이어야 합니다: {self.name}")
+        self.multiple = bool(spec.get("multiple", False))
+        self.separator = spec.get("separator", "\n")
+        self.tag = _xml_tag(spec)
+        self.api_keys = _strings(spec, "api_keys")
+        self.post_names = _strings(spec, "post")
+        self.post = [_post_processor(name) for name in self.post_names]
+
+    @property
+    def signature(self):
+        """같은 값을 읽어 같은 결과를 만드는 필드인지 비교하기 위한 정의 전체 (컴파일된 후처리기 대신 이름)."""
+        return (
+            self.name, self.kind, self.selector, self.attribute, self.scope, self.multiple, self.separator, self.tag,
+            tuple(self.api_keys), tuple(self.post_names),
+        )
+
+    @property
+    def locator(self):
+        from selenium.webdriver.common.by import By
+
+        return (By.XPATH if self.kind == "xpath" else By.CSS_SELECTOR, self.selector)
+
+    def process(self, raw):
+        if raw is None:
+            return ""
+        if self.multiple:
+            return self.separator.join(str(self.clean(value)) for value in raw)
+        return self.clean(raw)
+
+    def clean(self, value):
+        value = (value or "").strip()
+        for process in self.post:
+            value = process(value)
+        return value
+
+
+class ExtractionSchema:
+    """수집할 필드와 선택자 정의. 작업마다 한 번 컴파일해 두고 범위(page/modal)별로 한 번의 execute_script로 읽는다.
+
+    첫 번째 page 필드(또는 "key": true 인 필드)가 학생을 구분하는 키이며 상세 페이지 로딩 확인에도 쓰인다.
+    """
+
+    def __init__(self, fields):
+        specs = fields.get("fields") if isinstance(fields, dict) else fields
+        if not specs:
+            raise ValueError("수집할 필드가 없습니다.")
+        self.fields = [Field(spec) for spec in specs]
+        names = [field.name for field in self.fields]
+        if len(set(names)) != len(names):
+            raise ValueError("필드 이름이 중복되었습니다.")
+        self.by_scope = {scope: [field for field in self.fields if field.scope == scope] for scope in SCOPES}
+        if not self.by_scope["page"]:
+            raise ValueError("page 범위 필드(학생 이름 등)가 하나 이상 필요합니다.")
+        keys = [spec.get("name") for spec in specs if spec.get("key")]
+        self.key_field = next((field for field in self.fields if field.name in keys), self.by_scope["page"][0])
+        if self.key_field.scope != "page":
+            raise ValueError("key 필드는 page 범위여야 합니다.")
+        self.key = self.key_field.name
+        self.columns = names
+        self.xml_tags = {field.name: field.tag for field in self.fields}
+        self.script_args = {
+            scope: [[field.name, field.kind, field.selector, field.attribute, field.multiple] for field in scope_fields]
+            for scope, scope_fields in self.by_scope.items()
+        }
+
+    @classmethod
+    def load(cls, spec=None, default=None):
+        """요청에 담긴 정의 → EXTRACTION_SCHEMA(JSON 파일 경로 또는 JSON 문자열) → default 순으로 사용."""
+        if spec is None:
+            source = os.getenv("EXTRACTION_SCHEMA", "").strip()
+            if source:
+                if source.startswith(("[", "{")):
+                    spec = json.loads(source)
+                else:
+                    with open(source, encoding="utf-8") as f:
+                        spec = json.load(f)
+            else:
+                spec = default
+        return cls(spec)
+
+    @property
+    def signature(self):
+        """결과 재사용 판단용 키. 열 이름뿐 아니라 선택자/후처리기/키 필드가 달라도 다른 결과로 본다."""
+        return self.key, tuple(field.signature for field in self.fields)
+
+    @property
+    def has_modal(self):
+        return bool(self.by_scope["modal"])
+
+    @property
+    def modal_ready(self):
+        # 모달이 열렸는지 판단하는 기준: 첫 번째 modal 필드
+        return self.by_scope["modal"][0] if self.has_modal else None
+
+    def empty(self, scope):
+        return {field.name: "" for field in self.by_scope[scope]}
+
+    def read(self, driver, scope):
+        """scope 필드를 한 번의 왕복으로 읽는다. (값 dict, 찾지 못한 필드 이름 목록)을 반환."""
+        if not self.by_scope[scope]:
+            return {}, []
+        return self.process(scope, driver.execute_script(EXTRACT_SCRIPT, self.script_args[scope]))
+
+    def process(self, scope, raw):
+        """readFields 결과에 후처리기를 적용한다."""
+        raw = raw or {}
+        values = {}
+        missing = []
+        for field in self.by_scope[scope]:
+            if raw.get(field.name) is None:
+                missing.append(field.name)
+            values[field.name] = field.process(raw.get(field.name))
+        return values, missing
+
+    def api_fields(self):
+        """API 응답 레코드에서 읽을 (열 이름, 키 경로 목록). 어떤 필드에도 api_keys가 없으면 None (기본 매핑 사용)."""
+        if not any(field.api_keys for field in self.fields):
+            return None
+        return [(field.name, field.api_keys) for field in self.fields]
+
+    def process_api_item(self, item):
+        return {field.name: field.clean(str(item.get(field.name, ""))) for field in self.fields}
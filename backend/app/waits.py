@@ -0,0 +1,95 @@
+import os
+import time
+
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+
+
+# 단계별 기본 대기 한도(초). STEP_TIMEOUTS="modal=5,next=8" 처럼 환경변수로 덮어쓸 수 있다.
+DEFAULT_STEP_TIMEOUTS = {
+    "page": 20.0,
+    "name": 20.0,
+    "answer_button": 20.0,
+    "modal": 20.0,
+    "modal_close": 10.0,
+    "second_modal": 2.0,
+    "next": 20.0,
+}
+
+# 조건 목록 중 하나가 만족될 때까지 MutationObserver로 DOM 변화를 기다린다.
+# 조건: ["absent", xpath] 노드 없음/숨김, ["present", xpath] 노드 표시됨, ["text_not", xpath, text] 텍스트 변경
+DOM_WAIT_SCRIPT = """
+const [checks, timeoutMs, done] = arguments;
+const find = (xpath) => document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+const visible = (node) => !!node && !!(node.offsetWidth || node.offsetHeight || node.getClientRects().length);
+const evaluate = () => {
+  for (let i = 0; i < checks.length; i++) {
+    const [kind, xpath, arg] = checks[i];
+    const node = find(xpath);
+    if (kind === "absent" && !visible(node)) return {index: i, text: null};
+    if (kind === "present" && visible(node)) return {index: i, text: node.textContent.trim()};
+    if (kind === "text_not" && node && node.textContent.trim() !== arg) return {index: i, text: node.textContent.trim()};
+  }
+  return null;
+};
+const first = evaluate();
+if (first) { done(first); return; }
+let timer = null;
+const observer = new MutationObserver(() => {
+  const result = evaluate();
+  if (result) { observer.disconnect(); clearTimeout(timer); done(result); }
+});
+observer.observe(document.documentElement, {subtree: true, childList: true, characterData: true, attributes: true});
+timer = setTimeout(() => { observer.disconnect(); done(null); }, timeoutMs);
+"""
+
+
+class StepBudget:
+    def __init__(self, overrides=None):
+        self.timeouts = dict(DEFAULT_STEP_TIMEOUTS)
+        for pair in os.getenv("STEP_TIMEOUTS", "").split(","):
+            if "=" in pair:
+                step, seconds = pair.split("=", 1)
+                self.timeouts[step.strip()] = float(seconds)
+        self.timeouts.update(overrides or {})
+
+    def timeout(self, step):
+        return self.timeouts.get(step, DEFAULT_STEP_TIMEOUTS["page"])
+
+
+class AdaptiveWait:
+    """WebDriverWait와 같은 인터페이스지만 짧은 간격으로 시작해 점점 느리게 폴링한다.
+
+    고정 0.5초 폴링 대신 빠른 페이지에서는 수십 ms 안에 반환된다.
+    """
+
+    def __init__(self, driver, timeout, step=None, min_interval=0.05, max_interval=0.5, backoff=1.5):
+        self.driver = driver
+        self.timeout = timeout
+        self.step = step
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+
+    def until(self, method, message=""):
+        deadline = time.monotonic() + self.timeout
+        interval = self.min_interval
+        while True:
+            try:
+                value = method(self.driver)
+                if value:
+                    return value
+            except NoSuchElementException:
+                pass
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutException(message or f"'{self.step}' 단계 대기 시간 초과 ({self.timeout}s)")
+            time.sleep(min(interval, remaining))
+            interval = min(interval * self.backoff, self.max_interval)
+
+
+def wait_for_dom(driver, checks, timeout, step=None):
+    """checks 중 처음 만족된 조건의 (index, text)를 반환한다. 한 번의 WebDriver 호출로 처리된다."""
+    result = driver.execute_async_script(DOM_WAIT_SCRIPT, checks, int(timeout * 1000))
+    if result is None:
+        raise TimeoutException(f"'{step}' 단계 대기 시간 초과 ({timeout}s)")
+    return result["index"], result["text"]
@@ -0,0 +1,256 @@
+"""가짜 LMS를 상대로 FastCampusLMSCrawler를 헤드리스로 돌려 처리량을 측정한다.
+
+    cd backend
+    python -m benchmarks.crawler_bench --sizes 10 100 1000 --output bench.json
+    python -m benchmarks.crawler_bench --baseline bench.json   # 이전 결과와 비교
+
+학생 수별로 rows/sec, 학생당 처리 시간 p50/p99, 최대 RSS(크롬 프로세스 포함), 형식별 내보내기 시간을 JSON으로 기록한다.
+드라이버 기동을 포함한 로그인 시간(login_seconds)과 페이지 로드 시간(steps.page)으로 --driver-profile lean/full을 비교한다.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from .fake_lms import FakeLMS
+
+
+def percentile(values, q):
+    if not values:
+        return None
+    ordered = sorted(values)
+    # nearest-rank 방식
+    rank = max(0, min(len(ordered) - 1, math.ceil(q / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def _process_tree_rss(root_pid):
+    """root_pid와 모든 하위 프로세스(chromedriver, chrome)의 RSS 합계(바이트). /proc이 없으면 None."""
+    if not os.path.isdir("/proc"):
+        return None
+    children = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # comm에 공백이 있을 수 있으므로 마지막 ')' 뒤에서 ppid를 읽는다.
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    total = 0
+    stack = [root_pid]
+    while stack:
+        pid = stack.pop()
+        try:
+            with open(f"/proc/{pid}/statm") as f:
+                total += int(f.read().split()[1]) * page_size
+        except (OSError, IndexError, ValueError):
+            pass
+        stack.extend(children.get(pid, ()))
+    return total
+
+
+class RssSampler:
+    """백그라운드에서 주기적으로 프로세스 트리 RSS를 읽어 최댓값을 기록한다."""
+
+    def __init__(self, interval=0.2):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        self.peak = 0
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+
+    def _sample(self):
+        rss = _process_tree_rss(os.getpid())
+        if rss is None:
+            # /proc이 없는 환경은 파이썬 프로세스 자체의 최대 RSS로 대체 (Linux: KB, macOS: 바이트)
+            rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+        self.peak = max(self.peak, rss)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+
+async def bench_size(crawler, students, file_formats, mode):
+    exam_id = str(students)
+    starts = {}
+
+    async def log_callback(message, level="info", step=None, index=None):
+        if step == "start" and index is not None:
+            starts[index] = time.monotonic()
+
+    async def progress_callback(progress, description):
+        pass
+
+    with RssSampler() as rss:
+        started = time.monotonic()
+        count = await crawler.crawl_exam_data_async(
+            exam_id, progress_callback, log_callback, mode=mode, file_formats=file_formats
+        )
+        crawl_seconds = time.monotonic() - started
+        export_started = time.monotonic()
+        artifacts = await crawler.run_blocking(crawler.export_artifacts, exam_id, file_formats)
+        export_seconds = time.monotonic() - export_started
+
+    # 학생당 처리 시간 = 다음 학생 처리 시작까지의 간격 (마지막 학생은 수집 종료까지)
+    ordered = [starts[i] for i in sorted(starts)]
+    latencies = [b - a for a, b in zip(ordered, ordered[1:])]
+    if ordered:
+        latencies.append(started + crawl_seconds - ordered[-1])
+
+    summary = crawler.metrics.summary()
+    return {
+        "students": students,
+        "mode": mode,
+        "rows": count,
+        "crawl_seconds": round(crawl_seconds, 3),
+        "rows_per_sec": round(count / crawl_seconds, 3) if crawl_seconds > 0 else 0.0,
+        "latency_p50": round(percentile(latencies, 50), 4) if latencies else None,
+        "latency_p99": round(percentile(latencies, 99), 4) if latencies else None,
+        "peak_rss_mb": round(rss.peak / 1024 / 1024, 1),
+        "export_seconds": round(export_seconds, 3),
+        # 스트리밍 기록 시간을 포함한 형식별 내보내기 시간
+        "export_seconds_by_format": summary["exports"],
+        "steps": summary["steps"],
+        "timeouts": summary["timeouts"],
+        "artifacts": [artifact["format"] for artifact in artifacts],
+    }
+
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline):
+    """같은 학생 수끼리 rows/sec, p99를 이전 결과와 비교해 출력한다."""
+    previous = {(row["students"], row.get("mode")): row for row in baseline.get("results", [])}
+    for row in results:
+        old = previous.get((row["students"], row["mode"]))
+        if not old:
+            continue
+        for key in ("rows_per_sec", "latency_p50", "latency_p99", "peak_rss_mb", "export_seconds"):
+            if old.get(key) and row.get(key) is not None:
+                change = (row[key] - old[key]) / old[key] * 100
+                print(f"  {row['students']:>5}명 {key:<16} {old[key]:>10} → {row[key]:>10} ({change:+.1f}%)")
+
+
+async def run(args):
+    lms = FakeLMS(
+        latency=args.latency, ui_latency=args.ui_latency, second_modal_every=args.second_modal_every
+    ).start()
+    workdir = tempfile.mkdtemp(prefix="lms-bench-")
+    # crawler 모듈은 import 시점에 LMS_BASE_URL/CHECKPOINT_DIR을 읽으므로 먼저 설정한다.
+    os.environ["LMS_BASE_URL"] = lms.base_url
+    os.environ["CHECKPOINT_DIR"] = os.path.join(workdir, "checkpoints")
+    os.environ.setdefault("FASTCAMPUS_EMAIL", "bench@example.com")
+    os.environ.setdefault("FASTCAMPUS_PASSWORD", "bench")
+    os.environ["LEAN_DRIVER"] = "true" if args.driver_profile == "lean" else "false"
+    if args.mode == "api":
+        os.environ.setdefault("LMS_API_SUBMISSIONS_URL", lms.base_url + "/api/exams/{exam_id}/submissions?page=0&size=20")
+    from app.crawler import FastCampusLMSCrawler
+
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    crawler = FastCampusLMSCrawler()
+    results = []
+    try:
+        login_started = time.monotonic()
+        await crawler.login_process_async()
+        login_seconds = time.monotonic() - login_started
+        print(f"로그인 {login_seconds:.2f}s ({lms.base_url})")
+        for students in args.sizes:
+            for _ in range(args.repeat):
+                result = await bench_size(crawler, students, args.formats, args.mode)
+                results.append(result)
+                print(
+                    f"{students:>5}명: {result['rows_per_sec']:.1f} rows/s, "
+                    f"p50 {result['latency_p50']}s, p99 {result['latency_p99']}s, "
+                    f"RSS {result['peak_rss_mb']}MB, 내보내기 {result['export_seconds']}s"
+                )
+                await crawler.run_blocking(crawler.reset_session)
+    finally:
+        await crawler.run_blocking(crawler.close)
+        os.chdir(cwd)
+        lms.stop()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return {
+        "revision": _git_revision(),
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {
+            "latency": args.latency,
+            "ui_latency": args.ui_latency,
+            "second_modal_every": args.second_modal_every,
+            "formats": args.formats,
+            "mode": args.mode,
+            "driver_profile": args.driver_profile,
+            "step_timeouts": os.getenv("STEP_TIMEOUTS", ""),
+        },
+        "login_seconds": round(login_seconds, 3),
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="가짜 LMS 기반 크롤러 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000], help="학생 수 목록")
+    parser.add_argument("--repeat", type=int, default=1, help="학생 수별 반복 횟수")
+    parser.add_argument("--latency", type=float, default=0.02, help="가짜 LMS HTTP 응답 지연(초)")
+    parser.add_argument("--ui-latency", type=float, default=0.01, help="모달/다음 버튼 반응 지연(초)")
+    parser.add_argument("--second-modal-every", type=int, default=10, help="N명마다 확인 모달 표시 (0이면 없음)")
+    parser.add_argument("--formats", nargs="+", default=["csv", "xlsx"], help="내보낼 파일 형식")
+    parser.add_argument("--mode", choices=["selenium", "api"], default="selenium")
+    parser.add_argument(
+        "--driver-profile", choices=["lean", "full"], default="lean", help="드라이버 실행 설정 (LEAN_DRIVER 비교용)"
+    )
+    parser.add_argument("--output", default="bench_results.json", help="결과 JSON 경로")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+    args.output = os.path.abspath(args.output)
+
+    report = asyncio.run(run(args))
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"결과 저장: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"기준 결과와 비교 ({baseline.get('revision')} → {report['revision']}):")
+        compare(report["results"], baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""벤치마크용 가짜 LMS 관리자 서버.
+
+실제 LMS와 같은 XPath 구조의 로그인 페이지와 시험 상세 페이지를 제공한다.
+시험 ID가 곧 제출 수다 (예: /exams/100/detail → 학생 100명).
+
+    python -m benchmarks.fake_lms --port 8100 --latency 0.05 --ui-latency 0.02
+    LMS_BASE_URL=http://127.0.0.1:8100 uvicorn app.main:app
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+SESSION_COOKIE = "lms_session=bench"
+
+SIGN_IN_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"/><title>sign-in</title></head><body>
+<div id="app"><main><section><div><form onsubmit="return false;">
+<select id="site"><option value="kdt">KDT</option></select>
+<input id="userName" type="text"/>
+<input id="password" type="password"/>
+<button type="button" onclick="setTimeout(() => {{ document.cookie = '{cookie}; path=/'; location.href = '/'; }}, {ui_delay});">로그인</button>
+</form></div></section></main></div>
+</body></html>
+"""
+
+HOME_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"/><title>home</title></head><body><div id="app"><main><section><div>홈</div></section></main></div></body></html>
+"""
+
+# 첫 학생은 서버에서 그려 두고, 이후 전환(답안 모달, 다음 학생)은 ui_delay 후 스크립트로 갱신한다.
+DETAIL_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"/><title>exam {exam_id}</title></head><body>
+<div id="app"><main><section><div>
+<div>시험 {exam_id}</div>
+<div><div>
+<div>제출 현황</div>
+<div>
+<div><strong id="student-name">{first_name}</strong></div>
+<div><span>위치</span><span id="pagination">1 / {total}</span><button type="button">이전</button><button type="button" id="next">다음</button></div>
+</div>
+<div>답안</div>
+<div><div><div><table><tbody><tr><td>1</td><td>-</td><td>-</td><td>-</td><td>제출</td><td><button type="button" id="answer">보기</button></td></tr></tbody></table></div></div></div>
+</div></div>
+</div></section></main></div>
+<div id="modals"></div>
+<script>
+const total = {total};
+const uiDelay = {ui_delay};
+const secondModalEvery = {second_modal_every};
+let students = [];
+let index = 0;
+const modals = document.getElementById("modals");
+const render = () => {{
+  document.getElementById("student-name").textContent = students[index].userName;
+  document.getElementById("pagination").textContent = `${{index + 1}} / ${{total}}`;
+}};
+// 실제 SPA처럼 제출 목록 API를 호출해 데이터를 받는다 (api 모드 탐지 대상).
+const ready = fetch("/api/exams/{exam_id}/submissions?page=0&size=" + total).then((r) => r.json()).then((data) => {{ students = data.content; }});
+document.getElementById("next").onclick = () => ready.then(() => setTimeout(() => {{
+  if (index < total - 1) {{ index += 1; render(); }}
+}}, uiDelay));
+document.getElementById("answer").onclick = () => ready.then(() => setTimeout(() => {{
+  const p = document.createElement("p");
+  p.textContent = students[index].answer;
+  modals.innerHTML = '<section><div><div><div><div><button type="button">닫기</button></div><div><ul><li>문항</li><li><div></div></li></ul></div></div></div></div></section>';
+  modals.querySelector("li:nth-child(2) > div").appendChild(p);
+  modals.querySelector("button").onclick = () => setTimeout(() => {{
+    modals.firstElementChild.innerHTML = "";
+    if (secondModalEvery && (index + 1) % secondModalEvery === 0) {{
+      modals.insertAdjacentHTML("beforeend", '<section><div><div><section><div><button type="button">취소</button><button type="button">확인</button></div></section></div></div></section>');
+      modals.querySelectorAll("button")[1].onclick = () => setTimeout(() => {{ modals.innerHTML = ""; }}, uiDelay);
+    }} else {{
+      modals.innerHTML = "";
+    }}
+  }}, uiDelay);
+}}, uiDelay));
+</script>
+</body></html>
+"""
+
+
+def student(exam_id, index):
+    return {
+        "userName": f"학생{index + 1:04d}",
+        "answer": f"https://blog.example.com/exam-{exam_id}/student-{index + 1}",
+    }
+
+
+class FakeLMSHandler(BaseHTTPRequestHandler):
+    server_version = "FakeLMS/1.0"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body, content_type="text/html; charset=utf-8", headers=None):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _logged_in(self):
+        return SESSION_COOKIE in self.headers.get("Cookie", "")
+
+    def do_GET(self):
+        config = self.server.config
+        if config["latency"]:
+            time.sleep(config["latency"])
+        parts = urlsplit(self.path)
+        segments = [segment for segment in parts.path.split("/") if segment]
+        ui_delay = int(config["ui_latency"] * 1000)
+
+        if segments == ["sign-in"]:
+            return self._send(200, SIGN_IN_PAGE.format(cookie=SESSION_COOKIE, ui_delay=ui_delay))
+        if not self._logged_in():
+            return self._send(302, "", headers={"Location": "/sign-in"})
+        if not segments:
+            return self._send(200, HOME_PAGE)
+        if len(segments) == 3 and segments[0] == "exams" and segments[2] == "detail" and segments[1].isdigit():
+            exam_id = segments[1]
+            total = max(1, int(exam_id))
+            page = DETAIL_PAGE.format(
+                exam_id=exam_id,
+                total=total,
+                first_name=student(exam_id, 0)["userName"],
+                ui_delay=ui_delay,
+                second_modal_every=config["second_modal_every"],
+            )
+            return self._send(200, page)
+        if len(segments) == 4 and segments[:2] == ["api", "exams"] and segments[3] == "submissions":
+            exam_id = segments[2]
+            total = max(1, int(exam_id)) if exam_id.isdigit() else 0
+            query = parse_qs(parts.query)
+            page = int(query.get("page", ["0"])[0])
+            size = int(query.get("size", ["20"])[0])
+            content = [student(exam_id, i) for i in range(page * size, min(total, (page + 1) * size))]
+            body = json.dumps({"content": content, "totalElements": total}, ensure_ascii=False)
+            return self._send(200, body, "application/json; charset=utf-8")
+        return self._send(404, "not found", "text/plain; charset=utf-8")
+
+
+class FakeLMS:
+    """백그라운드 스레드에서 가짜 LMS를 띄운다. port=0이면 빈 포트를 자동으로 고른다."""
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, ui_latency=0.0, second_modal_every=0):
+        self.server = ThreadingHTTPServer((host, port), FakeLMSHandler)
+        self.server.daemon_threads = True
+        self.server.config = {
+            "latency": latency,
+            "ui_latency": ui_latency,
+            "second_modal_every": second_modal_every,
+        }
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, name="fake-lms", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="벤치마크용 가짜 LMS 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--latency", type=float, default=0.0, help="HTTP 응답 지연(초)")
+    parser.add_argument("--ui-latency", type=float, default=0.0, help="모달/다음 버튼 반응 지연(초)")
+    parser.add_argument("--second-modal-every", type=int, default=0, help="N명마다 확인 모달 표시 (0이면 없음)")
+    args = parser.parse_args()
+
+    lms = FakeLMS(args.host, args.port, args.latency, args.ui_latency, args.second_modal_every)
+    print(f"가짜 LMS 실행 중: {lms.base_url} (LMS_BASE_URL로 지정)")
+    try:
+        lms.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        lms.server.server_close()
+
+
+if __name__ == "__main__":
+    main()
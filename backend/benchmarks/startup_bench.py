@@ -0,0 +1,155 @@
+"""API 서버 콜드 스타트 측정: app.main import 시간과 프로세스 시작부터 첫 /api/health 응답까지의 시간.
+
+    cd backend
+    python -m benchmarks.startup_bench --repeat 5 --output startup.json
+    python -m benchmarks.startup_bench --baseline startup.json --max-import-ms 400   # 회귀 확인
+
+import 직후 무거운 모듈(selenium 등)이 이미 로드되어 있으면 지연 로딩이 깨진 것이므로 실패로 처리한다.
+"""
+
+import argparse
+import json
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+from .crawler_bench import _git_revision
+
+
+# API 기동 시 불러오면 안 되는 모듈 (수집/내보내기 때 불러온다)
+HEAVY_MODULES = ("selenium", "webdriver_manager", "httpx", "openpyxl", "pandas", "xml.dom.minidom", "zstandard")
+
+IMPORT_SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - started
+print(json.dumps({"seconds": elapsed, "heavy": [m for m in %r if m in sys.modules]}))
+""" % (HEAVY_MODULES,)
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _env():
+    env = dict(os.environ)
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+    # 세션 풀 예열이 실제 LMS에 로그인하지 않도록 계정 정보를 비운다 (예열은 곧바로 실패하고 서버는 계속 응답).
+    env["FASTCAMPUS_EMAIL"] = ""
+    env["FASTCAMPUS_PASSWORD"] = ""
+    return env
+
+
+def measure_import():
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT], cwd=BACKEND_DIR, env=_env(), capture_output=True, text=True, check=True
+    ).stdout
+    # dotenv 안내 등 다른 출력 뒤의 마지막 줄이 결과
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure_first_health(timeout=30.0):
+    """uvicorn을 띄워 /api/health가 처음 200을 돌려줄 때까지의 시간(초)."""
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}/api/health"
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR,
+        env=_env(),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            if process.poll() is not None:
+                raise RuntimeError(f"uvicorn이 종료되었습니다 (코드 {process.returncode})")
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - started
+            except OSError:
+                time.sleep(0.01)
+        raise TimeoutError(f"{timeout}s 안에 /api/health 응답이 없습니다.")
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def _summary(values):
+    return {
+        "median_ms": round(statistics.median(values) * 1000, 1),
+        "min_ms": round(min(values) * 1000, 1),
+        "max_ms": round(max(values) * 1000, 1),
+    }
+
+
+def run(args):
+    imports = [measure_import() for _ in range(args.repeat)]
+    health = [measure_first_health() for _ in range(args.repeat)]
+    heavy = sorted({module for result in imports for module in result["heavy"]})
+    return {
+        "revision": _git_revision(),
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "import": _summary([result["seconds"] for result in imports]),
+        "first_health": _summary(health),
+        "heavy_modules_at_import": heavy,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API 서버 콜드 스타트 벤치마크")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수")
+    parser.add_argument("--output", default="startup_results.json", help="결과 JSON 경로")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument("--max-import-ms", type=float, help="import 중앙값이 이 값을 넘으면 실패")
+    parser.add_argument("--max-health-ms", type=float, help="첫 health 응답 중앙값이 이 값을 넘으면 실패")
+    args = parser.parse_args()
+
+    report = run(args)
+    print(
+        f"import {report['import']['median_ms']}ms (최대 {report['import']['max_ms']}ms), "
+        f"첫 health 응답 {report['first_health']['median_ms']}ms (최대 {report['first_health']['max_ms']}ms)"
+    )
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"결과 저장: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"기준 결과와 비교 ({baseline.get('revision')} → {report['revision']}):")
+        for key in ("import", "first_health"):
+            old, new = baseline[key]["median_ms"], report[key]["median_ms"]
+            print(f"  {key:<13} {old:>8}ms → {new:>8}ms ({(new - old) / old * 100:+.1f}%)")
+
+    failures = []
+    if report["heavy_modules_at_import"]:
+        failures.append(f"import 시점에 로드된 무거운 모듈: {', '.join(report['heavy_modules_at_import'])}")
+    if args.max_import_ms and report["import"]["median_ms"] > args.max_import_ms:
+        failures.append(f"import {report['import']['median_ms']}ms > {args.max_import_ms}ms")
+    if args.max_health_ms and report["first_health"]["median_ms"] > args.max_health_ms:
+        failures.append(f"첫 health 응답 {report['first_health']['median_ms']}ms > {args.max_health_ms}ms")
+    for failure in failures:
+        print(f"❌ {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
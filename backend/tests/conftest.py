@@ -0,0 +1,35 @@
+import atexit
+import os
+import shutil
+import tempfile
+
+# 결과/체크포인트 디렉터리는 모듈 import 시점에 읽히므로 app을 불러오기 전에 임시 경로로 돌린다.
+_workdir = tempfile.mkdtemp(prefix="lms-tests-")
+atexit.register(shutil.rmtree, _workdir, True)
+os.environ.setdefault("ARTIFACT_DIR", os.path.join(_workdir, "artifacts"))
+os.environ.setdefault("CHECKPOINT_DIR", os.path.join(_workdir, "checkpoints"))
+
+import pytest
+
+from app import artifacts, checkpoint
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture(autouse=True)
+def checkpoint_dir(tmp_path, monkeypatch):
+    # 테스트마다 체크포인트/스냅샷을 따로 둔다.
+    directory = tmp_path / "checkpoints"
+    monkeypatch.setattr(checkpoint, "CHECKPOINT_DIR", str(directory))
+    return directory
+
+
+@pytest.fixture
+def artifact_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "artifacts"
+    directory.mkdir()
+    monkeypatch.setattr(artifacts, "ARTIFACT_DIR", str(directory))
+    return directory
@@ -0,0 +1,126 @@
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from app.crawler import LMS_BASE_URL, FastCampusLMSCrawler
+
+
+def student(index, suffix=""):
+    return {"수강자 이름": f"학생{index}", "블로그 링크": f"https://blog.example.com/{index}{suffix}"}
+
+
+class FakeDriver:
+    def __init__(self, session):
+        self.session = session
+        self.alive = True
+        self.url = "about:blank"
+        self.loads = 0
+
+    def _check(self):
+        if not self.alive:
+            raise WebDriverException("chrome not reachable")
+
+    @property
+    def current_url(self):
+        self._check()
+        return self.url
+
+    def get(self, url):
+        self._check()
+        self.url = url
+        self.loads += 1
+        self.session.position = 0
+
+    def execute_script(self, *args):
+        self._check()
+
+    def quit(self):
+        self.alive = False
+
+
+class PageSession(FastCampusLMSCrawler):
+    """시험 상세 페이지를 흉내 내는 세션. Selenium 대기/클릭 대신 students 목록과 현재 위치로 응답한다.
+
+    failures[위치]에 예외(또는 예외를 던지는 함수)를 넣으면 그 위치의 이름을 읽을 때 차례로 발생한다.
+    """
+
+    def __init__(self, students):
+        super().__init__()
+        self.students = list(students)
+        self.position = 0
+        self.driver = FakeDriver(self)
+        self.fast_path = False
+        self.retry.backoff = 0
+        self.failures = {}
+        self.reads = []
+        self.repositions = []
+        # 재로그인마다 reuse_cookies 인자를 남긴다.
+        self.logins = []
+
+    def crash(self):
+        self.driver.alive = False
+        raise WebDriverException("chrome not reachable")
+
+    def expire(self):
+        # 로그인이 만료되면 LMS가 로그인 페이지로 보내고 요소 대기는 시간 초과로 끝난다.
+        self.driver.url = f"{LMS_BASE_URL}/sign-in"
+        raise TimeoutException("'name' 단계 대기 시간 초과")
+
+    def _wait_text(self, xpath, condition=None, wait=None):
+        self.driver._check()
+        return f"{self.position + 1} / {len(self.students)}"
+
+    def _read_fields(self, scope, step):
+        self.driver._check()
+        if scope == "page":
+            pending = self.failures.get(self.position)
+            if pending:
+                failure = pending.pop(0)
+                if callable(failure):
+                    failure()
+                raise failure
+            self.reads.append(self.position)
+        row = self.students[self.position]
+        return {field.name: row.get(field.name, "") for field in self.schema.by_scope[scope]}, []
+
+    def _click_when_clickable(self, xpath, wait=None):
+        self.driver._check()
+
+    def _close_answer_modal(self):
+        return False
+
+    def _click_next_and_wait(self):
+        self.driver._check()
+        if self.position >= len(self.students) - 1:
+            raise TimeoutException("'next' 단계 대기 시간 초과")
+        self.position += 1
+        self._position += 1
+
+    def _current_index(self):
+        return self.position
+
+    def _reposition(self, index, reload=False):
+        self.repositions.append((index, reload))
+        return super()._reposition(index, reload)
+
+    def login_process(self, reuse_cookies=True):
+        self.logins.append(reuse_cookies)
+        self.driver = FakeDriver(self)
+        self.is_running = False
+        self.current_exam_id = None
+        return True
+
+
+async def crawl(session, exam_id, **options):
+    """crawl_exam_data_async를 실행하고 (수집 수, 로그 목록)을 반환한다. 로그: (level, step, index, message)"""
+    logs = []
+
+    async def progress_callback(progress, description):
+        pass
+
+    async def log_callback(message, level="info", step=None, index=None):
+        logs.append((level, step, index, message))
+
+    try:
+        count = await session.crawl_exam_data_async(exam_id, progress_callback, log_callback, **options)
+    finally:
+        session.close()
+    return count, logs
@@ -0,0 +1,146 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+
+from app.api_extractor import ApiExtractor, find_records, find_total
+from benchmarks.fake_lms import SESSION_COOKIE, FakeLMS
+
+
+def _submission(index):
+    return {"user": {"name": f"학생{index}"}, "answers": [{"content": "q"}, {"content": f"https://blog.example.com/{index}"}]}
+
+
+# 관리자 SPA에서 기록한 형태의 응답을 (경로, 쿼리)별로 재생한다. 기록되지 않은 요청은 404.
+RECORDED = {
+    # 1부터 시작하는 페이지 번호, 중첩된 목록과 전체 개수
+    ("/v1/exams/7/submissions", (("pageNo", "1"), ("pageSize", "2"))): {
+        "data": {"items": [_submission(0), _submission(1)], "meta": {"totalCount": 5}}
+    },
+    ("/v1/exams/7/submissions", (("pageNo", "2"), ("pageSize", "2"))): {
+        "data": {"items": [_submission(2), _submission(3)], "meta": {"totalCount": 5}}
+    },
+    ("/v1/exams/7/submissions", (("pageNo", "3"), ("pageSize", "2"))): {
+        "data": {"items": [_submission(4)], "meta": {"totalCount": 5}}
+    },
+    # offset/limit, 전체 개수 없음: 빈 페이지에서 멈춘다.
+    ("/offset/7", (("limit", "2"), ("offset", "0"))): {"results": [_submission(0), _submission(1)]},
+    ("/offset/7", (("limit", "2"), ("offset", "2"))): {"results": [_submission(2), _submission(3)]},
+    ("/offset/7", (("limit", "2"), ("offset", "4"))): {"results": []},
+    # 페이지 파라미터 없음: 한 번의 응답이 전체 목록
+    ("/all/7", ()): [_submission(0), _submission(1), _submission(2)],
+}
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        self.server.requests.append(self.path)
+        payload = RECORDED.get((parts.path, tuple(sorted(parse_qsl(parts.query)))))
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(404 if payload is None else 200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def replay_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ReplayHandler)
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    server.base_url = f"http://{host}:{port}"
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _names(items):
+    return [item["수강자 이름"] for item in items]
+
+
+@pytest.mark.anyio
+async def test_page_number_pagination_stops_at_total(replay_server):
+    extractor = ApiExtractor(f"{replay_server.base_url}/v1/exams/7/submissions?pageNo=1&pageSize=50", page_size=2)
+    pages = []
+
+    async def on_page(fetched, total):
+        pages.append((fetched, total))
+
+    items = await extractor.fetch_all(on_page)
+
+    assert _names(items) == [f"학생{i}" for i in range(5)]
+    assert items[4]["블로그 링크"] == "https://blog.example.com/4"
+    assert pages == [(2, 5), (4, 5), (5, 5)]
+    assert len(replay_server.requests) == 3
+
+
+@pytest.mark.anyio
+async def test_offset_pagination_stops_on_empty_page(replay_server):
+    extractor = ApiExtractor(f"{replay_server.base_url}/offset/7?offset=0&limit=10", page_size=2)
+
+    items = await extractor.fetch_all()
+
+    assert _names(items) == [f"학생{i}" for i in range(4)]
+    assert [dict(parse_qsl(urlsplit(path).query))["offset"] for path in replay_server.requests] == ["0", "2", "4"]
+
+
+@pytest.mark.anyio
+async def test_unpaged_endpoint_is_fetched_once(replay_server):
+    items = await ApiExtractor(f"{replay_server.base_url}/all/7").fetch_all()
+
+    assert _names(items) == ["학생0", "학생1", "학생2"]
+    assert replay_server.requests == ["/all/7"]
+
+
+@pytest.mark.anyio
+async def test_fake_lms_submissions_api():
+    lms = FakeLMS().start()
+    try:
+        name, _, value = SESSION_COOKIE.partition("=")
+        extractor = ApiExtractor(
+            f"{lms.base_url}/api/exams/5/submissions?page=0&size=100",
+            cookies={name: value},
+            page_size=2,
+            fields=[("수강자 이름", ["userName"]), ("블로그 링크", ["answer"])],
+        )
+        items = await extractor.fetch_all()
+    finally:
+        lms.stop()
+
+    assert _names(items) == [f"학생{i:04d}" for i in range(1, 6)]
+    assert items[0]["블로그 링크"] == "https://blog.example.com/exam-5/student-1"
+
+
+def test_find_records_and_total():
+    payload = {"status": "ok", "tags": ["a"], "data": {"page": {"totalElements": 3}, "content": [{"id": 1}, {"id": 2}]}}
+
+    assert find_records(payload) == [{"id": 1}, {"id": 2}]
+    assert find_total(payload) == 3
+    assert find_records({"items": [], "rows": [{"id": 1}]}) == [{"id": 1}]
+    assert find_records({"values": [1, 2]}) == []
+    assert find_total({"total": "3", "meta": {"count": 4}}) == 4
+    assert find_total([{"total": 1}]) is None
+
+
+@pytest.mark.anyio
+async def test_api_mode_requires_capture_or_url(monkeypatch):
+    import httpx
+
+    from app import api_extractor, main
+
+    monkeypatch.setattr(api_extractor, "NETWORK_CAPTURE", False)
+    monkeypatch.delenv("LMS_API_SUBMISSIONS_URL", raising=False)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=main.app), base_url="http://test") as client:
+        response = await client.post("/api/crawl", json={"exam_id": "7", "mode": "api"})
+
+    assert response.status_code == 400
+    assert "LMS_API_CAPTURE" in response.json()["detail"]
@@ -0,0 +1,134 @@
+import csv
+import json
+import os
+import sys
+from contextlib import asynccontextmanager
+
+import pytest
+
+from app import batch, pool
+
+
+class FakeCrawler:
+    """시험 ID로 결과가 정해지는 세션. 999는 수집 중 오류, 0으로 끝나는 ID는 빈 결과."""
+
+    def __init__(self):
+        self.collected_data = []
+
+    async def run_blocking(self, func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+    async def crawl_exam_data_async(self, exam_id, progress_callback, log_callback, **options):
+        if exam_id == "999":
+            raise RuntimeError("세션이 끊겼습니다")
+        if exam_id.endswith("0"):
+            return 0
+        self.collected_data = [{"수강자 이름": f"{exam_id}-학생{i}", "블로그 링크": ""} for i in range(2)]
+        return len(self.collected_data)
+
+    def export_artifacts(self, exam_id, file_formats, compression=(), bundle=False):
+        artifacts = []
+        for file_format in file_formats:
+            path = os.path.join(os.environ["ARTIFACT_DIR"], f"exam_data_{exam_id}.{file_format}")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(str(self.collected_data))
+            artifacts.append({"format": file_format, "path": path, "encodings": []})
+        return artifacts
+
+
+class FakePool:
+    created = []
+
+    def __init__(self, size=None, health_interval=None):
+        self.size = size
+        self.started = self.stopped = False
+        FakePool.created.append(self)
+
+    async def start(self):
+        self.started = True
+
+    async def stop(self):
+        self.stopped = True
+
+    @asynccontextmanager
+    async def lease(self):
+        yield FakeCrawler()
+
+
+@pytest.fixture
+def run_cli(monkeypatch, tmp_path):
+    FakePool.created = []
+    monkeypatch.setattr(pool, "DriverPool", FakePool)
+    # main()이 결과 디렉터리를 환경변수로 넘기므로 테스트가 끝나면 되돌린다.
+    monkeypatch.setenv("ARTIFACT_DIR", os.environ["ARTIFACT_DIR"])
+    monkeypatch.chdir(tmp_path)
+
+    def run_cli(*argv):
+        monkeypatch.setattr(sys, "argv", ["batch", *argv])
+        with pytest.raises(SystemExit) as exited:
+            batch.main()
+        return exited.value.code
+
+    return run_cli
+
+
+def test_read_exam_ids_from_arguments_and_file(tmp_path):
+    path = tmp_path / "exams.txt"
+    path.write_text("# 이번 주 시험\n102, 103\n104 101  # 재시험\n\n", encoding="utf-8")
+
+    assert batch.read_exam_ids(["101", "102"], str(path)) == ["101", "102", "103", "104"]
+    with pytest.raises(ValueError, match="abc"):
+        batch.read_exam_ids(["101", "abc"])
+
+
+@pytest.mark.parametrize(
+    "argv, message",
+    [
+        (["101", "abc"], "올바르지 않은 시험 ID: abc"),
+        ([], "시험 ID를 인자나 --file로 지정하세요"),
+        (["--file", "missing.txt"], "missing.txt"),
+        (["101", "--concurrency", "0"], "--concurrency는 1 이상"),
+        (["101", "--formats", "pdf"], "지원하지 않는 형식: pdf"),
+        (["101", "--compression", "brotli"], "지원하지 않는 형식: brotli"),
+        (["101", "--mode", "browser"], "invalid choice"),
+    ],
+)
+def test_invalid_arguments_exit_with_usage_error(run_cli, capsys, argv, message):
+    assert run_cli(*argv) == 2
+    assert message in capsys.readouterr().err
+    assert FakePool.created == []
+
+
+def test_all_exams_completed_exit_zero(run_cli, tmp_path, capsys):
+    assert run_cli("101", "102", "101", "--concurrency", "4", "--formats", "csv", "json") == 0
+
+    # 세션 수는 시험 수를 넘지 않고, 끝나면 정리된다.
+    (created,) = FakePool.created
+    assert created.size == 2 and created.started and created.stopped
+    assert sorted(os.listdir(tmp_path / "batch_output")) == [
+        "exam_data_101.csv", "exam_data_101.json", "exam_data_102.csv", "exam_data_102.json",
+    ]
+    assert "완료 2/2개, 총 4행" in capsys.readouterr().out
+
+
+def test_failed_exam_exits_one_and_reports_summary(run_cli, tmp_path):
+    code = run_cli(
+        "101", "999", "110", "102",
+        "--output-dir", "out", "--combined", "all", "--summary-json", "summary.json",
+    )
+
+    assert code == 1
+    summary = json.loads((tmp_path / "summary.json").read_text(encoding="utf-8"))
+    assert (summary["exams"], summary["completed"], summary["failed"], summary["rows"]) == (4, 2, 2, 4)
+    results = {result["exam_id"]: result for result in summary["results"]}
+    assert results["999"]["status"] == "failed" and results["999"]["error"] == "세션이 끊겼습니다"
+    assert results["110"]["status"] == "failed" and results["110"]["error"] == "수집된 데이터 없음"
+    assert results["101"]["artifacts"] == [str(tmp_path / "out" / "exam_data_101.csv")]
+
+    # 통합 파일에는 성공한 시험의 행만 시험 ID와 함께 들어간다.
+    assert summary["combined"] == [str(tmp_path / "out" / "all.csv")]
+    with open(tmp_path / "out" / "all.csv", newline="", encoding="utf-8-sig") as f:
+        rows = list(csv.DictReader(f))
+    assert sorted((row["시험 ID"], row["수강자 이름"]) for row in rows) == [
+        ("101", "101-학생0"), ("101", "101-학생1"), ("102", "102-학생0"), ("102", "102-학생1"),
+    ]
@@ -0,0 +1,69 @@
+import pytest
+
+from app.checkpoint import CheckpointStore, SnapshotStore
+from tests.fakes import PageSession, crawl, student
+
+
+def save_checkpoint(exam_id, total, indices):
+    store = CheckpointStore(exam_id)
+    store.open(fresh=True)
+    store.write_meta(total)
+    for index in indices:
+        # 저장된 행과 새로 수집한 행을 구분할 수 있도록 링크 끝에 표시를 붙인다.
+        store.append(index, student(index, "-saved"))
+    store.close()
+
+
+def errors(logs):
+    return [message for level, _, _, message in logs if level == "error"]
+
+
+@pytest.mark.anyio
+async def test_partial_resume_collects_only_missing_rows():
+    save_checkpoint(5, 5, [0, 1])
+    session = PageSession([student(i) for i in range(5)])
+
+    count, logs = await crawl(session, 5, resume=True)
+
+    assert count == 5
+    assert session.reads == [2, 3, 4]
+    assert [row["블로그 링크"].endswith("-saved") for row in session.collected_data] == [True, True, False, False, False]
+    assert not errors(logs)
+    assert SnapshotStore(5).load()["rows"] == session.collected_data
+
+
+@pytest.mark.anyio
+async def test_complete_resume_does_not_move_past_last_row():
+    save_checkpoint(4, 4, range(4))
+    session = PageSession([student(i) for i in range(4)])
+
+    count, logs = await crawl(session, 4, resume=True)
+
+    assert count == 4
+    assert session.reads == []
+    assert session.position == 0
+    assert not errors(logs)
+    assert [row["수강자 이름"] for row in SnapshotStore(4).load()["rows"]] == [f"학생{i}" for i in range(4)]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "stored_total, stored, expected_reads",
+    [
+        # 그 사이 제출자가 늘었다: 저장된 3개는 위치대로 재사용하고 뒤의 2개만 수집한다.
+        (3, range(3), [3, 4]),
+        # 제출자가 줄었다: 현재 총 항목 수를 넘는 저장 행은 버린다.
+        (7, range(7), []),
+    ],
+)
+async def test_resume_with_mismatched_total(stored_total, stored, expected_reads):
+    save_checkpoint(5, stored_total, stored)
+    session = PageSession([student(i) for i in range(5)])
+
+    count, logs = await crawl(session, 5, resume=True)
+
+    assert count == 5
+    assert session.reads == expected_reads
+    assert [row["수강자 이름"] for row in session.collected_data] == [f"학생{i}" for i in range(5)]
+    assert any(f"체크포인트 총 항목 수({stored_total})" in message for _, _, _, message in logs)
+    assert not errors(logs)
@@ -0,0 +1,189 @@
+import os
+import time
+
+import httpx
+import pytest
+
+from app import main
+from app.artifacts import etag, finalize, remove_stale, resolve, staging_base
+from app.exporters import compress_file
+
+BODY = b"0123456789abcdef"
+
+
+def stage(content):
+    path = f"{staging_base('exam_data_11')}.csv"
+    with open(path, "wb") as f:
+        f.write(content)
+    return path
+
+
+def test_finalize_names_files_by_content(artifact_dir):
+    first = finalize(stage(BODY), "exam_data_11")
+    same = finalize(stage(BODY), "exam_data_11")
+    other = finalize(stage(BODY + b"!"), "exam_data_11")
+
+    assert os.path.basename(first).startswith("exam_data_11_") and first.endswith(".csv")
+    assert same == first
+    assert other != first
+    # 같은 내용은 파일 하나만 남고 기록 중 숨김 파일은 정리된다.
+    assert sorted(os.listdir(artifact_dir)) == sorted(os.path.basename(path) for path in (first, other))
+
+
+def test_etag_uses_content_hash_or_file_stat(artifact_dir):
+    path = finalize(stage(BODY), "exam_data_11")
+    digest = os.path.basename(path)[len("exam_data_11_"):-len(".csv")]
+    assert etag(path) == f'"{digest}"'
+    assert etag(path, "gzip") == f'"{digest}-gzip"'
+
+    plain = artifact_dir / "notes.txt"
+    plain.write_bytes(BODY)
+    before = etag(str(plain))
+    os.utime(plain, ns=(0, 0))
+    assert etag(str(plain)) != before
+
+
+@pytest.mark.parametrize("name", ["../secret.csv", "/etc/passwd", ".exam_data_11_x.csv", "a/../b.csv", "a..b.csv", ""])
+def test_resolve_rejects_unsafe_names(artifact_dir, name):
+    assert resolve(name) is None
+
+
+def test_remove_stale_keeps_referenced_files(artifact_dir):
+    old, kept, fresh = (artifact_dir / name for name in ("old.csv", "kept.csv", "fresh.csv"))
+    for path in (old, kept, fresh):
+        path.write_bytes(BODY)
+    an_hour_ago = time.time() - 3600
+    for path in (old, kept):
+        os.utime(path, (an_hour_ago, an_hour_ago))
+
+    assert remove_stale(keep=[str(kept)], max_age=60) == 1
+    assert sorted(os.listdir(artifact_dir)) == ["fresh.csv", "kept.csv"]
+
+
+@pytest.fixture
+def artifact(artifact_dir):
+    return os.path.basename(finalize(stage(BODY), "exam_data_11"))
+
+
+async def download(filename, **headers):
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(f"/api/download/{filename}", headers={"accept-encoding": "identity", **headers})
+
+
+@pytest.mark.anyio
+async def test_download_full_body_with_validators(artifact):
+    response = await download(artifact)
+
+    assert response.status_code == 200
+    assert response.content == BODY
+    assert response.headers["etag"] == etag(resolve(artifact))
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.headers["content-type"].startswith("text/csv")
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("if_none_match", ["{tag}", "W/{tag}", '"other", {tag}', "*"])
+async def test_download_not_modified(artifact, if_none_match):
+    tag = etag(resolve(artifact))
+    response = await download(artifact, **{"if-none-match": if_none_match.format(tag=tag)})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == tag
+
+
+@pytest.mark.anyio
+async def test_download_stale_etag_sends_body(artifact):
+    response = await download(artifact, **{"if-none-match": '"other"'})
+
+    assert response.status_code == 200
+    assert response.content == BODY
+
+
+@pytest.mark.anyio
+async def test_download_serves_precompressed_variant(artifact):
+    compress_file(resolve(artifact), "gzip")
+    tag = etag(resolve(artifact), "gzip")
+
+    response = await download(artifact, **{"accept-encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"] == tag
+    assert response.content == BODY
+
+    assert (await download(artifact, **{"accept-encoding": "gzip", "if-none-match": tag})).status_code == 304
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "range_header, content_range, body",
+    [
+        ("bytes=2-5", "bytes 2-5/16", BODY[2:6]),
+        ("bytes=10-", "bytes 10-15/16", BODY[10:]),
+        ("bytes=-4", "bytes 12-15/16", BODY[-4:]),
+        ("bytes=14-100", "bytes 14-15/16", BODY[14:]),
+    ],
+)
+async def test_download_partial_content(artifact, range_header, content_range, body):
+    # 범위 요청은 압축본이 있어도 원본 바이트로 응답한다.
+    compress_file(resolve(artifact), "gzip")
+    response = await download(artifact, range=range_header, **{"accept-encoding": "gzip"})
+
+    assert response.status_code == 206
+    assert response.headers["content-range"] == content_range
+    assert response.headers["content-length"] == str(len(body))
+    assert "content-encoding" not in response.headers
+    assert response.content == body
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("range_header", ["bytes=16-", "bytes=100-200", "bytes=-0"])
+async def test_download_unsatisfiable_range(artifact, range_header):
+    response = await download(artifact, range=range_header)
+
+    assert response.status_code == 416
+    assert response.headers["content-range"] == "bytes */16"
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("range_header", ["bytes=5-3", "bytes=0-1,4-5", "items=0-3", "bytes=a-b"])
+async def test_download_ignores_invalid_or_multiple_ranges(artifact, range_header):
+    response = await download(artifact, range=range_header)
+
+    assert response.status_code == 200
+    assert response.content == BODY
+
+
+@pytest.mark.anyio
+async def test_download_if_range_mismatch_sends_full_body(artifact):
+    response = await download(artifact, range="bytes=0-3", **{"if-range": '"other"'})
+    assert response.status_code == 200
+    assert response.content == BODY
+
+    response = await download(artifact, range="bytes=0-3", **{"if-range": etag(resolve(artifact))})
+    assert response.status_code == 206
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("filename", [".hidden.csv", "a..b.csv", "exam data.csv", "..%5Csecret.csv"])
+async def test_download_rejects_unsafe_names(artifact_dir, filename):
+    # 기록 중 숨김 파일도 다운로드할 수 없다.
+    (artifact_dir / ".hidden.csv").write_bytes(BODY)
+
+    assert (await download(filename)).status_code == 400
+
+
+@pytest.mark.anyio
+async def test_download_cannot_escape_artifact_dir(artifact_dir):
+    (artifact_dir.parent / "secret.csv").write_bytes(BODY)
+
+    response = await download("..%2Fsecret.csv")
+
+    assert response.status_code in (400, 404)
+    assert response.content != BODY
+
+
+@pytest.mark.anyio
+async def test_download_missing_file(artifact_dir):
+    assert (await download("exam_data_11_0000000000000000.csv")).status_code == 404
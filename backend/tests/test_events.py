@@ -0,0 +1,102 @@
+import asyncio
+import json
+
+import pytest
+
+from app.events import EventBus, Subscriber
+
+
+def log(job_id, n):
+    return {"type": "log", "job_id": job_id, "message": f"로그 {n}"}
+
+
+def progress(job_id, value):
+    return {"type": "progress", "job_id": job_id, "progress": value}
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.frames = []
+
+    async def send_text(self, text):
+        self.frames.append(json.loads(text))
+
+
+def test_progress_is_coalesced_per_job():
+    subscriber = Subscriber()
+    for value in (0.1, 0.2, 0.3):
+        subscriber.push(progress("a", value))
+    subscriber.push(progress("b", 0.5))
+    subscriber.push(log("a", 1))
+
+    # 로그는 모두 보내고, 진행률은 작업별 마지막 값만 보낸다.
+    assert subscriber.drain() == [log("a", 1), progress("a", 0.3), progress("b", 0.5)]
+    assert subscriber.drain() == []
+    assert subscriber.dropped == 0
+
+
+def test_full_queue_drops_oldest_events():
+    subscriber = Subscriber(max_pending=3)
+    for n in range(5):
+        subscriber.push(log("a", n))
+    subscriber.push(progress("a", 0.9))
+
+    assert subscriber.drain() == [log("a", 2), log("a", 3), log("a", 4), progress("a", 0.9)]
+    assert subscriber.dropped == 2
+
+
+def test_publish_routes_by_channel_and_slow_subscriber_does_not_affect_others():
+    bus = EventBus(max_pending=2)
+    everything = bus.subscribe()
+    job_a = bus.subscribe("a")
+    job_b = bus.subscribe("b")
+
+    for n in range(4):
+        bus.publish(log("a", n))
+    bus.publish(log("b", 0))
+
+    # 전체 구독자만 넘쳐서 오래된 이벤트를 버리고, 다른 구독자의 대기열은 그대로다.
+    assert everything.drain() == [log("a", 3), log("b", 0)]
+    assert everything.dropped == 3
+    assert job_a.drain() == [log("a", 2), log("a", 3)]
+    assert job_b.drain() == [log("b", 0)]
+    assert job_b.dropped == 0
+
+    bus.unsubscribe(job_b)
+    bus.publish(log("b", 1))
+    assert job_b.drain() == []
+
+
+def test_replay_per_channel_and_channel_limit():
+    bus = EventBus(replay_size=2, max_channels=2)
+    for job_id in ("a", "b", "c"):
+        for n in range(3):
+            bus.publish(log(job_id, n))
+
+    assert bus.subscribe(replay=True).drain() == [log("c", 1), log("c", 2)]
+    assert bus.subscribe("b", replay=True).drain() == [log("b", 1), log("b", 2)]
+    # 채널 수 제한을 넘으면 가장 오래된 채널 기록을 버린다.
+    assert bus.subscribe("a", replay=True).drain() == []
+    assert bus.subscribe("a").drain() == []
+
+
+@pytest.mark.anyio
+async def test_stream_sends_single_event_raw_and_batches_the_rest():
+    bus = EventBus(batch_interval=0.01)
+    subscriber = bus.subscribe("a")
+    websocket = FakeWebSocket()
+    sender = asyncio.create_task(bus.stream(websocket, subscriber))
+    try:
+        bus.publish(log("a", 0))
+        await asyncio.sleep(0.05)
+        bus.publish(log("a", 1))
+        bus.publish(progress("a", 0.4))
+        bus.publish(progress("a", 0.5))
+        await asyncio.sleep(0.05)
+    finally:
+        sender.cancel()
+
+    assert websocket.frames == [
+        log("a", 0),
+        {"type": "batch", "events": [log("a", 1), progress("a", 0.5)]},
+    ]
@@ -0,0 +1,138 @@
+import csv
+import gzip
+import json
+import os
+import xml.etree.ElementTree as ET
+import zipfile
+
+import pytest
+
+from app.crawler import FastCampusLMSCrawler
+from app.exporters import WRITERS, OrderedRowWriter, bundle_files, compress_file, open_writer
+
+COLUMNS = ["수강자 이름", "블로그 링크", "점수"]
+TAGS = {"수강자 이름": "name", "블로그 링크": "blog_link", "점수": "score"}
+# 구분자/따옴표/줄바꿈/XML 특수문자가 섞인 값도 그대로 돌아와야 한다.
+ROWS = [
+    {"수강자 이름": "김, \"철수\"", "블로그 링크": "https://blog.example.com/a?x=1&y=<2>", "점수": "90"},
+    {"수강자 이름": "이영희", "블로그 링크": "첫 줄\n둘째 줄", "점수": ""},
+]
+
+
+def read_back(file_format, path):
+    if file_format == "csv":
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            return list(csv.DictReader(f))
+    if file_format == "json":
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    if file_format == "jsonl":
+        with open(path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+    if file_format == "xml":
+        tags = {tag: column for column, tag in TAGS.items()}
+        return [{tags[child.tag]: child.text or "" for child in student} for student in ET.parse(path).getroot()]
+    from openpyxl import load_workbook
+
+    rows = list(load_workbook(path, read_only=True).active.iter_rows(values_only=True))
+    return [{column: value or "" for column, value in zip(rows[0], row)} for row in rows[1:]]
+
+
+def write(file_format, base, rows):
+    writer = open_writer(file_format, str(base), COLUMNS, TAGS)
+    for row in rows:
+        writer.write(row)
+    writer.close()
+    return writer.path
+
+
+@pytest.mark.parametrize("file_format", sorted(WRITERS))
+def test_writer_round_trip(tmp_path, file_format):
+    path = write(file_format, tmp_path / "result", ROWS)
+
+    assert path == f"{tmp_path / 'result'}.{file_format}"
+    assert read_back(file_format, path) == ROWS
+
+
+@pytest.mark.parametrize("file_format", sorted(WRITERS))
+def test_writer_without_rows(tmp_path, file_format):
+    path = write(file_format, tmp_path / "empty", [])
+
+    assert read_back(file_format, path) == []
+
+
+def test_open_writer_rejects_unknown_format(tmp_path):
+    assert open_writer("pdf", str(tmp_path / "result")) is None
+
+
+def test_ordered_writer_restores_index_order(tmp_path):
+    writer = OrderedRowWriter([open_writer("jsonl", str(tmp_path / "ordered"), COLUMNS)])
+    rows = [{"수강자 이름": f"학생{i}"} for i in range(6)]
+    # 샤드가 뒤 구간을 먼저 끝내고, 4번은 끝내 도착하지 않는다. 이미 기록한 인덱스의 중복은 무시한다.
+    for index in (3, 1, 0, 0, 2, 5):
+        writer.add(index, rows[index])
+    assert writer.count == 4
+
+    writer.close()
+
+    assert writer.count == 5
+    assert [row["수강자 이름"] for row in read_back("jsonl", writer.paths[0])] == ["학생0", "학생1", "학생2", "학생3", "학생5"]
+
+
+def test_gzip_variant_round_trip(tmp_path):
+    path = write("csv", tmp_path / "result", ROWS)
+
+    compressed = compress_file(path, "gzip")
+
+    assert compressed == f"{path}.gz"
+    with open(path, "rb") as f, gzip.open(compressed, "rb") as g:
+        assert g.read() == f.read()
+
+
+def test_zstd_variant_round_trip(tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+    path = write("json", tmp_path / "result", ROWS)
+
+    compressed = compress_file(path, "zstd")
+
+    assert compressed == f"{path}.zst"
+    with open(path, "rb") as f, open(compressed, "rb") as z:
+        assert zstandard.ZstdDecompressor().stream_reader(z).read() == f.read()
+
+
+def test_unknown_compression_is_skipped(tmp_path):
+    path = write("csv", tmp_path / "result", ROWS)
+
+    assert compress_file(path, "brotli") is None
+    assert os.listdir(tmp_path) == ["result.csv"]
+
+
+def test_bundle_contains_every_file(tmp_path):
+    paths = [write(file_format, tmp_path / "result", ROWS) for file_format in ("csv", "xlsx")]
+
+    bundle_files(paths, str(tmp_path / "bundle.zip"))
+
+    with zipfile.ZipFile(tmp_path / "bundle.zip") as bundle:
+        assert sorted(bundle.namelist()) == ["result.csv", "result.xlsx"]
+        with open(paths[0], "rb") as f:
+            assert bundle.read("result.csv") == f.read()
+
+
+def test_export_artifacts_in_one_pass(artifact_dir):
+    crawler = FastCampusLMSCrawler()
+    crawler.collected_data = ROWS
+    try:
+        artifacts = crawler.export_artifacts("42", ["csv", "xlsx", "jsonl"], compression=["gzip"], bundle=True)
+    finally:
+        crawler.close()
+
+    by_format = {artifact["format"]: artifact for artifact in artifacts}
+    assert list(by_format) == ["csv", "xlsx", "jsonl", "zip"]
+    # xlsx는 이미 압축된 형식이라 gzip 변형을 만들지 않는다.
+    assert [by_format[name]["encodings"] for name in ("csv", "xlsx", "jsonl", "zip")] == [["gzip"], [], ["gzip"], []]
+    assert os.path.exists(by_format["csv"]["path"] + ".gz")
+    assert not os.path.exists(by_format["xlsx"]["path"] + ".gz")
+    with zipfile.ZipFile(by_format["zip"]["path"]) as bundle:
+        assert sorted(bundle.namelist()) == sorted(os.path.basename(by_format[name]["path"]) for name in ("csv", "xlsx", "jsonl"))
+    # 기록 중 숨김 파일은 남지 않는다.
+    assert not [name for name in os.listdir(artifact_dir) if name.startswith(".")]
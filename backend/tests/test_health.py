@@ -0,0 +1,88 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+
+import httpx
+import pytest
+
+from app import main
+from app.jobs import JobScheduler
+from app.metrics import JobMetrics
+
+
+class SlowCrawler:
+    """Selenium 대신 전용 스레드에서 sleep 하는 가짜 세션. 이벤트 루프에서 blocking 호출을 하면 health가 느려진다."""
+
+    def __init__(self, steps=3, step_seconds=0.3):
+        self.steps = steps
+        self.step_seconds = step_seconds
+        self.metrics = JobMetrics()
+        self.last_diff = None
+        self.busy = threading.Event()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    async def run_blocking(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    def _slow_step(self):
+        self.busy.set()
+        time.sleep(self.step_seconds)
+
+    async def crawl_exam_data_async(self, exam_id, progress_callback, log_callback, **options):
+        for i in range(self.steps):
+            await self.run_blocking(self._slow_step)
+            await progress_callback(0.4 + 0.5 * (i + 1) / self.steps, f"{i + 1}/{self.steps}")
+        self.busy.clear()
+        return self.steps
+
+    def export_artifacts(self, exam_id, file_formats, compression=(), bundle=False):
+        return [{"format": file_format, "path": f"exam_data_{exam_id}.{file_format}", "encodings": []} for file_format in file_formats]
+
+    def stop(self):
+        pass
+
+
+class FakePool:
+    def __init__(self, crawler):
+        self.crawler = crawler
+
+    @asynccontextmanager
+    async def lease(self):
+        yield self.crawler
+
+    @asynccontextmanager
+    async def lease_extra(self, count):
+        yield []
+
+
+@pytest.mark.anyio
+async def test_health_stays_fast_while_driver_is_busy(monkeypatch):
+    crawler = SlowCrawler()
+    monkeypatch.setattr(main, "driver_pool", FakePool(crawler))
+    monkeypatch.setattr(main, "scheduler", JobScheduler(main.run_crawling_task, concurrency=1))
+
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post("/api/crawl", json={"exam_id": "123", "force": True, "compression": []})
+        assert response.status_code == 200
+        job = main.scheduler.get(response.json()["job_id"])
+
+        # 가짜 드라이버가 blocking 작업에 들어간 뒤에 측정한다.
+        await asyncio.to_thread(crawler.busy.wait, 5)
+        latencies = []
+        while crawler.busy.is_set():
+            started = time.perf_counter()
+            health = await client.get("/api/health")
+            latencies.append(time.perf_counter() - started)
+            assert health.json() == {"status": "ok"}
+            await asyncio.sleep(0.01)
+
+        await asyncio.wait_for(job.task, 5)
+
+    assert job.status == "completed"
+    assert len(latencies) >= 10
+    assert max(latencies) < 0.05, f"health 최대 지연 {max(latencies) * 1000:.1f}ms"
@@ -0,0 +1,52 @@
+import pytest
+
+from app.checkpoint import SnapshotStore
+from tests.fakes import PageSession, crawl, student
+
+
+async def crawl_incremental(students, exam_id=7):
+    session = PageSession(students)
+    count, logs = await crawl(session, exam_id, incremental=True)
+    assert not [message for level, _, _, message in logs if level == "error"]
+    return session, count
+
+
+@pytest.mark.anyio
+async def test_incremental_without_new_students_saves_empty_diff():
+    students = [student(i) for i in range(3)]
+    await crawl_incremental(students)
+
+    for _ in range(2):
+        session, count = await crawl_incremental(students)
+        assert count == 3
+        # 기준 확인을 위해 마지막 항목만 읽고 새로 수집하지 않는다.
+        assert session.reads == [2]
+        assert session.last_diff == {"added": [], "removed": [], "changed": []}
+        assert SnapshotStore(7).load()["rows"] == students
+
+
+@pytest.mark.anyio
+async def test_incremental_collects_only_appended_students():
+    await crawl_incremental([student(i) for i in range(3)])
+
+    students = [student(i) for i in range(5)]
+    session, count = await crawl_incremental(students)
+
+    assert count == 5
+    assert session.reads == [2, 3, 4]
+    assert session.last_diff["added"] == students[3:]
+    assert SnapshotStore(7).load()["rows"] == students
+
+
+@pytest.mark.anyio
+async def test_incremental_falls_back_to_full_crawl_when_order_changed():
+    await crawl_incremental([student(i) for i in range(3)])
+
+    # 이전 마지막 학생이 목록에서 빠지면 기준이 맞지 않아 전체를 다시 수집하고 삭제도 보고된다.
+    students = [student(i) for i in (0, 1, 3, 4)]
+    session, count = await crawl_incremental(students)
+
+    assert count == 4
+    assert session.reads == [2, 0, 1, 2, 3]
+    assert session.last_diff["added"] == students[2:]
+    assert session.last_diff["removed"] == [student(2)]
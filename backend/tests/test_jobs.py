@@ -0,0 +1,56 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from app import main
+from app.jobs import JobScheduler
+
+
+class RecordingCrawler:
+    def __init__(self):
+        self.crawled = False
+        self.stopped = False
+
+    def stop(self):
+        self.stopped = True
+
+    async def crawl_exam_data_async(self, *args, **kwargs):
+        self.crawled = True
+        return 0
+
+
+class SlowHelperPool:
+    """보조 세션 준비(로그인)가 오래 걸리는 풀."""
+
+    def __init__(self, crawler):
+        self.crawler = crawler
+        self.leasing_helpers = asyncio.Event()
+
+    @asynccontextmanager
+    async def lease(self):
+        yield self.crawler
+
+    @asynccontextmanager
+    async def lease_extra(self, count):
+        self.leasing_helpers.set()
+        await asyncio.sleep(0.1)
+        yield []
+
+
+@pytest.mark.anyio
+async def test_cancel_while_leasing_helpers_stops_job(monkeypatch):
+    crawler = RecordingCrawler()
+    pool = SlowHelperPool(crawler)
+    scheduler = JobScheduler(main.run_crawling_task, concurrency=1)
+    monkeypatch.setattr(main, "driver_pool", pool)
+    monkeypatch.setattr(main, "scheduler", scheduler)
+
+    job = scheduler.submit("11", shards=3)
+    await asyncio.wait_for(pool.leasing_helpers.wait(), 1)
+    assert scheduler.cancel(job.job_id)
+    await asyncio.wait_for(job.task, 1)
+
+    assert crawler.stopped
+    assert not crawler.crawled
+    assert job.status == "cancelled"
@@ -0,0 +1,95 @@
+import json
+
+import httpx
+import pytest
+
+from app import main
+from app.jobs import CrawlJob, JobScheduler
+from app.logbuffer import LogBuffer
+
+
+def test_ring_buffer_keeps_latest_records():
+    logs = LogBuffer(capacity=3)
+    for n in range(5):
+        logs.add("로그 %d", n)
+
+    assert logs.dropped == 2
+    assert logs.tail() == ["로그 2", "로그 3", "로그 4"]
+    records, next_cursor = logs.query()
+    # 버려진 로그는 건너뛰고 남아 있는 것부터 돌려준다.
+    assert [record["seq"] for record in records] == [2, 3, 4]
+    assert next_cursor == 5
+
+
+def test_query_filters_by_level_and_pages_with_cursor():
+    logs = LogBuffer(capacity=10)
+    for n, level in enumerate(["info", "warning", "debug", "error", "info", "warning"]):
+        logs.add(f"로그 {n}", level=level, step="name", index=n)
+
+    records, cursor = logs.query(level="warning", limit=2)
+    assert [(record["seq"], record["level"]) for record in records] == [(1, "warning"), (3, "error")]
+    assert records[0]["step"] == "name" and records[0]["index"] == 1
+
+    records, cursor = logs.query(cursor, level="warning")
+    assert [record["seq"] for record in records] == [5]
+    assert cursor == 6
+    # 새 로그가 없으면 커서는 그대로다.
+    assert logs.query(cursor) == ([], 6)
+
+
+def test_cursor_older_than_buffer_skips_dropped_records():
+    logs = LogBuffer(capacity=2)
+    for n in range(4):
+        logs.add(f"로그 {n}", level="debug")
+
+    # 남은 로그가 모두 걸러져도 커서는 버려진 로그 뒤로 이동한다.
+    assert logs.query(0, level="error") == ([], 4)
+
+
+def test_sink_writes_json_lines(tmp_path):
+    path = tmp_path / "logs" / "job.jsonl"
+    logs = LogBuffer(capacity=1, sink_path=str(path))
+    logs.add("첫 로그")
+    logs.add("둘째 로그", level="error")
+    logs.close()
+
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [(line["seq"], line["level"], line["message"]) for line in lines] == [(0, "info", "첫 로그"), (1, "error", "둘째 로그")]
+
+
+@pytest.fixture
+def job(monkeypatch):
+    scheduler = JobScheduler(main.run_crawling_task, concurrency=1)
+    monkeypatch.setattr(main, "scheduler", scheduler)
+    job = CrawlJob("11")
+    scheduler.jobs[job.job_id] = job
+    for n, level in enumerate(["info", "error", "warning", "info"]):
+        job.logs.add(f"로그 {n}", level=level)
+    return job
+
+
+async def get(path, **params):
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(path, params=params)
+
+
+@pytest.mark.anyio
+async def test_logs_endpoint_filters_by_level(job):
+    response = await get(f"/api/logs/{job.job_id}", level="warning", limit=1)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [record["message"] for record in body["records"]] == ["로그 1"]
+    assert body["next_cursor"] == 2
+    assert body["dropped"] == 0
+
+    body = (await get(f"/api/logs/{job.job_id}", level="warning", cursor=body["next_cursor"])).json()
+    assert [record["message"] for record in body["records"]] == ["로그 2"]
+    assert body["next_cursor"] == 4
+
+
+@pytest.mark.anyio
+async def test_logs_endpoint_rejects_unknown_level_and_job(job):
+    assert (await get(f"/api/logs/{job.job_id}", level="verbose")).status_code == 400
+    assert (await get("/api/logs/unknown")).status_code == 404
@@ -0,0 +1,63 @@
+import httpx
+import pytest
+
+from app import main
+from app.metrics import MetricsRegistry
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("step_seconds", "단계 시간", labels=("step",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, step="name")
+    histogram.observe(0.2, step="modal")
+
+    assert registry.render().splitlines() == [
+        "# HELP step_seconds 단계 시간",
+        "# TYPE step_seconds histogram",
+        'step_seconds_bucket{step="modal",le="0.1"} 0',
+        'step_seconds_bucket{step="modal",le="1.0"} 1',
+        'step_seconds_bucket{step="modal",le="+Inf"} 1',
+        'step_seconds_sum{step="modal"} 0.200000',
+        'step_seconds_count{step="modal"} 1',
+        # 경계값은 해당 구간에 포함되고, 마지막 경계를 넘는 값은 +Inf에만 잡힌다.
+        'step_seconds_bucket{step="name",le="0.1"} 2',
+        'step_seconds_bucket{step="name",le="1.0"} 3',
+        'step_seconds_bucket{step="name",le="+Inf"} 4',
+        'step_seconds_sum{step="name"} 3.650000',
+        'step_seconds_count{step="name"} 4',
+    ]
+
+
+def test_counters_and_label_escaping():
+    registry = MetricsRegistry()
+    restarts = registry.counter("restarts_total", "재시작 횟수")
+    failures = registry.counter("failures_total", "실패 횟수", labels=("kind",))
+    failures.inc(kind='say "hi"\\n')
+    failures.inc(2, kind="stale")
+    failures.inc(kind="stale")
+
+    assert registry.render() == (
+        "# HELP restarts_total 재시작 횟수\n"
+        "# TYPE restarts_total counter\n"
+        # 레이블 없는 카운터는 증가 전에도 0으로 노출된다.
+        "restarts_total 0\n"
+        "# HELP failures_total 실패 횟수\n"
+        "# TYPE failures_total counter\n"
+        'failures_total{kind="say \\"hi\\"\\\\n"} 1\n'
+        'failures_total{kind="stale"} 3\n'
+    )
+    restarts.inc()
+    assert "restarts_total 1\n" in registry.render()
+
+
+@pytest.mark.anyio
+async def test_metrics_endpoint_serves_prometheus_text():
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/api/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE lms_crawl_step_seconds histogram" in response.text
+    assert "# TYPE lms_jobs_finished_total counter" in response.text
@@ -0,0 +1,150 @@
+import asyncio
+import os
+import time
+
+import httpx
+import pytest
+
+from app import main
+from app.jobs import CrawlJob, JobScheduler
+from app.results import ResultStore
+from app.schema import ExtractionSchema
+
+NAME = {"name": "수강자 이름", "selector": "//h2", "scope": "page"}
+
+
+def finished_job(directory, exam_id, content="a,b\n", file_formats=("csv",), status="completed", finished_at=None):
+    job = CrawlJob(exam_id, file_formats=file_formats)
+    path = os.path.join(directory, f"exam_data_{exam_id}_{job.job_id}.csv")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    job.status = status
+    job.count = 1
+    job.file_path = path
+    job.artifacts = [{"format": "csv", "path": path, "encodings": []}]
+    job.started_at = time.time()
+    job.finished_at = finished_at or time.time()
+    return job
+
+
+def test_signature_covers_full_field_definitions():
+    def signature(*fields):
+        return ResultStore.signature(["csv"], schema=ExtractionSchema([NAME, *fields]))
+
+    base = signature({"name": "점수", "selector": ".score", "post": "int"})
+    assert base == signature({"name": "점수", "selector": ".score", "post": ["int"]})
+    # 열 이름이 같아도 선택자/후처리기/속성/태그가 다르면 다른 결과다.
+    assert base != signature({"name": "점수", "selector": ".total", "post": "int"})
+    assert base != signature({"name": "점수", "selector": ".score", "post": "float"})
+    assert base != signature({"name": "점수", "selector": ".score", "post": "int", "attribute": "data-value"})
+    assert base != signature({"name": "점수", "selector": ".score", "post": "int", "tag": "score"})
+    assert base != signature({"name": "점수", "selector": ".score", "post": "int", "scope": "page"})
+    assert base != ResultStore.signature(["csv"], compression=["gzip"], schema=ExtractionSchema([NAME, {"name": "점수", "selector": ".score", "post": "int"}]))
+
+
+def test_lookup_hits_matching_completed_result(artifact_dir):
+    store = ResultStore(ttl=60, max_bytes=1 << 20)
+    entry = store.record(finished_job(artifact_dir, "11"))
+    store.record(finished_job(artifact_dir, "12", status="cancelled"))
+    signature = ResultStore.signature(["csv"])
+
+    assert store.lookup("11", signature) is entry
+    assert store.lookup("11", ResultStore.signature(["xlsx"])) is None
+    # 중지된 작업의 부분 결과는 재사용하지 않는다.
+    assert store.lookup("12", signature) is None
+
+
+def test_lookup_drops_expired_result_and_files(artifact_dir):
+    store = ResultStore(ttl=60, max_bytes=1 << 20)
+    job = finished_job(artifact_dir, "11", finished_at=time.time() - 120)
+    store.record(job)
+
+    # record가 바로 정리한다.
+    assert not store.entries
+    assert not os.path.exists(job.file_path)
+
+    job = finished_job(artifact_dir, "11")
+    store.record(job)
+    store.entries[job.job_id].created_at -= 120
+    assert store.lookup("11", ResultStore.signature(["csv"])) is None
+    assert not os.path.exists(job.file_path)
+
+
+def test_lru_eviction_keeps_recently_used_results(artifact_dir):
+    store = ResultStore(ttl=60, max_bytes=25)
+    first = finished_job(artifact_dir, "1", "x" * 10)
+    second = finished_job(artifact_dir, "2", "y" * 10)
+    store.record(first)
+    store.record(second)
+    # 1번을 다시 쓰면 2번이 가장 오래 쓰이지 않은 결과가 된다.
+    assert store.lookup("1", ResultStore.signature(["csv"]))
+
+    third = finished_job(artifact_dir, "3", "z" * 10)
+    store.record(third)
+
+    assert [entry.exam_id for entry in store.entries.values()] == ["1", "3"]
+    assert not os.path.exists(second.file_path)
+    assert os.path.exists(first.file_path) and os.path.exists(third.file_path)
+    assert store.total_bytes == 20
+
+
+def test_oversized_single_result_is_kept(artifact_dir):
+    store = ResultStore(ttl=60, max_bytes=5)
+    job = finished_job(artifact_dir, "1", "x" * 10)
+    store.record(job)
+
+    assert list(store.entries) == [job.job_id]
+
+
+@pytest.fixture
+def api(monkeypatch, artifact_dir):
+    store = ResultStore(ttl=60, max_bytes=1 << 20)
+    runs = []
+
+    async def runner(job):
+        runs.append(job.exam_id)
+        finished = finished_job(artifact_dir, job.exam_id, f"{len(runs)}\n")
+        job.count, job.file_path, job.artifacts = finished.count, finished.file_path, finished.artifacts
+
+    scheduler = JobScheduler(runner, concurrency=1, on_finish=store.record)
+    monkeypatch.setattr(main, "result_store", store)
+    monkeypatch.setattr(main, "scheduler", scheduler)
+
+    async def crawl(**body):
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post("/api/crawl", json={"exam_id": "11", **body})
+        assert response.status_code == 200
+        job = scheduler.get(response.json()["job_id"])
+        if job.task:
+            await asyncio.wait_for(job.task, 1)
+        return job
+
+    crawl.runs = runs
+    crawl.store = store
+    return crawl
+
+
+@pytest.mark.anyio
+async def test_repeated_request_reuses_result_until_forced(api):
+    first = await api()
+    cached = await api()
+    assert cached.cached_from == first.job_id
+    assert cached.artifacts == first.artifacts
+    assert api.runs == ["11"]
+
+    forced = await api(force=True)
+    assert forced.cached_from is None
+    assert api.runs == ["11", "11"]
+    # 재수집 결과가 이전 결과를 대체하고 이전 파일은 지워진다.
+    assert [entry.job_id for entry in api.store.entries.values()] == [forced.job_id]
+    assert not os.path.exists(first.file_path)
+    assert (await api()).cached_from == forced.job_id
+
+
+@pytest.mark.anyio
+async def test_changed_selector_is_not_served_from_cache(api):
+    await api(schema=[NAME, {"name": "점수", "selector": ".score"}])
+    assert (await api(schema=[NAME, {"name": "점수", "selector": ".score"}])).cached_from
+    assert not (await api(schema=[NAME, {"name": "점수", "selector": ".total"}])).cached_from
+    assert api.runs == ["11", "11"]
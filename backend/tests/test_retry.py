@@ -0,0 +1,142 @@
+import pytest
+from selenium.common.exceptions import (
+    InvalidSessionIdException,
+    NoSuchElementException,
+    NoSuchWindowException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+
+from app.checkpoint import SnapshotStore
+from app.retry import classify_failure
+from tests.fakes import PageSession, crawl, student
+
+STUDENTS = [student(i) for i in range(5)]
+
+
+def names(session):
+    return [row["수강자 이름"] for row in session.collected_data]
+
+
+@pytest.mark.parametrize(
+    "exc, kind",
+    [
+        (StaleElementReferenceException("gone"), "stale"),
+        (WebDriverException("stale element reference: element is not attached"), "stale"),
+        (TimeoutException("timed out"), "timeout"),
+        (InvalidSessionIdException("invalid session id"), "driver_crash"),
+        (NoSuchWindowException("window closed"), "driver_crash"),
+        (ConnectionRefusedError("refused"), "driver_crash"),
+        (WebDriverException("unknown error: Chrome not reachable"), "driver_crash"),
+        (WebDriverException("HTTPConnectionPool: Max retries exceeded with url"), "driver_crash"),
+        (NoSuchElementException("no such element"), "other"),
+        (ValueError("bad value"), "other"),
+    ],
+)
+def test_classify_failure(exc, kind):
+    assert classify_failure(exc) == kind
+
+
+@pytest.mark.anyio
+async def test_stale_element_is_retried_in_place():
+    session = PageSession(STUDENTS)
+    session.failures = {2: [StaleElementReferenceException("stale element")]}
+
+    count, _ = await crawl(session, 5)
+
+    assert count == 5
+    assert session.repositions == [(2, False)]
+    assert session.logins == []
+    assert session.reads == [0, 1, 2, 3, 4]
+    assert session.metrics.failures == {"stale": 1}
+
+
+@pytest.mark.anyio
+async def test_timeout_recovers_without_reload_then_reloads_when_position_is_lost():
+    session = PageSession(STUDENTS)
+
+    def lost_position():
+        # 오류와 함께 화면이 다음 학생으로 넘어가 버렸다: 제자리 복구는 위치를 되돌릴 수 없으므로 새로고침한다.
+        session.position += 1
+        raise TimeoutException("'name' 단계 대기 시간 초과")
+
+    session.failures = {1: [TimeoutException("'name' 단계 대기 시간 초과"), lost_position]}
+    driver = session.driver
+
+    count, _ = await crawl(session, 5)
+
+    assert count == 5
+    assert session.repositions == [(1, False), (1, False)]
+    # 첫 페이지 이동 + 위치를 잃은 뒤의 새로고침
+    assert driver.loads == 2
+    assert session.reads == [0, 1, 2, 3, 4]
+    assert names(session) == [f"학생{i}" for i in range(5)]
+    assert session.metrics.failures == {"timeout": 2}
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "fail, kind, reuse_cookies",
+    [
+        # 드라이버가 죽으면 새 드라이버에서 저장된 쿠키로 로그인한다.
+        (PageSession.crash, "driver_crash", True),
+        # 로그인이 만료되면 쿠키도 무효이므로 로그인 폼부터 진행한다.
+        (PageSession.expire, "session_expired", False),
+    ],
+)
+async def test_dead_session_is_replaced_by_relogin(fail, kind, reuse_cookies):
+    session = PageSession(STUDENTS)
+    session.failures = {3: [lambda: fail(session)]}
+
+    count, logs = await crawl(session, 5)
+
+    assert count == 5
+    assert session.logins == [reuse_cookies]
+    assert session.repositions == [(3, True)]
+    assert session.reads == [0, 1, 2, 3, 4]
+    assert session.metrics.failures == {kind: 1}
+    assert any(f"세션 복구({kind})" in message for _, _, _, message in logs)
+    assert SnapshotStore(5).load()["rows"] == STUDENTS
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("index", [1, 4])
+async def test_sweep_recollects_students_that_exhausted_retries(index):
+    session = PageSession(STUDENTS)
+    session.failures = {index: [StaleElementReferenceException("stale element")] * session.retry.max_attempts}
+
+    count, logs = await crawl(session, 5)
+
+    assert count == 5
+    # 본 순회에서 건너뛴 학생은 마지막에 새로고침 후 다시 찾아가 수집한다.
+    assert session.reads == [i for i in range(5) if i != index] + [index]
+    assert session.repositions[-1] == (index, True)
+    assert names(session) == [f"학생{i}" for i in range(5)]
+    assert any(step == "sweep" and "모두 재수집" in message for _, step, _, message in logs)
+    assert SnapshotStore(5).load()["rows"] == STUDENTS
+
+
+@pytest.mark.anyio
+async def test_student_failing_in_sweep_is_reported_and_snapshot_not_saved():
+    session = PageSession(STUDENTS)
+    session.failures = {2: [TimeoutException("'name' 단계 대기 시간 초과")] * (2 * session.retry.max_attempts)}
+
+    count, logs = await crawl(session, 5)
+
+    assert count == 4
+    assert names(session) == ["학생0", "학생1", "학생3", "학생4"]
+    assert any(level == "error" and "재수집 후에도 실패한 항목 1개: 3" in message for level, _, _, message in logs)
+    assert SnapshotStore(5).load() is None
+
+
+@pytest.mark.anyio
+async def test_sweep_disabled_leaves_failed_students_missing():
+    session = PageSession(STUDENTS)
+    session.retry.sweep = False
+    session.failures = {1: [StaleElementReferenceException("stale element")] * session.retry.max_attempts}
+
+    count, _ = await crawl(session, 5)
+
+    assert count == 4
+    assert session.reads == [0, 2, 3, 4]
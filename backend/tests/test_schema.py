@@ -0,0 +1,99 @@
+import httpx
+import pytest
+
+from app import main
+from app.schema import ExtractionSchema
+
+NAME = {"name": "수강자 이름", "selector": "//h2", "scope": "page"}
+
+
+def schema(*fields):
+    return ExtractionSchema([NAME, *fields])
+
+
+def test_fields_are_compiled_with_post_processors():
+    compiled = schema(
+        {"name": "점수", "selector": ".score", "post": ["collapse", "int"]},
+        {"name": "학번", "selector": ".id", "post": "regex:ID-(\\d+)", "tag": "student_id"},
+    )
+
+    score, student_id = compiled.by_scope["modal"]
+    assert score.kind == "css" and compiled.by_scope["page"][0].kind == "xpath"
+    assert compiled.process("modal", {"점수": " 1,234 점 ", "학번": "ID-0042"}) == ({"점수": 1234, "학번": "0042"}, [])
+    assert compiled.xml_tags == {"수강자 이름": "수강자_이름", "점수": "점수", "학번": "student_id"}
+
+
+def test_generated_xml_tags_are_valid_names():
+    compiled = schema({"name": "1차 점수", "selector": ".a"}, {"name": "XML 원문", "selector": ".b"}, {"name": "%", "selector": ".c"})
+
+    assert list(compiled.xml_tags.values()) == ["수강자_이름", "field_1차_점수", "field_XML_원문", "field"]
+
+
+@pytest.mark.parametrize(
+    "field, message",
+    [
+        ({"name": "점수", "selector": ".a", "post": "regex:("}, "잘못된 정규식"),
+        ({"name": "점수", "selector": ".a", "post": "upper"}, "알 수 없는 후처리기"),
+        ({"name": "점수", "selector": ".a", "post": [1]}, "post는 문자열"),
+        ({"name": "점수", "selector": ".a", "post": {"regex": "a"}}, "post는 문자열"),
+        ({"name": "점수", "selector": ["//a"]}, "selector는 문자열"),
+        ({"name": "점수", "selector": 3}, "selector는 문자열"),
+        ({"name": 3, "selector": ".a"}, "name는 문자열"),
+        ({"name": "점수", "selector": ".a", "by": ["css"]}, "by는 문자열"),
+        ({"name": "점수", "selector": ".a", "by": "id"}, "by는 xpath 또는 css"),
+        ({"name": "점수", "selector": ".a", "api_keys": 3}, "api_keys는 문자열"),
+        ({"name": "점수", "selector": ".a", "tag": "1score"}, "tag는 XML 요소 이름"),
+        ({"name": "점수", "selector": ".a", "tag": "a b"}, "tag는 XML 요소 이름"),
+        ({"name": "점수", "selector": ".a", "tag": "xmlScore"}, "tag는 XML 요소 이름"),
+        ({"name": "점수", "selector": ".a", "tag": "<x>"}, "tag는 XML 요소 이름"),
+        ({"name": "점수"}, "name과 selector"),
+        ("점수", "name과 selector"),
+    ],
+)
+def test_invalid_field_raises_value_error(field, message):
+    with pytest.raises(ValueError, match=message):
+        schema(field)
+
+
+@pytest.mark.parametrize(
+    "spec, message",
+    [
+        ([], "필드가 없습니다"),
+        ([NAME, NAME], "중복"),
+        ([{"name": "링크", "selector": ".a"}], "page 범위 필드"),
+        ([NAME, {"name": "링크", "selector": ".a", "key": True}], "key 필드는 page"),
+        ([{**NAME, "scope": "footer"}], "scope는 page 또는 modal"),
+    ],
+)
+def test_invalid_schema_raises_value_error(spec, message):
+    with pytest.raises(ValueError, match=message):
+        ExtractionSchema(spec)
+
+
+def test_schema_from_environment(monkeypatch, tmp_path):
+    monkeypatch.setenv("EXTRACTION_SCHEMA", '{"fields": [{"name": "이름", "selector": "//h2", "scope": "page"}]}')
+    assert ExtractionSchema.load(default=[NAME]).key == "이름"
+
+    path = tmp_path / "schema.json"
+    path.write_text('[{"name": "이름", "selector": "//h2", "scope": "page", "post": "regex:["}]', encoding="utf-8")
+    monkeypatch.setenv("EXTRACTION_SCHEMA", str(path))
+    with pytest.raises(ValueError, match="잘못된 정규식"):
+        ExtractionSchema.load(default=[NAME])
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "field",
+    [
+        {"name": "점수", "selector": ".a", "post": "regex:(?P<"},
+        {"name": "점수", "selector": 1},
+        {"name": "점수", "selector": ".a", "tag": "1score"},
+    ],
+)
+async def test_crawl_request_with_invalid_schema_is_rejected(field):
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post("/api/crawl", json={"exam_id": "11", "schema": [NAME, field]})
+
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("잘못된 추출 스키마")
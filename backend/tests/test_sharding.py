@@ -0,0 +1,146 @@
+import asyncio
+import os
+import shutil
+
+import pytest
+
+from app import crawler as crawler_module
+from app.checkpoint import CheckpointStore
+from app.crawler import FastCampusLMSCrawler
+from benchmarks.fake_lms import FakeLMS
+
+# 실제 브라우저로 가짜 LMS를 수집하는 테스트는 로컬 Chrome과 chromedriver가 있을 때만 실행한다.
+HAS_CHROME = bool(
+    (os.getenv("CHROMEDRIVER_PATH") or shutil.which("chromedriver"))
+    and (
+        os.getenv("CHROME_BINARY")
+        or any(shutil.which(name) for name in ("google-chrome", "chromium", "chromium-browser"))
+    )
+)
+
+
+class FakeDriver:
+    current_url = "http://lms.test/exams/1/detail"
+
+    def get(self, url):
+        self.current_url = url
+
+    def quit(self):
+        pass
+
+
+class FakeSession(FastCampusLMSCrawler):
+    """브라우저 대신 인덱스로 행을 만들어 내는 세션. 뒤쪽 샤드가 먼저 끝나도록 앞 인덱스일수록 늦게 수집한다."""
+
+    def __init__(self, total):
+        super().__init__()
+        self.driver = FakeDriver()
+        self.total = total
+        self.seeks = []
+        self.ranges = []
+        self.indices = []
+
+    def _wait_text(self, xpath, condition=None, wait=None):
+        return f"1 / {self.total}"
+
+    def _seek_to(self, index):
+        self.seeks.append(index)
+        self._position = index
+        return True
+
+    async def _collect_range(self, start_index, end_index, *args):
+        self.ranges.append((start_index, end_index))
+        return await super()._collect_range(start_index, end_index, *args)
+
+    async def _collect_item(self, i, end_index, total_count, report, collect, fast):
+        await asyncio.sleep(0.002 * (total_count - i))
+        self.indices.append(i)
+        collect({"수강자 이름": f"학생{i}", "블로그 링크": f"https://blog.example.com/{i}"}, i)
+        await report(i, f"이름: 학생{i}", step="name")
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("total, stored", [(10, 0), (10, 3), (2, 0)])
+async def test_shards_cover_range_in_order(total, stored):
+    exam_id = f"90{total}{stored}"
+    if stored:
+        checkpoint = CheckpointStore(exam_id)
+        checkpoint.open(fresh=True)
+        checkpoint.write_meta(total)
+        for i in range(stored):
+            checkpoint.append(i, {"수강자 이름": f"학생{i}", "블로그 링크": f"https://blog.example.com/{i}"})
+        checkpoint.close()
+
+    sessions = [FakeSession(total) for _ in range(3)]
+    main, helpers = sessions[0], sessions[1:]
+    progress = []
+
+    async def progress_callback(value, description):
+        progress.append((value, description))
+
+    async def log_callback(message, level="info", step=None, index=None):
+        pass
+
+    try:
+        count = await main.crawl_exam_data_async(
+            exam_id, progress_callback, log_callback, resume=bool(stored), helpers=helpers, fast_path=False
+        )
+    finally:
+        for session in sessions:
+            session.close()
+
+    # 구간은 [stored, total)을 빈틈·겹침 없이 나누고, 각 세션은 자기 구간 시작점으로 한 번 이동해 그 구간만 수집한다.
+    ranges = sorted(session.ranges[0] for session in sessions if session.ranges)
+    assert all(len(session.ranges) <= 1 for session in sessions)
+    assert ranges[0][0] == stored and ranges[-1][1] == total
+    assert all(end == next_start for (_, end), (next_start, _) in zip(ranges, ranges[1:]))
+    for session in sessions:
+        if session.ranges:
+            start, end = session.ranges[0]
+            assert session.seeks == [start]
+            assert session.indices == list(range(start, end))
+
+    # 샤드가 끝나는 순서와 관계없이 결과는 원래 순서로 합쳐진다.
+    assert count == total
+    assert [row["수강자 이름"] for row in main.collected_data] == [f"학생{i}" for i in range(total)]
+
+    shard_progress = [value for value, description in progress if description.startswith("[샤드")]
+    assert shard_progress
+    assert all(0.4 <= value <= 0.9 for value in shard_progress)
+
+
+@pytest.fixture
+def fake_lms(monkeypatch):
+    lms = FakeLMS().start()
+    monkeypatch.setattr(crawler_module, "LMS_BASE_URL", lms.base_url)
+    monkeypatch.setenv("FASTCAMPUS_EMAIL", "test@example.com")
+    monkeypatch.setenv("FASTCAMPUS_PASSWORD", "test")
+    yield lms
+    lms.stop()
+
+
+@pytest.mark.skipif(not HAS_CHROME, reason="Chrome/chromedriver가 없습니다")
+@pytest.mark.anyio
+async def test_sharded_crawl_against_fake_lms(fake_lms):
+    # 가짜 LMS는 시험 ID만큼 학생을 만든다. 세션 3개가 11명을 4/4/3으로 나눠 수집한다.
+    sessions = [FastCampusLMSCrawler() for _ in range(3)]
+    logs = []
+
+    async def progress_callback(progress, description):
+        pass
+
+    async def log_callback(message, level="info", step=None, index=None):
+        logs.append((level, message))
+
+    try:
+        for session in sessions:
+            await session.login_process_async()
+        main, helpers = sessions[0], sessions[1:]
+        count = await main.crawl_exam_data_async("11", progress_callback, log_callback, helpers=helpers)
+    finally:
+        for session in sessions:
+            await session.run_blocking(session.close)
+
+    assert count == 11
+    assert [row["수강자 이름"] for row in main.collected_data] == [f"학생{i + 1:04d}" for i in range(11)]
+    assert not [message for level, message in logs if level == "error"]
@@ -36,23 +36,31 @@ export default function Page() {
         const data = JSON.parse(ev.data);
         // 백엔드에서 첫 응답이 도착하면 대기 오버레이 즉시 해제
         setConnecting(false);
-        if (data.type === "log") {
-          setLogs((prev) => [...prev, data.message]);
-        } else if (data.type === "progress") {
-          setProgress(Math.round((data.progress ?? 0) * 100));
-        } else if (data.type === "complete") {
-          setIsRunning(false);
-          setDownloadPath(data.file_path);
-          setShowCompleteOverlay(true);
-          setTimeout(() => setShowCompleteOverlay(false), 1800);
-        } else if (data.type === "error") {
-          setIsRunning(false);
-          setLogs((prev) => [...prev, `ERROR: ${data.message}`]);
+        // 서버는 짧은 구간의 이벤트를 batch 프레임 하나로 묶어 보낸다.
+        const events = data.type === "batch" ? data.events : [data];
+        const logLines = events.filter((e: any) => e.type === "log").map((e: any) => e.message);
+        if (logLines.length) {
+          setLogs((prev) => [...prev, ...logLines]);
         }
+        events.forEach(handleEvent);
       } catch (e) {
         // ignore non-json
       }
     };
+    const handleEvent = (data: any) => {
+      if (data.type === "progress") {
+        setProgress(Math.round((data.progress ?? 0) * 100));
+      } else if (data.type === "complete") {
+        setIsRunning(false);
+        // 다운로드 API는 결과 디렉터리 안의 파일 이름만 받는다.
+        setDownloadPath(data.file_path ? data.file_path.split(/[\\/]/).pop() : null);
+        setShowCompleteOverlay(true);
+        setTimeout(() => setShowCompleteOverlay(false), 1800);
+      } else if (data.type === "error") {
+        setIsRunning(false);
+        setLogs((prev) => [...prev, `ERROR: ${data.message}`]);
+      }
+    };
     ws.onopen = () => setConnecting(false);
     ws.onerror = () => setConnecting(false);
     ws.onclose = () => setConnecting(false);